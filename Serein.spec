@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['eth_account.hdaccount', 'solana', 'base58', 'solders', 'nacl'],
+    hiddenimports=['nacl.bindings', 'mnemonic', 'eth_keys', 'eth_account', 'coincurve'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
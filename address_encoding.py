@@ -0,0 +1,105 @@
+"""地址编码阶段：批量 Keccak-256 / EIP-55（EVM）与 Base58（Solana）编码。"""
+
+from functools import lru_cache
+from typing import Callable, Iterable, List, Sequence
+
+# Base58（比特币字母表）
+B58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+_B58_INDEX = {c: i for i, c in enumerate(B58_ALPHABET)}
+# 两位一组的查表（58^2 项），把小整数转字符的次数减半
+_B58_PAIRS = [a + b for a in B58_ALPHABET for b in B58_ALPHABET]
+# 大整数每次按 58^10 切分（小于 2^63），将逐位大整数除法减少为原来的 1/10
+_B58_LIMB_DIGITS = 10
+_B58_LIMB = 58**_B58_LIMB_DIGITS
+
+
+@lru_cache(maxsize=1)
+def _load_keccak256() -> Callable[[bytes], bytes]:
+    """按速度优先级选择 Keccak-256 实现（首次调用时导入），直接绑定底层函数以减少逐次分派开销。"""
+    try:
+        from sha3 import keccak_256  # pysha3
+
+        return lambda data: keccak_256(data).digest()
+    except ImportError:
+        pass
+    try:
+        from Crypto.Hash import keccak  # pycryptodome，eth-hash 的常见后端
+
+        new = keccak.new
+        return lambda data: new(digest_bits=256, data=data).digest()
+    except ImportError:
+        pass
+    from eth_hash.auto import keccak as eth_keccak
+
+    return eth_keccak
+
+
+def keccak256(data: bytes) -> bytes:
+    """Keccak-256 摘要（以太坊使用的原始 Keccak，非 NIST SHA3-256）。"""
+    return _load_keccak256()(data)
+
+
+def to_checksum_addresses(address_bytes: Sequence[bytes]) -> List[str]:
+    """批量将 20 字节地址转换为 EIP-55 校验格式（0x 开头，大小写编码校验位）。"""
+    keccak = _load_keccak256()
+    addresses = []
+    for raw in address_bytes:
+        hex_addr = raw.hex()
+        digest = keccak(hex_addr.encode("ascii")).hex()
+        # 哈希对应半字节 >= 8 时大写；十六进制字符中 "8"-"f" 均大于 "7"
+        addresses.append("0x" + "".join(c.upper() if h > "7" else c for c, h in zip(hex_addr, digest)))
+    return addresses
+
+
+def to_checksum_address(address: str) -> str:
+    """将任意大小写的十六进制地址转换为 EIP-55 校验格式。"""
+    hex_addr = address[2:] if address[:2].lower() == "0x" else address
+    if len(hex_addr) != 40:
+        raise ValueError(f"EVM 地址长度不正确: {address}")
+    return to_checksum_addresses([bytes.fromhex(hex_addr)])[0]
+
+
+def encode_evm_addresses(public_keys: Sequence[bytes]) -> List[str]:
+    """
+    批量将 64 字节非压缩公钥（不含 0x04 前缀）编码为 EIP-55 校验地址。
+
+    地址为 Keccak-256(公钥) 的后 20 字节，全程不构造 Account 等中间对象。
+    """
+    keccak = _load_keccak256()
+    return to_checksum_addresses([keccak(pub)[-20:] for pub in public_keys])
+
+
+def b58encode(data: bytes) -> str:
+    """
+    Base58 编码，结果与 base58.b58encode 一致。
+
+    纯 Python 的逐位 divmod(58) 对大整数是二次复杂度；这里先按 58^10 分块做大整数除法，
+    块内再用小整数查表，显著减少大整数运算次数。
+    """
+    stripped = data.lstrip(b"\0")
+    num = int.from_bytes(stripped, "big")
+    parts = []
+    while num:
+        num, limb = divmod(num, _B58_LIMB)
+        for _ in range(_B58_LIMB_DIGITS // 2):
+            limb, pair = divmod(limb, 3364)
+            parts.append(_B58_PAIRS[pair])
+    # 最高块的前导 "1" 来自补位，需去除后再按前导零字节补回
+    return "1" * (len(data) - len(stripped)) + "".join(reversed(parts)).lstrip("1")
+
+
+def b58encode_batch(items: Iterable[bytes]) -> List[str]:
+    """批量 Base58 编码。"""
+    return [b58encode(item) for item in items]
+
+
+def b58decode(text: str) -> bytes:
+    """Base58 解码，非法字符抛出 ValueError。"""
+    num = 0
+    try:
+        for c in text:
+            num = num * 58 + _B58_INDEX[c]
+    except KeyError as exc:
+        raise ValueError(f"非法的 Base58 字符: {exc.args[0]!r}") from None
+    body = num.to_bytes((num.bit_length() + 7) // 8, "big") if num else b""
+    return b"\0" * (len(text) - len(text.lstrip("1"))) + body
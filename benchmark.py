@@ -0,0 +1,341 @@
+"""
+生成流水线基准测试：分阶段计时（助记词、PBKDF2、BIP32/SLIP-10 派生、地址编码、连续私钥扫描、靓号搜索、导出）、
+EVM / Solana 在不同批量下的端到端 generate_wallets 吞吐，以及主要模块的冷启动导入耗时。
+
+结果可输出为 JSON，并与保存的基线对比，吞吐下降超过阈值时以非零退出码结束：
+
+    python benchmark.py --json bench.json
+    python benchmark.py --baseline bench.json --threshold 0.1
+"""
+
+import argparse
+import json
+import os
+import platform
+import secrets
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional, Sequence
+
+from address_encoding import b58encode_batch, encode_evm_addresses
+from binary_store import BinaryStreamWriter
+from config import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_WORKER_COUNT,
+    DERIVATION_PATH_TEMPLATE_EVM,
+    DERIVATION_PATH_TEMPLATE_SOL,
+    PRESET_NETWORKS,
+    ChainType,
+    NetworkConfig,
+)
+from exporters import CsvStreamWriter
+from key_scan import scan_public_keys
+from vanity import EvmVanityPattern, SolanaVanityPattern, _search_batch
+from wallet_service import (
+    SECP256K1_BACKENDS,
+    SECP256K1_N,
+    _derive_account_node,
+    _derive_leaf_key,
+    _generate_mnemonic,
+    _generated_mnemonic_to_seed,
+    generate_wallets,
+    get_secp256k1_backend,
+    set_secp256k1_backend,
+    solana_accounts_from_seeds,
+)
+
+# 单个阶段的默认条目数与端到端测试的默认批量
+DEFAULT_STAGE_SIZE = 500
+DEFAULT_E2E_SIZES = (100, 1000)
+DEFAULT_REPEAT = 3
+# 与基线相比吞吐下降超过该比例视为退化
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# 冷启动导入耗时预算（秒）：在全新解释器中测量，超出视为退化。链后端均应延迟到首次使用时加载
+IMPORT_TIME_BUDGETS = {"wallet_service": 0.25, "cli": 0.3, "ui_main_window": 0.6}
+
+# 基准工厂：接受条目数，完成准备工作后返回只包含被测代码的无参函数
+BenchFactory = Callable[[int], Callable[[], object]]
+STAGE_BENCHMARKS: Dict[str, BenchFactory] = {}
+
+
+def stage_benchmark(name: str) -> Callable[[BenchFactory], BenchFactory]:
+    """注册一个阶段基准（其他模块也可借此加入新的吞吐测试）。"""
+
+    def register(factory: BenchFactory) -> BenchFactory:
+        STAGE_BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+@dataclass
+class BenchResult:
+    """单项基准结果：取多次重复中的最短耗时。"""
+
+    name: str
+    items: int
+    seconds: float
+    rate: float  # 每秒处理条目数
+
+
+def _seeds(n: int) -> List[bytes]:
+    return [os.urandom(64) for _ in range(n)]
+
+
+def _keys(n: int) -> List[bytes]:
+    return [os.urandom(32) for _ in range(n)]
+
+
+@stage_benchmark("mnemonic.entropy_to_words")
+def _bench_mnemonic(n: int) -> Callable[[], object]:
+    return lambda: [_generate_mnemonic(12) for _ in range(n)]
+
+
+@stage_benchmark("seed.pbkdf2")
+def _bench_pbkdf2(n: int) -> Callable[[], object]:
+    mnemonics = [_generate_mnemonic(12) for _ in range(n)]
+    return lambda: [_generated_mnemonic_to_seed(m) for m in mnemonics]
+
+
+@stage_benchmark("derive.bip32_evm")
+def _bench_bip32(n: int) -> Callable[[], object]:
+    seeds = _seeds(n)
+
+    def run() -> None:
+        for seed in seeds:
+            _derive_leaf_key(_derive_account_node(seed, ChainType.EVM, DERIVATION_PATH_TEMPLATE_EVM), 0)
+
+    return run
+
+
+@stage_benchmark("derive.slip10_solana")
+def _bench_slip10(n: int) -> Callable[[], object]:
+    seeds = _seeds(n)
+
+    def run() -> None:
+        for seed in seeds:
+            _derive_leaf_key(_derive_account_node(seed, ChainType.SOLANA, DERIVATION_PATH_TEMPLATE_SOL), 0)
+
+    return run
+
+
+@stage_benchmark("encode.secp256k1_pubkey")
+def _bench_pubkey(n: int) -> Callable[[], object]:
+    keys = _keys(n)
+    backend = get_secp256k1_backend()
+    return lambda: backend.uncompressed_public_keys(keys)
+
+
+@stage_benchmark("encode.secp256k1_scan")
+def _bench_pubkey_scan(n: int) -> Callable[[], object]:
+    start = secrets.randbelow(SECP256K1_N - n) + 1
+    scan_public_keys(start, n)  # 预先建好 1·G … n·G 表，只计稳态
+    return lambda: scan_public_keys(start, n)
+
+
+@stage_benchmark("encode.evm_address")
+def _bench_evm_address(n: int) -> Callable[[], object]:
+    public_keys = get_secp256k1_backend().uncompressed_public_keys(_keys(n))
+    return lambda: encode_evm_addresses(public_keys)
+
+
+@stage_benchmark("encode.solana_keypair")
+def _bench_solana_keypair(n: int) -> Callable[[], object]:
+    seeds = _keys(n)
+    return lambda: solana_accounts_from_seeds(seeds)
+
+
+# 靓号条件取足够难的值，测得的是不含命中处理的纯搜索吞吐
+@stage_benchmark("vanity.evm")
+def _bench_vanity_evm(n: int) -> Callable[[], object]:
+    pattern = EvmVanityPattern("ffffffffff")
+    _search_batch(pattern, DERIVATION_PATH_TEMPLATE_EVM, n, False)
+    return lambda: _search_batch(pattern, DERIVATION_PATH_TEMPLATE_EVM, n, False)
+
+
+@stage_benchmark("vanity.solana")
+def _bench_vanity_solana(n: int) -> Callable[[], object]:
+    pattern = SolanaVanityPattern("zzzzzz", case_sensitive=True)
+    return lambda: _search_batch(pattern, DERIVATION_PATH_TEMPLATE_SOL, n, False)
+
+
+@stage_benchmark("encode.base58")
+def _bench_base58(n: int) -> Callable[[], object]:
+    items = _keys(n)
+    return lambda: b58encode_batch(items)
+
+
+def _export_bench(writer_cls, suffix: str, n: int) -> Callable[[], object]:
+    records = generate_wallets(min(n, DEFAULT_CHUNK_SIZE), PRESET_NETWORKS[0])
+    records = (records * (n // len(records) + 1))[:n]
+    path = os.path.join(tempfile.gettempdir(), f"serein-bench-{os.getpid()}{suffix}")
+
+    def run() -> None:
+        with writer_cls(path) as writer:
+            writer.write_batch(records)
+        os.remove(path)
+
+    return run
+
+
+@stage_benchmark("export.csv")
+def _bench_export_csv(n: int) -> Callable[[], object]:
+    return _export_bench(CsvStreamWriter, ".csv", n)
+
+
+@stage_benchmark("export.srw")
+def _bench_export_srw(n: int) -> Callable[[], object]:
+    return _export_bench(BinaryStreamWriter, ".srw", n)
+
+
+def _time_best(run: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure_import_time(module: str, repeat: int = DEFAULT_REPEAT) -> Optional[float]:
+    """在全新解释器中测量导入模块的耗时（取最短），模块依赖缺失时返回 None。"""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    cwd = os.path.dirname(os.path.abspath(__file__))
+    best: Optional[float] = None
+    for _ in range(max(repeat, 1)):
+        proc = subprocess.run([sys.executable, "-c", code], cwd=cwd, capture_output=True, text=True)
+        if proc.returncode != 0:
+            return None
+        seconds = float(proc.stdout.strip().splitlines()[-1])
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def run_benchmarks(
+    stage_size: int = DEFAULT_STAGE_SIZE,
+    e2e_sizes: Sequence[int] = DEFAULT_E2E_SIZES,
+    repeat: int = DEFAULT_REPEAT,
+    workers: int = DEFAULT_WORKER_COUNT,
+    name_filter: Optional[str] = None,
+    report: Optional[Callable[[BenchResult], None]] = None,
+) -> List[BenchResult]:
+    """依次运行导入耗时、阶段基准与端到端基准，返回结果列表；name_filter 为名称子串过滤。"""
+    results: List[BenchResult] = []
+
+    def _record(name: str, items: int, seconds: float) -> None:
+        result = BenchResult(name, items, seconds, items / seconds if seconds > 0 else 0.0)
+        results.append(result)
+        if report:
+            report(result)
+
+    for module in IMPORT_TIME_BUDGETS:
+        name = f"import.{module}"
+        if name_filter and name_filter not in name:
+            continue
+        seconds = measure_import_time(module, repeat)
+        if seconds is not None:
+            _record(name, 1, seconds)
+
+    for name, factory in STAGE_BENCHMARKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        _record(name, stage_size, _time_best(factory(stage_size), repeat))
+
+    networks: Dict[str, NetworkConfig] = {
+        "evm": PRESET_NETWORKS[0],
+        "solana": next(net for net in PRESET_NETWORKS if net.chain_type == ChainType.SOLANA),
+    }
+    for label, network in networks.items():
+        for size in e2e_sizes:
+            name = f"e2e.{label}.{size}"
+            if name_filter and name_filter not in name:
+                continue
+            seconds = _time_best(lambda: generate_wallets(size, network, workers=workers), repeat)
+            _record(name, size, seconds)
+    return results
+
+
+def environment_info() -> Dict[str, object]:
+    """记录运行环境，便于判断基线是否可比。"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "secp256k1_backend": get_secp256k1_backend().name,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare_with_baseline(
+    results: List[BenchResult], baseline: Dict[str, Dict[str, float]], threshold: float
+) -> List[str]:
+    """与基线逐项比较吞吐，返回退化项的说明（基线中不存在的项跳过）。"""
+    regressions = []
+    for result in results:
+        base = baseline.get(result.name)
+        if not base or not base.get("rate"):
+            continue
+        change = result.rate / base["rate"] - 1
+        print(f"  {result.name:<28} {base['rate']:>12,.1f} -> {result.rate:>12,.1f} /s  {change:+7.1%}")
+        if change < -threshold:
+            regressions.append(f"{result.name}: 吞吐下降 {-change:.1%}")
+    return regressions
+
+
+def check_import_budgets(results: List[BenchResult]) -> List[str]:
+    """检查导入耗时是否超出 IMPORT_TIME_BUDGETS，返回超标项的说明。"""
+    violations = []
+    for result in results:
+        module = result.name[len("import.") :] if result.name.startswith("import.") else None
+        budget = IMPORT_TIME_BUDGETS.get(module or "")
+        if budget is not None and result.seconds > budget:
+            violations.append(f"{result.name}: 导入耗时 {result.seconds * 1000:.0f} ms，超出预算 {budget * 1000:.0f} ms")
+    return violations
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serein 生成流水线基准测试")
+    parser.add_argument("--stage-size", type=int, default=DEFAULT_STAGE_SIZE, help="每个阶段基准的条目数")
+    parser.add_argument(
+        "--e2e-sizes", type=int, nargs="*", default=list(DEFAULT_E2E_SIZES), help="端到端 generate_wallets 的批量"
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="重复次数，取最短耗时")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKER_COUNT, help="端到端测试的工作进程数")
+    parser.add_argument("-k", "--filter", help="只运行名称包含该子串的基准")
+    parser.add_argument("--backend", choices=sorted(SECP256K1_BACKENDS), help="指定 secp256k1 后端")
+    parser.add_argument("--json", help="将结果写入 JSON 文件")
+    parser.add_argument("--baseline", help="与之对比的基线 JSON 文件")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="判定退化的吞吐下降比例")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        set_secp256k1_backend(args.backend)
+
+    def _report(result: BenchResult) -> None:
+        print(f"{result.name:<28} {result.items:>8} 条  {result.seconds * 1000:>10.2f} ms  {result.rate:>12,.1f} /s")
+
+    results = run_benchmarks(args.stage_size, args.e2e_sizes, args.repeat, args.workers, args.filter, _report)
+    payload = {"environment": environment_info(), "results": {r.name: asdict(r) for r in results}}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, indent=2)
+
+    regressions = check_import_budgets(results)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"与基线对比（{baseline.get('environment', {}).get('timestamp', '未知时间')}）：")
+        regressions += compare_with_baseline(results, baseline.get("results", {}), args.threshold)
+    if regressions:
+        print("检测到性能退化：\n  " + "\n  ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
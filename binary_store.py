@@ -0,0 +1,390 @@
+"""
+Serein 二进制钱包文件（.srw）：带版本号的定宽记录容器，可内存映射随机访问。
+
+文件布局（小端序）：
+- 文件头（64 字节）：魔数、版本、记录长度、记录数、档案表与地址索引的偏移；
+- 记录区：每条记录定长 RECORD_SIZE 字节，第 n 行位于 HEADER_SIZE + n * RECORD_SIZE；
+- 档案表：JSON 数组，每项为 [链类型, 网络, 路径前缀, 路径后缀]，记录中只存档案编号；
+- 地址索引（可选）：按地址前 4 字节排序的 u64 数组，每项 = 前缀 << 32 | 行号，用于二分查找地址。
+"""
+
+import heapq
+import json
+import mmap
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from config import BINARY_FILE_SUFFIX, BINARY_INDEX_MAX_ROWS, BINARY_INDEX_RUN_ROWS
+from exporters import AtomicFileWriter
+from models import (
+    SLOT_BYTES,
+    WalletProfile,
+    WalletRecord,
+    decode_address,
+    decode_mnemonic,
+    decode_private_key,
+    encode_address_key,
+    encode_mnemonic,
+    join_derivation_path,
+    parse_address,
+    split_wallet_profile,
+)
+from wallet_service import GenerationControl
+
+MAGIC = b"SEREINWB"
+FORMAT_VERSION = 1
+
+# 魔数、版本、记录长度、保留、记录数、档案表偏移、档案表长度、索引偏移、索引项数
+_HEADER = struct.Struct("<8sHHIQQQQQ8x")
+HEADER_SIZE = _HEADER.size
+
+# 钱包序号、路径序号、档案编号、助记词词数、（填充）、地址、密钥、24 个词索引
+MAX_MNEMONIC_WORDS = 24
+_RECORD = struct.Struct(f"<IIHBx{SLOT_BYTES}s{SLOT_BYTES}s{MAX_MNEMONIC_WORDS * 2}s")
+RECORD_SIZE = _RECORD.size
+
+# 各字段在记录内的偏移，读取单个字段时直接切片，无需解包整条记录
+_ADDRESS_OFFSET = 12
+_KEY_OFFSET = _ADDRESS_OFFSET + SLOT_BYTES
+_WORDS_OFFSET = _KEY_OFFSET + SLOT_BYTES
+
+# 地址索引项 = 地址前 4 字节（大端，保证按字节序排序）<< 32 | 行号
+_INDEX_PREFIX_BYTES = 4
+_ROW_MASK = 0xFFFFFFFF
+
+# 归并索引时每段每次读入、以及每次写出的索引项数
+_INDEX_IO_ENTRIES = 1 << 16
+
+
+# 词索引与地址索引以 array 整体读写，大端主机上需要换成小端序
+_BIG_ENDIAN_HOST = sys.byteorder == "big"
+
+
+def _le_array(typecode: str, data: Iterable[int]) -> array:
+    """由整数或（小端序）字节构造 array，大端主机上交换字节序，使 tobytes / 读取结果与文件一致。"""
+    values = array(typecode, data)
+    if _BIG_ENDIAN_HOST:
+        values.byteswap()
+    return values
+
+
+def _address_prefix(address: bytes) -> int:
+    return int.from_bytes(address[:_INDEX_PREFIX_BYTES], "big")
+
+
+def is_binary_path(path: Union[str, Path]) -> bool:
+    """按扩展名判断是否为二进制钱包文件。"""
+    return Path(path).suffix.lower() == BINARY_FILE_SUFFIX
+
+
+def estimate_binary_bytes(count: int) -> int:
+    """估算写入 count 条记录所需的磁盘空间（字节，含地址索引）。"""
+    return HEADER_SIZE + count * (RECORD_SIZE + 8)
+
+
+class BinaryStreamWriter(AtomicFileWriter):
+    """
+    流式二进制写入器，接口与 CsvStreamWriter 一致（write_batch / commit / abort）。
+
+    记录按批追加；档案表、地址索引与最终文件头在 commit 时写入。地址索引每满 BINARY_INDEX_RUN_ROWS 行
+    排序后写入临时文件，commit 时用 heapq.merge 分块归并，内存占用与总行数无关；
+    超过 BINARY_INDEX_MAX_ROWS 行时放弃建索引，按地址查找退化为顺序扫描。
+    """
+
+    def __init__(self, path: Union[str, Path], build_index: bool = True) -> None:
+        super().__init__(path, "wb")
+        self.file.write(b"\0" * HEADER_SIZE)
+        self.rows_written = 0
+        self._profiles: List[WalletProfile] = []
+        self._profile_ids: Dict[WalletProfile, int] = {}
+        self._index: Optional[array] = array("Q") if build_index else None
+        # 已排序的索引段：(临时文件内偏移, 项数)
+        self._runs: List[Tuple[int, int]] = []
+        self._spill: Optional[IO[bytes]] = None
+
+    def write_batch(self, records: Iterable[WalletRecord]) -> int:
+        """写入一批记录，返回本批行数。"""
+        chunks = []
+        for w in records:
+            profile, path_index = split_wallet_profile(w)
+            profile_id = self._profile_ids.get(profile)
+            if profile_id is None:
+                profile_id = self._profile_ids[profile] = len(self._profiles)
+                self._profiles.append(profile)
+            address, key = encode_address_key(w)
+            words = encode_mnemonic(w.mnemonic)
+            if len(words) > MAX_MNEMONIC_WORDS:
+                raise ValueError(f"助记词词数超过 {MAX_MNEMONIC_WORDS}: 序号 {w.index}")
+            row = self.rows_written + len(chunks)
+            chunks.append(
+                _RECORD.pack(w.index, path_index, profile_id, len(words), address, key, _le_array("H", words).tobytes())
+            )
+            if self._index is not None:
+                self._index.append(_address_prefix(address) << 32 | row)
+        self.file.write(b"".join(chunks))
+        self.rows_written += len(chunks)
+        if self._index is not None and self.rows_written > BINARY_INDEX_MAX_ROWS:
+            self._drop_index()
+        elif self._index is not None and len(self._index) >= BINARY_INDEX_RUN_ROWS:
+            self._spill_run()
+        return len(chunks)
+
+    def _spill_run(self) -> None:
+        """将当前内存中的索引项排序后作为一段追加到临时文件。"""
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".idx")
+        offset = sum(count for _, count in self._runs) * 8
+        self._spill.write(_le_array("Q", sorted(self._index)).tobytes())  # type: ignore[arg-type]
+        self._runs.append((offset, len(self._index)))  # type: ignore[arg-type]
+        self._index = array("Q")
+
+    def _read_run(self, offset: int, count: int) -> Iterator[int]:
+        """分块读回一段已排序的索引项（各段交替读取，每次读前定位）。"""
+        end = offset + count * 8
+        while offset < end:
+            self._spill.seek(offset)  # type: ignore[union-attr]
+            data = self._spill.read(min(_INDEX_IO_ENTRIES * 8, end - offset))  # type: ignore[union-attr]
+            offset += len(data)
+            yield from _le_array("Q", data)
+
+    def _drop_index(self) -> None:
+        """放弃地址索引并删除临时段文件。"""
+        self._index = None
+        self._runs = []
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _write_index(self) -> int:
+        """写出排好序的地址索引，返回项数。"""
+        if not self._runs:
+            entries = _le_array("Q", sorted(self._index))  # type: ignore[arg-type]
+            self.file.write(entries.tobytes())
+            return len(entries)
+        if self._index:
+            self._spill_run()
+        total = 0
+        out = array("Q")
+        for entry in heapq.merge(*(self._read_run(offset, count) for offset, count in self._runs)):
+            out.append(entry)
+            if len(out) >= _INDEX_IO_ENTRIES:
+                self.file.write(_le_array("Q", out).tobytes())
+                total += len(out)
+                out = array("Q")
+        self.file.write(_le_array("Q", out).tobytes())
+        return total + len(out)
+
+    def commit(self) -> None:
+        """写入档案表、地址索引与文件头，然后原子替换目标文件。"""
+        if self._closed:
+            return
+        profiles = json.dumps(self._profiles, ensure_ascii=False).encode("utf-8")
+        profiles_offset = HEADER_SIZE + self.rows_written * RECORD_SIZE
+        self.file.write(profiles)
+        index_offset = profiles_offset + len(profiles)
+        index_count = 0
+        if self._index is not None:
+            index_count = self._write_index()
+            self._drop_index()
+        self.file.seek(0)
+        self.file.write(
+            _HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                RECORD_SIZE,
+                0,
+                self.rows_written,
+                profiles_offset,
+                len(profiles),
+                index_offset,
+                index_count,
+            )
+        )
+        super().commit()
+
+    def abort(self) -> None:
+        """放弃写入，删除临时文件与索引段文件。"""
+        self._drop_index()
+        super().abort()
+
+
+def export_binary(
+    batches: Iterable[Iterable[WalletRecord]],
+    path: Union[str, Path],
+    progress_cb: Optional[Callable[[int], None]] = None,
+    build_index: bool = True,
+    control: Optional[GenerationControl] = None,
+) -> int:
+    """将按批产出的钱包记录流式导出为 .srw 二进制文件，返回写入的行数；control 的用法同 export_csv。"""
+    with BinaryStreamWriter(path, build_index=build_index) as writer:
+        for batch in batches:
+            if control is not None and not control.checkpoint():
+                writer.abort()
+                return 0
+            writer.write_batch(batch)
+            if progress_cb:
+                progress_cb(writer.rows_written)
+    return writer.rows_written
+
+
+class BinaryWalletReader:
+    """
+    .srw 文件的只读视图：整个文件内存映射，按行号 O(1) 定位记录，只解码被访问的字段。
+
+    提供与 WalletStore 相同的 len / 下标 / 迭代 / field / 查找接口，可直接作为表格模型与导出的数据源；
+    部分导出时配合 iter_chunks(reader, start=..., stop=...) 只读取对应行。
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            if self.path.stat().st_size < HEADER_SIZE:
+                raise ValueError("不是有效的 Serein 二进制文件：文件过短")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            (
+                magic,
+                version,
+                record_size,
+                _,
+                self._count,
+                profiles_offset,
+                profiles_length,
+                index_offset,
+                index_count,
+            ) = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC:
+                raise ValueError("不是有效的 Serein 二进制文件：魔数不匹配")
+            if version != FORMAT_VERSION or record_size != RECORD_SIZE:
+                raise ValueError(f"不支持的二进制文件版本: {version}")
+            # 记录区、档案表与地址索引须首尾相接且不超出文件，否则按行读取时才会在深处报错
+            if (
+                HEADER_SIZE + self._count * RECORD_SIZE != profiles_offset
+                or profiles_offset + profiles_length > index_offset
+                or index_offset + index_count * 8 > len(self._mm)
+            ):
+                raise ValueError("二进制文件已损坏：长度与文件头不符")
+            profiles = json.loads(self._mm[profiles_offset : profiles_offset + profiles_length].decode("utf-8"))
+            self._profiles: List[WalletProfile] = [tuple(p) for p in profiles]  # type: ignore[misc]
+            index_end = index_offset + index_count * 8
+            if _BIG_ENDIAN_HOST:
+                # 大端主机无法按本机序直接解释映射内容，改为读入并交换字节序的副本
+                self._index: Union[memoryview, array] = _le_array("Q", self._mm[index_offset:index_end])
+            else:
+                self._index = memoryview(self._mm)[index_offset:index_end].cast("Q")
+        except Exception:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """释放内存映射与文件句柄。"""
+        index = getattr(self, "_index", None)
+        if isinstance(index, memoryview):
+            index.release()
+        self._index = None
+        mm = getattr(self, "_mm", None)
+        if mm is not None:
+            mm.close()
+        self._file.close()
+
+    def __enter__(self) -> "BinaryWalletReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    # ------------------------- 随机访问 ------------------------- #
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, row: int) -> WalletRecord: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> List[WalletRecord]: ...
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[WalletRecord, List[WalletRecord]]:
+        if isinstance(row, slice):
+            return [self._record(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("行号越界")
+        return self._record(row)
+
+    def __iter__(self) -> Iterator[WalletRecord]:
+        for row in range(len(self)):
+            yield self._record(row)
+
+    def field(self, row: int, name: str) -> Union[int, str]:
+        """只解码指定行的单个字段，供表格按单元格取值。"""
+        offset = HEADER_SIZE + row * RECORD_SIZE
+        index, path_index, profile_id, word_count = _RECORD.unpack_from(self._mm, offset)[:4]
+        chain_type, network, prefix, suffix = self._profiles[profile_id]
+        if name == "index":
+            return index
+        if name == "chain_type":
+            return chain_type
+        if name == "network":
+            return network
+        if name == "derivation_path":
+            return join_derivation_path(prefix, path_index, suffix)
+        if name == "mnemonic":
+            start = offset + _WORDS_OFFSET
+            return decode_mnemonic(_le_array("H", self._mm[start : start + word_count * 2]))
+        address = self._mm[offset + _ADDRESS_OFFSET : offset + _KEY_OFFSET]
+        if name == "address":
+            return decode_address(chain_type, address)
+        if name == "private_key":
+            return decode_private_key(chain_type, self._mm[offset + _KEY_OFFSET : offset + _WORDS_OFFSET], address)
+        raise KeyError(name)
+
+    def _record(self, row: int) -> WalletRecord:
+        return WalletRecord(
+            index=self.field(row, "index"),  # type: ignore[arg-type]
+            chain_type=self.field(row, "chain_type"),  # type: ignore[arg-type]
+            network=self.field(row, "network"),  # type: ignore[arg-type]
+            address=self.field(row, "address"),  # type: ignore[arg-type]
+            mnemonic=self.field(row, "mnemonic"),  # type: ignore[arg-type]
+            derivation_path=self.field(row, "derivation_path"),  # type: ignore[arg-type]
+            private_key=self.field(row, "private_key"),  # type: ignore[arg-type]
+        )
+
+    def _address_bytes(self, row: int) -> bytes:
+        offset = HEADER_SIZE + row * RECORD_SIZE + _ADDRESS_OFFSET
+        return self._mm[offset : offset + SLOT_BYTES]
+
+    # ------------------------- 查找 ------------------------- #
+    @property
+    def has_index(self) -> bool:
+        """文件是否带地址索引。"""
+        return len(self._index) > 0 or not self._count
+
+    def find_address(self, address: str) -> Optional[int]:
+        """按地址查找所在行号，未找到返回 None；有索引时为二分查找，否则顺序扫描。"""
+        target = parse_address(address)
+        if not self.has_index:
+            return next((row for row in range(self._count) if self._address_bytes(row) == target), None)
+        key = _address_prefix(target) << 32
+        pos = bisect_left(self._index, key)
+        while pos < len(self._index) and self._index[pos] >> 32 == key >> 32:
+            row = self._index[pos] & _ROW_MASK
+            if self._address_bytes(row) == target:
+                return row
+            pos += 1
+        return None
+
+    def find_wallet_index(self, wallet_index: int) -> Optional[int]:
+        """按钱包序号查找所在行号；序号连续递增时（生成结果的常态）直接计算偏移。"""
+        if not self._count:
+            return None
+        first = self.field(0, "index")
+        row = wallet_index - first  # type: ignore[operator]
+        if 0 <= row < self._count and self.field(row, "index") == wallet_index:
+            return row
+        return next((r for r in range(self._count) if self.field(r, "index") == wallet_index), None)
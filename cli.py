@@ -0,0 +1,302 @@
+"""
+命令行入口：无界面批量生成钱包，适合无图形环境的服务器与定时任务。
+
+只依赖 wallet_service 与导出模块，不导入 PyQt5。用法示例：
+
+    python main.py generate --network Ethereum --count 100000 --output wallets.srw --workers 0
+    python main.py vanity --prefix dead --count 2 --output vanity.csv
+    python main.py networks
+"""
+
+import argparse
+import getpass
+import os
+import sys
+from pathlib import Path
+from typing import List, Optional, Union
+
+from binary_store import BinaryStreamWriter, estimate_binary_bytes
+from config import (
+    BINARY_FILE_SUFFIX,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_WORKER_COUNT,
+    MAX_BULK_WALLET_COUNT,
+    MAX_VANITY_MATCHES,
+    PRESET_NETWORKS,
+    ChainType,
+    GenerationMode,
+    NetworkConfig,
+)
+from exporters import CsvStreamWriter, check_disk_space, estimate_csv_bytes
+from instrumentation import GenerationStats
+from models import display_chain_type
+from progress import ProgressSnapshot, ProgressThrottle, format_duration
+from vanity import VanityProgress, iter_vanity_wallets, make_vanity_pattern
+from wallet_service import (
+    SECP256K1_BACKENDS,
+    GenerationControl,
+    iter_wallet_batches,
+    set_secp256k1_backend,
+    validate_rpc_url,
+)
+
+OUTPUT_FORMATS = ("csv", "srw")
+
+# 命令行进度刷新间隔（秒），终端输出无需界面那样频繁
+CLI_PROGRESS_INTERVAL_SECONDS = 0.5
+
+# 共享助记词不走命令行参数（会留在 shell 历史与 ps 输出中），改由环境变量或标准输入提供
+MNEMONIC_ENV_VAR = "SEREIN_MNEMONIC"
+
+
+def resolve_network(
+    name: str,
+    custom_name: Optional[str] = None,
+    rpc_url: Optional[str] = None,
+    chain_id: Optional[int] = None,
+) -> NetworkConfig:
+    """按名称（不区分大小写）或序号查找预设网络；选择自定义网络时套用自定义参数。"""
+    matches = [net for net in PRESET_NETWORKS if net.name.lower() == name.strip().lower()]
+    if not matches and name.isdigit() and int(name) < len(PRESET_NETWORKS):
+        matches = [PRESET_NETWORKS[int(name)]]
+    if not matches:
+        raise ValueError(f"未知网络: {name}（可用 networks 子命令查看）")
+    net = matches[0]
+    if not net.is_custom:
+        return net
+    if rpc_url and not validate_rpc_url(rpc_url):
+        raise ValueError("RPC URL 格式不正确，请使用 http/https 开头。")
+    return NetworkConfig(
+        name=custom_name or "Custom Network",
+        chain_type=ChainType.EVM,
+        rpc_url=rpc_url or None,
+        chain_id=chain_id,
+        is_custom=True,
+        derivation_path_template=net.derivation_path_template,
+    )
+
+
+def _resolve_format(output: str, fmt: Optional[str]) -> str:
+    """未显式指定格式时按输出文件扩展名推断，默认 CSV。"""
+    if fmt:
+        return fmt
+    return "srw" if Path(output).suffix.lower() == BINARY_FILE_SUFFIX else "csv"
+
+
+def _print_progress(snapshot: ProgressSnapshot) -> None:
+    percent = snapshot.done * 100 / snapshot.total if snapshot.total else 100.0
+    sys.stderr.write(
+        f"\r已生成 {snapshot.done}/{snapshot.total}（{percent:5.1f}%），"
+        f"{snapshot.rate:,.0f} 个/秒，剩余约 {format_duration(snapshot.eta)}  "
+    )
+    sys.stderr.flush()
+
+
+def _print_vanity_progress(progress: VanityProgress) -> None:
+    sys.stderr.write(
+        f"\r已尝试 {progress.attempts:,} 次，{progress.rate:,.0f} 次/秒，"
+        f"已找到 {progress.found}/{progress.target}，下一个 50% 把握约 {format_duration(progress.eta(0.5))}，"
+        f"90% 把握约 {format_duration(progress.eta(0.9))}  "
+    )
+    sys.stderr.flush()
+
+
+def _read_mnemonic(args: argparse.Namespace) -> Optional[str]:
+    """
+    读取共享助记词：--mnemonic-stdin 时从标准输入读取（终端下不回显），否则取环境变量 SEREIN_MNEMONIC。
+
+    两者都没有时返回 None（自动生成）；非共享助记词模式只忽略环境变量，--mnemonic-stdin 视为错误。
+    """
+    if args.mode != GenerationMode.SHARED_MNEMONIC:
+        if args.mnemonic_stdin:
+            raise ValueError("只有 shared_mnemonic 模式可以指定助记词")
+        return None
+    if args.mnemonic_stdin:
+        if sys.stdin.isatty():
+            phrase = getpass.getpass("助记词（输入不回显）：")
+        else:
+            phrase = sys.stdin.readline()
+    else:
+        phrase = os.environ.get(MNEMONIC_ENV_VAR, "")
+    phrase = " ".join(phrase.split())
+    if not phrase and args.mnemonic_stdin:
+        raise ValueError("未读取到助记词")
+    return phrase or None
+
+
+def _open_writer(output: str, fmt: str) -> Union[CsvStreamWriter, BinaryStreamWriter]:
+    return BinaryStreamWriter(output) if fmt == "srw" else CsvStreamWriter(output)
+
+
+def cmd_networks(_: argparse.Namespace) -> int:
+    """列出可用的预设网络。"""
+    for i, net in enumerate(PRESET_NETWORKS):
+        print(f"{i}\t{net.name}\t{display_chain_type(net.chain_type)}")
+    return 0
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    """生成钱包并流式写入文件。"""
+    network = resolve_network(args.network, args.custom_name, args.rpc_url, args.chain_id)
+    fmt = _resolve_format(args.output, args.format)
+    mnemonic = _read_mnemonic(args)
+    if args.backend:
+        set_secp256k1_backend(args.backend)
+    if fmt == "srw":
+        required = estimate_binary_bytes(args.count)
+    else:
+        required = estimate_csv_bytes(args.count, network.chain_type)
+    check_disk_space(args.output, required)
+
+    writer = _open_writer(args.output, fmt)
+    throttle = ProgressThrottle(args.count, _print_progress, interval=CLI_PROGRESS_INTERVAL_SECONDS)
+    control = GenerationControl()
+    stats = GenerationStats() if args.stats else None
+    try:
+        batches = iter_wallet_batches(
+            args.count,
+            network,
+            progress_cb=None if args.quiet else throttle.update,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            mode=args.mode,
+            mnemonic=mnemonic,
+            control=control,
+            max_count=MAX_BULK_WALLET_COUNT,
+            stats=stats,
+        )
+        for batch in batches:
+            if stats is None:
+                writer.write_batch(batch)
+            else:
+                with stats.stage("export", len(batch)):
+                    writer.write_batch(batch)
+        writer.commit()
+    except KeyboardInterrupt:
+        # 中断时丢弃临时文件，目标文件保持原样
+        control.cancel()
+        writer.abort()
+        sys.stderr.write("\n已中断，未写入输出文件\n")
+        return 130
+    except BaseException:
+        writer.abort()
+        raise
+    if not args.quiet:
+        sys.stderr.write("\n")
+    print(f"已生成 {writer.rows_written} 个钱包（{network.name}），写入 {args.output}")
+    if stats is not None:
+        sys.stderr.write(stats.report() + "\n")
+    return 0
+
+
+def cmd_vanity(args: argparse.Namespace) -> int:
+    """搜索靓号地址，每找到一个即写入文件，结束后打印找到的地址。"""
+    network = resolve_network(args.network, args.custom_name, args.rpc_url, args.chain_id)
+    pattern = make_vanity_pattern(network.chain_type, args.prefix, args.suffix, args.case_sensitive)
+    fmt = _resolve_format(args.output, args.format)
+    if args.backend:
+        set_secp256k1_backend(args.backend)
+    if not args.quiet:
+        sys.stderr.write(f"难度约 1/{pattern.difficulty:,}，每个匹配平均需尝试 {pattern.difficulty:,} 次\n")
+
+    writer = _open_writer(args.output, fmt)
+    control = GenerationControl()
+    addresses: List[str] = []
+    try:
+        matches = iter_vanity_wallets(
+            network,
+            pattern,
+            args.count,
+            workers=args.workers,
+            with_mnemonic=args.with_mnemonic,
+            progress_cb=None if args.quiet else _print_vanity_progress,
+            control=control,
+            progress_interval=CLI_PROGRESS_INTERVAL_SECONDS,
+        )
+        for w in matches:
+            writer.write_batch([w])
+            addresses.append(w.address)
+        writer.commit()
+    except KeyboardInterrupt:
+        control.cancel()
+        writer.abort()
+        sys.stderr.write("\n已中断，未写入输出文件\n")
+        return 130
+    except BaseException:
+        writer.abort()
+        raise
+    if not args.quiet:
+        sys.stderr.write("\n")
+    for address in addresses:
+        print(address)
+    print(f"已找到 {writer.rows_written} 个靓号地址（{network.name}），写入 {args.output}")
+    return 0
+
+
+def _add_network_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("-n", "--network", default=PRESET_NETWORKS[0].name, help="网络名称或序号（默认 Ethereum）")
+    parser.add_argument("--custom-name", help="自定义网络的展示名称")
+    parser.add_argument("--rpc-url", help="自定义网络的 RPC URL")
+    parser.add_argument("--chain-id", type=int, help="自定义网络的 Chain ID")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="serein", description="Serein 钱包批量生成（命令行模式，离线本地生成）")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("networks", help="列出预设网络").set_defaults(func=cmd_networks)
+
+    gen = sub.add_parser("generate", help="批量生成钱包并写入文件")
+    _add_network_arguments(gen)
+    gen.add_argument("-c", "--count", type=int, required=True, help=f"生成数量（最多 {MAX_BULK_WALLET_COUNT:,}）")
+    gen.add_argument("-o", "--output", required=True, help="输出文件路径")
+    gen.add_argument("-f", "--format", choices=OUTPUT_FORMATS, help="输出格式，默认按扩展名推断")
+    gen.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKER_COUNT, help="工作进程数，0 表示全部 CPU 核心")
+    gen.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="每个任务块的钱包数量")
+    gen.add_argument(
+        "--mode",
+        choices=[GenerationMode.INDEPENDENT, GenerationMode.SHARED_MNEMONIC],
+        default=GenerationMode.INDEPENDENT,
+        help="independent：每个钱包独立助记词；shared_mnemonic：同一助记词按序号派生",
+    )
+    gen.add_argument(
+        "--mnemonic-stdin",
+        action="store_true",
+        help=f"共享助记词模式下从标准输入读取助记词（终端下不回显）；也可用环境变量 {MNEMONIC_ENV_VAR} 提供，缺省时自动生成",
+    )
+    gen.add_argument("--backend", choices=sorted(SECP256K1_BACKENDS), help="secp256k1 计算后端，默认自动选择")
+    gen.add_argument("--stats", action="store_true", help="结束后输出各阶段耗时、速率与峰值内存")
+    gen.add_argument("-q", "--quiet", action="store_true", help="不输出进度")
+    gen.set_defaults(func=cmd_generate)
+
+    van = sub.add_parser("vanity", help="多进程搜索指定前缀/后缀的靓号地址（EVM / Solana）")
+    _add_network_arguments(van)
+    van.add_argument("-p", "--prefix", default="", help="地址开头：EVM 为十六进制（可带 0x），Solana 为 Base58")
+    van.add_argument("-s", "--suffix", default="", help="地址结尾")
+    van.add_argument("--case-sensitive", action="store_true", help="区分大小写（EVM 按 EIP-55 校验格式）")
+    van.add_argument("--with-mnemonic", action="store_true", help="由 BIP39 助记词派生候选，结果附带助记词（慢得多）")
+    van.add_argument("-c", "--count", type=int, default=1, help=f"需要的匹配数量（最多 {MAX_VANITY_MATCHES}）")
+    van.add_argument("-o", "--output", required=True, help="输出文件路径")
+    van.add_argument("-f", "--format", choices=OUTPUT_FORMATS, help="输出格式，默认按扩展名推断")
+    van.add_argument("-w", "--workers", type=int, default=0, help="工作进程数，默认 0 表示全部 CPU 核心")
+    van.add_argument("--backend", choices=sorted(SECP256K1_BACKENDS), help="secp256k1 计算后端，默认自动选择")
+    van.add_argument("-q", "--quiet", action="store_true", help="不输出进度")
+    van.set_defaults(func=cmd_vanity)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """命令行主函数，返回进程退出码。"""
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (ValueError, OSError) as exc:
+        sys.stderr.write(f"错误：{exc}\n")
+        return 2
+
+
+if __name__ == "__main__":
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -12,6 +12,13 @@ class ChainType:
     SOLANA = "Solana"
 
 
+class GenerationMode:
+    """生成模式字符串枚举：每个钱包独立助记词，或同一助记词按序号派生多个地址。"""
+
+    INDEPENDENT = "independent"
+    SHARED_MNEMONIC = "shared_mnemonic"
+
+
 @dataclass
 class NetworkConfig:
     """网络配置模型，支持预设与自定义网络。"""
@@ -57,9 +64,50 @@ PRESET_NETWORKS: List[NetworkConfig] = [
     ),
 ]
 
-# 允许的最大批量生成数量
+# 允许的最大批量生成数量（结果全部保存在内存与表格中）
 MAX_WALLET_COUNT = 10000
 
+# 直写磁盘的批量模式：记录流式写入文件、内存占用恒定，数量上限仅作防误输入，实际受磁盘空间限制
+MAX_BULK_WALLET_COUNT = 1_000_000_000
+# 批量模式下表格中保留的预览行数
+BULK_PREVIEW_ROWS = 1000
+
+# 并行生成：默认工作进程数（1 表示单进程顺序生成）与每个任务块包含的钱包数量
+DEFAULT_WORKER_COUNT = 1
+DEFAULT_CHUNK_SIZE = 256
+# 界面流式展示时使用更小的块，使首批结果尽快出现在表格中
+STREAM_CHUNK_SIZE = 64
+
+# 靓号搜索：每个任务块的尝试次数（随机私钥 / 每次含 PBKDF2 的助记词派生），以及单次搜索的匹配数量上限
+VANITY_KEY_BATCH_SIZE = 4096
+VANITY_MNEMONIC_BATCH_SIZE = 32
+MAX_VANITY_MATCHES = 1000
+
+# 导出时每批写入的行数
+EXPORT_CHUNK_ROWS = 2000
+
+# 二进制钱包文件（见 binary_store.py）的扩展名；地址索引每行占 8 字节（文件内），超过此行数时不建索引
+BINARY_FILE_SUFFIX = ".srw"
+BINARY_INDEX_MAX_ROWS = 50_000_000
+# 写入时地址索引按此行数分段排序并暂存到临时文件，commit 时归并，内存占用与总行数无关
+BINARY_INDEX_RUN_ROWS = 1_000_000
+
+# Keystore V3 加密导出的 KDF 成本预设：名称 -> (kdf, 迭代次数/scrypt n)
+# scrypt n=2^18 与 geth 默认一致；较低的预设适合批量导出后尽快转存到安全介质
+KEYSTORE_KDF_PRESETS = {
+    "标准（scrypt n=2^18）": ("scrypt", 2**18),
+    "较快（scrypt n=2^15）": ("scrypt", 2**15),
+    "快速（scrypt n=2^13）": ("scrypt", 2**13),
+    "PBKDF2（c=2^18）": ("pbkdf2", 2**18),
+}
+DEFAULT_KEYSTORE_KDF_PRESET = "标准（scrypt n=2^18）"
+# scrypt 每个进程约占 128·r·n 字节内存（n=2^18 时约 256 MiB）；并行进程数按可用内存的一半封顶，
+# 无法获取可用内存时按此预算计算
+KEYSTORE_SCRYPT_MEMORY_FALLBACK = 2 * 1024**3
+
+# 进度上报的最小时间间隔（秒），避免高频跨线程信号拖慢生成与界面
+PROGRESS_INTERVAL_SECONDS = 0.05
+
 # 主题与设置存储位置
 DEFAULT_THEME = "light"
 USER_SETTINGS_FILE = Path("user_settings.json")
@@ -0,0 +1,251 @@
+"""导出服务：流式写入钱包记录，先写临时文件再原子替换，失败时不留下半截文件。"""
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from config import (
+    DEFAULT_KEYSTORE_KDF_PRESET,
+    DEFAULT_WORKER_COUNT,
+    EXPORT_CHUNK_ROWS,
+    KEYSTORE_KDF_PRESETS,
+    KEYSTORE_SCRYPT_MEMORY_FALLBACK,
+    ChainType,
+)
+from models import WalletRecord, display_chain_type
+from wallet_service import GenerationControl
+
+CSV_HEADERS = ["序号", "链类型", "网络", "地址", "助记词", "派生路径", "私钥/密钥"]
+
+# 文件写缓冲大小，配合按批 writerows 减少系统调用
+_WRITE_BUFFER_BYTES = 1 << 20
+
+# 每行 CSV 的估算字节数（12 词助记词，偏保守），用于导出前的磁盘空间检查
+ESTIMATED_CSV_ROW_BYTES = {ChainType.EVM: 240, ChainType.SOLANA: 300}
+
+
+def wallet_csv_row(w: WalletRecord) -> List[object]:
+    """将钱包记录转换为 CSV 行。"""
+    return [
+        w.index,
+        display_chain_type(w.chain_type),
+        w.network,
+        w.address,
+        w.mnemonic,
+        w.derivation_path,
+        w.private_key,
+    ]
+
+
+def iter_chunks(
+    records: Sequence[WalletRecord],
+    size: int = EXPORT_CHUNK_ROWS,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Iterator[Sequence[WalletRecord]]:
+    """将已有记录的 [start, stop) 行切分为固定大小的批次，便于按批导出（含部分导出）与汇报进度。"""
+    stop = len(records) if stop is None else min(stop, len(records))
+    for begin in range(max(start, 0), stop, size):
+        yield records[begin : min(begin + size, stop)]
+
+
+def estimate_csv_bytes(count: int, chain_type: str) -> int:
+    """估算导出 count 条记录所需的磁盘空间（字节）。"""
+    return count * ESTIMATED_CSV_ROW_BYTES.get(chain_type, max(ESTIMATED_CSV_ROW_BYTES.values()))
+
+
+def check_disk_space(path: Union[str, Path], required_bytes: int) -> None:
+    """检查目标路径所在磁盘的剩余空间，不足时抛出 OSError。"""
+    directory = Path(path).resolve().parent
+    free = shutil.disk_usage(directory).free
+    if free < required_bytes:
+        raise OSError(f"磁盘空间不足：预计需要 {required_bytes / 1e9:.2f} GB，剩余 {free / 1e9:.2f} GB")
+
+
+class AtomicFileWriter:
+    """在目标文件同目录下写临时文件，commit 时 fsync 并原子替换目标；abort 删除临时文件。"""
+
+    def __init__(self, path: Union[str, Path], mode: str = "w", **open_kwargs) -> None:
+        self.path = Path(path)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self.tmp_path = Path(tmp_name)
+        self.file = os.fdopen(fd, mode, buffering=_WRITE_BUFFER_BYTES, **open_kwargs)
+        self._closed = False
+
+    def commit(self) -> None:
+        """刷新并原子替换目标文件。"""
+        if self._closed:
+            return
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self._closed = True
+        os.replace(self.tmp_path, self.path)
+
+    def abort(self) -> None:
+        """放弃写入并删除临时文件。"""
+        if self._closed:
+            return
+        self.file.close()
+        self._closed = True
+        try:
+            self.tmp_path.unlink()
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "AtomicFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+
+class CsvStreamWriter(AtomicFileWriter):
+    """流式 CSV 写入器（UTF-8 with BOM，便于 Excel 打开），按批追加行。"""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__(path, "w", newline="", encoding="utf-8-sig")
+        self._writer = csv.writer(self.file)
+        self._writer.writerow(CSV_HEADERS)
+        self.rows_written = 0
+
+    def write_batch(self, records: Iterable[WalletRecord]) -> int:
+        """写入一批记录，返回本批行数。"""
+        rows = [wallet_csv_row(w) for w in records]
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+        return len(rows)
+
+
+def export_csv(
+    batches: Iterable[Iterable[WalletRecord]],
+    path: Union[str, Path],
+    progress_cb: Optional[Callable[[int], None]] = None,
+    control: Optional[GenerationControl] = None,
+) -> int:
+    """
+    将按批产出的钱包记录流式导出为 CSV，可直接接 iter_wallet_batches 的输出。
+
+    :param batches: 记录批次的可迭代对象
+    :param path: 目标文件路径
+    :param progress_cb: 进度回调，接受已写入行数
+    :param control: 可选的取消/暂停控制，每批之前检查；取消时删除临时文件，目标文件保持原样
+    :return: 写入的行数，取消时为 0
+    """
+    with CsvStreamWriter(path) as writer:
+        for batch in batches:
+            if control is not None and not control.checkpoint():
+                writer.abort()
+                return 0
+            writer.write_batch(batch)
+            if progress_cb:
+                progress_cb(writer.rows_written)
+    return writer.rows_written
+
+
+def keystore_filename(w: WalletRecord) -> str:
+    """单个 keystore 文件名：序号 + 地址，便于排序与查找。"""
+    return f"{w.index:07d}--{w.address[2:].lower()}.json"
+
+
+# eth-account（eth-keyfile）固定使用的 scrypt 参数 r
+_SCRYPT_R = 8
+
+
+def _available_memory() -> Optional[int]:
+    """当前可用物理内存（字节），无法获取时返回 None。"""
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        # Windows 等没有 sysconf 的平台
+        return None
+
+
+def keystore_worker_limit(kdf: str, iterations: int, workers: int) -> int:
+    """
+    按 KDF 内存开销限制 Keystore 加密的进程数（0 表示全部 CPU 核心）。
+
+    pbkdf2 几乎不占内存，不作限制；scrypt 每个进程约需 128·r·n 字节，总量不超过可用内存的一半。
+    """
+    workers = workers or os.cpu_count() or 1
+    if kdf != "scrypt":
+        return workers
+    available = _available_memory()
+    budget = available // 2 if available is not None else KEYSTORE_SCRYPT_MEMORY_FALLBACK
+    return max(1, min(workers, budget // (128 * _SCRYPT_R * iterations)))
+
+
+def _encrypt_keystore(task: Tuple[str, str, str, int]) -> Dict[str, Any]:
+    """在工作进程中加密单个私钥为 Web3 Secret Storage（V3）JSON。"""
+    from eth_account import Account
+
+    private_key, password, kdf, iterations = task
+    return Account.encrypt(private_key, password, kdf=kdf, iterations=iterations)
+
+
+def export_keystores(
+    records: Sequence[WalletRecord],
+    out_path: Union[str, Path],
+    password: str,
+    kdf: str = KEYSTORE_KDF_PRESETS[DEFAULT_KEYSTORE_KDF_PRESET][0],
+    iterations: int = KEYSTORE_KDF_PRESETS[DEFAULT_KEYSTORE_KDF_PRESET][1],
+    workers: int = DEFAULT_WORKER_COUNT,
+    bundle: bool = False,
+    progress_cb: Optional[Callable[[int], None]] = None,
+    control: Optional[GenerationControl] = None,
+) -> int:
+    """
+    多进程导出 Keystore V3（scrypt/pbkdf2 加密），仅支持 EVM 钱包。
+
+    KDF 计算刻意昂贵，因此按批分发到进程池并行加密；每个文件均原子写入。
+
+    :param records: 待导出的钱包记录
+    :param out_path: 目录（每个钱包一个文件）或文件路径（bundle=True 时为单个 JSON 数组）
+    :param password: 加密口令
+    :param kdf: "scrypt" 或 "pbkdf2"
+    :param iterations: scrypt 的 n 或 pbkdf2 的迭代次数，决定单个 keystore 的加密耗时
+    :param workers: 工作进程数，0 表示使用全部 CPU 核心；scrypt 时再按内存封顶（见 keystore_worker_limit）
+    :param bundle: 是否合并为单个 JSON 文件
+    :param progress_cb: 进度回调，接受已加密数量
+    :param control: 可选的取消/暂停控制，每批之前检查；取消时已写出的文件保留（均完整），合并文件不写出
+    :return: 导出的数量
+    """
+    if not password:
+        raise ValueError("Keystore 加密口令不能为空")
+    # 先整体校验再创建目录与进程池，避免混合链的数据写出一部分后才报错
+    if any(w.chain_type != ChainType.EVM for w in records):
+        raise ValueError("Keystore V3 仅支持 EVM 钱包")
+    out_path = Path(out_path)
+    if not bundle:
+        out_path.mkdir(parents=True, exist_ok=True)
+
+    workers = keystore_worker_limit(kdf, iterations, workers)
+    done = 0
+    bundle_items: List[Dict[str, Any]] = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch in iter_chunks(records, size=max(workers * 8, 1)):
+            if control is not None and not control.checkpoint():
+                return done
+            tasks = [(w.private_key, password, kdf, iterations) for w in batch]
+            for w, keystore in zip(batch, executor.map(_encrypt_keystore, tasks)):
+                if bundle:
+                    bundle_items.append(keystore)
+                else:
+                    with AtomicFileWriter(out_path / keystore_filename(w), encoding="utf-8") as writer:
+                        json.dump(keystore, writer.file)
+            done += len(batch)
+            if progress_cb:
+                progress_cb(done)
+
+    if bundle:
+        with AtomicFileWriter(out_path, encoding="utf-8") as writer:
+            json.dump(bundle_items, writer.file)
+    return done
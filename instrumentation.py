@@ -0,0 +1,171 @@
+"""
+生成流水线的分阶段计时：各阶段累计耗时与处理数量、峰值内存及整体速率。
+
+计时粒度为“每块每阶段一次”，而非每个钱包一次；未启用（stats 为 None）时调用方只多一次判空。
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+# 阶段名称及其展示标签，按流水线顺序排列
+STAGE_LABELS = {
+    "mnemonic": "助记词",
+    "seed": "PBKDF2 种子",
+    "derive": "密钥派生",
+    "pubkey": "公钥计算",
+    "encode": "地址编码",
+    "assemble": "组装记录",
+    "wait": "等待工作进程",
+    "export": "写入文件",
+    "ui": "界面更新",
+}
+
+
+@dataclass
+class StageTiming:
+    """单个阶段的累计耗时（秒）与处理数量。"""
+
+    seconds: float = 0.0
+    count: int = 0
+
+
+class _StageTimer:
+    """计时上下文：退出时把耗时累加到所属统计对象。"""
+
+    __slots__ = ("_stats", "_name", "_count", "_started")
+
+    def __init__(self, stats: "GenerationStats", name: str, count: int) -> None:
+        self._stats = stats
+        self._name = name
+        self._count = count
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stats.add(self._name, time.perf_counter() - self._started, self._count)
+
+
+class _NullTimer:
+    """未启用统计时使用的空上下文（单例，无任何开销）。"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def stage(stats: Optional["GenerationStats"], name: str, count: int = 0):
+    """返回计时上下文；stats 为 None 时返回空上下文。"""
+    return _NULL_TIMER if stats is None else _StageTimer(stats, name, count)
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """当前进程的峰值常驻内存（字节），平台不支持时返回 None。"""
+    if sys.platform == "win32":
+        return _windows_peak_working_set()
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 为单位，macOS 以字节为单位
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _windows_peak_working_set() -> Optional[int]:
+    import ctypes
+    from ctypes import wintypes
+
+    class ProcessMemoryCounters(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    counters = ProcessMemoryCounters()
+    counters.cb = ctypes.sizeof(counters)
+    try:
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return None
+    except (AttributeError, OSError):
+        return None
+    return counters.PeakWorkingSetSize
+
+
+@dataclass
+class GenerationStats:
+    """
+    一次生成任务的统计：传给 iter_wallet_batches / generate_wallets 后就地填充，结束后由调用方读取。
+
+    多进程模式下各工作进程的阶段耗时会合并回来（累计的是 CPU 侧耗时，可能大于墙钟时间）；
+    峰值内存只统计主进程。
+    """
+
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    wallets: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    elapsed: float = 0.0
+    peak_memory: Optional[int] = None
+
+    def add(self, name: str, seconds: float, count: int = 0) -> None:
+        """累加某阶段的耗时与数量。"""
+        timing = self.stages.get(name)
+        if timing is None:
+            timing = self.stages[name] = StageTiming()
+        timing.seconds += seconds
+        timing.count += count
+
+    def stage(self, name: str, count: int = 0) -> _StageTimer:
+        """返回该阶段的计时上下文。"""
+        return _StageTimer(self, name, count)
+
+    def merge(self, other: "GenerationStats") -> None:
+        """合并另一份统计（如工作进程返回的单块统计）的阶段耗时。"""
+        for name, timing in other.stages.items():
+            self.add(name, timing.seconds, timing.count)
+
+    def finish(self) -> None:
+        """记录总耗时与峰值内存。"""
+        self.elapsed = time.perf_counter() - self.started
+        self.peak_memory = peak_memory_bytes()
+
+    @property
+    def wallets_per_second(self) -> float:
+        elapsed = self.elapsed or time.perf_counter() - self.started
+        return self.wallets / elapsed if elapsed > 0 else 0.0
+
+    def summary(self, top: Optional[int] = None) -> str:
+        """单行摘要：速率、峰值内存与各阶段耗时占比（按耗时降序，可只取前 top 项）。"""
+        total = sum(t.seconds for t in self.stages.values()) or 1.0
+        ranked = sorted(self.stages.items(), key=lambda item: item[1].seconds, reverse=True)[:top]
+        parts = [f"{self.wallets_per_second:,.0f} 个/秒"]
+        if self.peak_memory is not None:
+            parts.append(f"峰值内存 {self.peak_memory / 2**20:,.0f} MB")
+        parts += [f"{STAGE_LABELS.get(name, name)} {t.seconds / total:.0%}" for name, t in ranked]
+        return " · ".join(parts)
+
+    def report(self) -> str:
+        """多行明细：每个阶段的累计耗时、数量与单条耗时。"""
+        lines = [f"共 {self.wallets} 个，用时 {self.elapsed:.2f} 秒，{self.summary(top=0)}"]
+        for name, t in sorted(self.stages.items(), key=lambda item: item[1].seconds, reverse=True):
+            per_item = f"，{t.seconds / t.count * 1e6:,.1f} µs/条" if t.count else ""
+            lines.append(f"  {STAGE_LABELS.get(name, name)}：{t.seconds:.3f} 秒，{t.count} 条{per_item}")
+        return "\n".join(lines)
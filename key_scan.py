@@ -0,0 +1,122 @@
+"""
+secp256k1 连续私钥扫描：从私钥 k 出发依次求 k、k+1、k+2…的公钥，用点加代替逐个标量乘法。
+
+每批只对起点做一次标量乘法（走当前 secp256k1 后端），其余公钥为“起点 + i·G”的仿射点加；
+各点加所需的模逆经 Montgomery 批量求逆合并为一次 pow(·, -1, p)，每个公钥只需约 6 次模乘。
+适合靓号搜索这类只需要“大量随机公钥”的场景；BIP32 / 助记词派生的密钥彼此无关，无法这样加速。
+"""
+
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from wallet_service import SECP256K1_N, get_secp256k1_backend
+
+# secp256k1 有限域素数与基点 G
+SECP256K1_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+SECP256K1_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+)
+
+Point = Tuple[int, int]
+
+
+def _public_point(key: int) -> Point:
+    """私钥对应的仿射公钥点（标量乘法交给当前后端）。"""
+    public_key = get_secp256k1_backend().uncompressed_public_keys([key.to_bytes(32, "big")])[0]
+    return int.from_bytes(public_key[:32], "big"), int.from_bytes(public_key[32:], "big")
+
+
+def _encode_point(x: int, y: int) -> bytes:
+    """64 字节非压缩公钥（不含 0x04 前缀）。"""
+    return ((x << 256) | y).to_bytes(64, "big")
+
+
+def _point_add(a: Point, b: Point) -> Point:
+    """单次仿射点加（含倍点），只用于预计算；不处理无穷远点。"""
+    p = SECP256K1_P
+    if a == b:
+        lam = 3 * a[0] * a[0] * pow(2 * a[1], -1, p) % p
+    else:
+        lam = (b[1] - a[1]) * pow(b[0] - a[0], -1, p) % p
+    x = (lam * lam - a[0] - b[0]) % p
+    return x, (lam * (a[0] - x) - a[1]) % p
+
+
+@lru_cache(maxsize=4)
+def _multiples_of_g(count: int) -> Tuple[Point, ...]:
+    """预计算 1·G … count·G（每进程每种批量只算一次）。"""
+    table = [SECP256K1_G]
+    for _ in range(count - 1):
+        table.append(_point_add(table[-1], SECP256K1_G))
+    return tuple(table)
+
+
+def _add_offsets(qx: int, qy: int, offsets: Sequence[Point]) -> Optional[List[bytes]]:
+    """
+    批量求 Q + offsets[i]，返回编码后的公钥列表。
+
+    Montgomery 技巧：先累乘全部分母 (x_i - x_Q)，一次求逆后自后向前依次还原每个分母的逆。
+    某个分母为 0（Q 与偏移点横坐标相同，即 Q = ±offset）时无法批量求逆，返回 None 由调用方兜底。
+    """
+    p = SECP256K1_P
+    prefix = [0] * len(offsets)
+    acc = 1
+    for i, (x, _) in enumerate(offsets):
+        prefix[i] = acc
+        acc = acc * (x - qx) % p
+    if not acc:
+        return None
+    inv = pow(acc, -1, p)
+    public_keys: List[bytes] = [b""] * len(offsets)
+    for i in range(len(offsets) - 1, -1, -1):
+        x, y = offsets[i]
+        # inv 当前为前 i+1 个分母乘积的逆：乘以前 i 个分母的乘积得本项的逆，乘以本项分母后去掉本项
+        inv_i = inv * prefix[i] % p
+        inv = inv * (x - qx) % p
+        lam = (y - qy) * inv_i % p
+        rx = (lam * lam - qx - x) % p
+        public_keys[i] = _encode_point(rx, (lam * (qx - rx) - qy) % p)
+    return public_keys
+
+
+def _backend_public_keys(start_key: int, count: int) -> List[bytes]:
+    """逐个标量乘法求公钥（起点过小或接近曲线阶等极端情况的兜底）。"""
+    keys = [(start_key + i).to_bytes(32, "big") for i in range(count)]
+    return get_secp256k1_backend().uncompressed_public_keys(keys)
+
+
+def _check_range(start_key: int, count: int) -> None:
+    if count <= 0:
+        raise ValueError("扫描数量必须为正整数")
+    if start_key < 1 or start_key + count > SECP256K1_N:
+        raise ValueError("扫描范围超出 secp256k1 私钥范围 [1, n)")
+
+
+def scan_public_keys(start_key: int, count: int) -> List[bytes]:
+    """返回私钥 start_key … start_key + count - 1 的 64 字节非压缩公钥（不含 0x04 前缀）。"""
+    _check_range(start_key, count)
+    qx, qy = _public_point(start_key)
+    rest = _add_offsets(qx, qy, _multiples_of_g(count)[: count - 1]) if count > 1 else []
+    if rest is None:
+        return _backend_public_keys(start_key, count)
+    return [_encode_point(qx, qy)] + rest
+
+
+def iter_public_key_batches(start_key: int, batch_size: int) -> Iterator[Tuple[int, List[bytes]]]:
+    """
+    从 start_key 起连续扫描，每批产出 (本批首个私钥, 公钥列表)，直到接近曲线阶为止。
+
+    批与批之间同样只做点加：下一批 = 上一批最后一个点 + 1·G … batch_size·G。
+    """
+    key = start_key
+    public_keys = scan_public_keys(key, batch_size)
+    table = _multiples_of_g(batch_size)
+    while True:
+        yield key, public_keys
+        key += batch_size
+        if key + batch_size > SECP256K1_N:
+            return
+        last = public_keys[-1]
+        next_keys = _add_offsets(int.from_bytes(last[:32], "big"), int.from_bytes(last[32:], "big"), table)
+        public_keys = next_keys if next_keys is not None else _backend_public_keys(key, batch_size)
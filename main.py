@@ -1,15 +1,16 @@
-"""应用入口，负责启动 QApplication 并加载主题。"""
+"""应用入口：无参数时启动图形界面，带子命令时转入命令行模式（不加载 PyQt5）。"""
 
+import multiprocessing
 import sys
 
-from PyQt5.QtWidgets import QApplication
-
-from theme_manager import apply_theme, load_theme
-from ui_main_window import MainWindow
-
 
 def run_app() -> None:
     """启动 Serein 主窗口。"""
+    from PyQt5.QtWidgets import QApplication
+
+    from theme_manager import apply_theme, load_theme
+    from ui_main_window import MainWindow
+
     app = QApplication(sys.argv)
     theme = load_theme()
     apply_theme(app, theme)
@@ -20,4 +21,10 @@ def run_app() -> None:
 
 
 if __name__ == "__main__":
+    # 打包后的可执行文件需要此调用，多进程生成的子进程才能正常启动
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1:
+        from cli import main
+
+        sys.exit(main())
     run_app()
@@ -1,13 +1,17 @@
-"""数据模型定义，包含链类型常量与钱包记录。"""
+"""数据模型定义，包含链类型常量、钱包记录与紧凑的列式钱包存储。"""
 
+from array import array
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
 
+from address_encoding import b58decode, b58encode, to_checksum_addresses
 from config import ChainType
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletRecord:
-    """单个钱包记录模型，包含链类型与敏感字段。"""
+    """单个钱包记录模型，包含链类型与敏感字段（使用 __slots__，无逐实例 __dict__）。"""
 
     index: int
     chain_type: str
@@ -20,3 +24,225 @@ class WalletRecord:
     def is_solana(self) -> bool:
         """是否为 Solana 链记录。"""
         return self.chain_type == ChainType.SOLANA
+
+
+def display_chain_type(chain_type: str) -> str:
+    """将内部链类型值转换为中文标签。"""
+    return "Solana 链" if chain_type == ChainType.SOLANA else "EVM 链"
+
+
+@lru_cache(maxsize=1)
+def _bip39_wordlist() -> Tuple[List[str], Dict[str, int]]:
+    """BIP39 英文词表及反查表（延迟加载）。"""
+    from mnemonic import Mnemonic
+
+    words = Mnemonic("english").wordlist
+    return words, {word: i for i, word in enumerate(words)}
+
+
+# 地址与密钥均按 32 字节定宽存放：EVM 地址 20 字节（右侧补零）、私钥 32 字节；
+# Solana 地址为 32 字节公钥，密钥只存 32 字节种子，64 字节私钥 = 种子 + 公钥，显示时再拼接
+SLOT_BYTES = 32
+_EVM_ADDRESS_BYTES = 20
+
+# 记录档案：(链类型, 网络, 路径前缀, 路径后缀)，派生路径 = 前缀 + 路径序号 + 后缀
+WalletProfile = Tuple[str, str, str, str]
+
+
+def split_wallet_profile(w: WalletRecord) -> Tuple[WalletProfile, int]:
+    """拆出记录的档案与派生路径最后一段的序号；无派生路径（随机私钥）时路径前缀为空。"""
+    if not w.derivation_path:
+        return (w.chain_type, w.network, "", ""), 0
+    prefix, _, leaf = w.derivation_path.rpartition("/")
+    suffix = "'" if leaf.endswith("'") else ""
+    return (w.chain_type, w.network, prefix + "/", suffix), int(leaf.rstrip("'"))
+
+
+def join_derivation_path(prefix: str, path_index: int, suffix: str) -> str:
+    """由档案中的路径前缀/后缀与路径序号还原派生路径，前缀为空表示记录没有派生路径。"""
+    return f"{prefix}{path_index}{suffix}" if prefix else ""
+
+
+def encode_address_key(w: WalletRecord) -> Tuple[bytes, bytes]:
+    """将地址与私钥文本编码为两个 32 字节定宽字段。"""
+    if w.chain_type == ChainType.EVM:
+        address = bytes.fromhex(w.address[2:]).ljust(SLOT_BYTES, b"\0")
+        key = bytes.fromhex(w.private_key)
+    elif w.chain_type == ChainType.SOLANA:
+        address = b58decode(w.address)
+        secret = b58decode(w.private_key)
+        if secret[SLOT_BYTES:] != address:
+            raise ValueError(f"Solana 私钥与地址不匹配: 序号 {w.index}")
+        key = secret[:SLOT_BYTES]
+    else:
+        raise ValueError(f"未支持的链类型: {w.chain_type}")
+    if len(address) != SLOT_BYTES or len(key) != SLOT_BYTES:
+        raise ValueError(f"地址或密钥长度不正确: 序号 {w.index}")
+    return address, key
+
+
+def parse_address(text: str) -> bytes:
+    """将地址文本转换为 32 字节定宽字段（0x 开头按 EVM 解析且不区分大小写，否则按 Base58 解析）。"""
+    text = text.strip()
+    if text[:2].lower() == "0x":
+        if len(text) != 42:
+            raise ValueError(f"EVM 地址长度不正确: {text}")
+        return bytes.fromhex(text[2:]).ljust(SLOT_BYTES, b"\0")
+    address = b58decode(text)
+    if len(address) != SLOT_BYTES:
+        raise ValueError(f"Solana 地址长度不正确: {text}")
+    return address
+
+
+def encode_mnemonic(mnemonic: str) -> List[int]:
+    """将助记词编码为 11 位词索引列表。"""
+    _, word_index = _bip39_wordlist()
+    return [word_index[word] for word in mnemonic.split()]
+
+
+def decode_mnemonic(indices: Iterable[int]) -> str:
+    """由词索引还原助记词文本。"""
+    words, _ = _bip39_wordlist()
+    return " ".join(words[i] for i in indices)
+
+
+def decode_address(chain_type: str, address: bytes) -> str:
+    """由 32 字节定宽字段还原地址文本（EVM 为 EIP-55 校验格式）。"""
+    if chain_type == ChainType.SOLANA:
+        return b58encode(address)
+    return to_checksum_addresses([address[:_EVM_ADDRESS_BYTES]])[0]
+
+
+def decode_private_key(chain_type: str, key: bytes, address: bytes) -> str:
+    """由 32 字节定宽字段还原私钥文本（Solana 为 Base58 编码的 种子 + 公钥）。"""
+    if chain_type == ChainType.SOLANA:
+        return b58encode(key + address)
+    return key.hex()
+
+
+class WalletStore(Sequence[WalletRecord]):
+    """
+    列式钱包存储，适合大批量结果常驻内存。
+
+    - 链类型、网络名与路径前缀合并为“档案”后驻留，每行只存 2 字节档案编号；
+    - 地址与密钥以定宽字节存放在连续缓冲区中；
+    - 助记词存为 11 位词索引（每词 2 字节），与上一行相同的助记词（共享助记词模式）只存一份；
+    - 文本仅在显示或导出某一行时才生成。
+    """
+
+    def __init__(self, records: Iterable[WalletRecord] = ()) -> None:
+        self._profiles: List[WalletProfile] = []
+        self._profile_ids: Dict[WalletProfile, int] = {}
+        self._profile_col = array("H")
+        self._index_col = array("I")
+        self._path_index_col = array("I")
+        self._addresses = bytearray()
+        self._keys = bytearray()
+        self._words = array("H")
+        self._mnemonic_start = array("Q")
+        self._mnemonic_len = array("B")
+        self._last_mnemonic = ""
+        self.extend(records)
+
+    # ------------------------- 写入 ------------------------- #
+    def append(self, w: WalletRecord) -> None:
+        """追加一条记录（编码为定宽字节与词索引）。"""
+        profile, path_index = split_wallet_profile(w)
+        profile_id = self._profile_ids.get(profile)
+        if profile_id is None:
+            profile_id = self._profile_ids[profile] = len(self._profiles)
+            self._profiles.append(profile)
+        address, key = encode_address_key(w)
+
+        if w.mnemonic != self._last_mnemonic or not self._mnemonic_start:
+            words = encode_mnemonic(w.mnemonic)
+            self._mnemonic_start.append(len(self._words))
+            self._mnemonic_len.append(len(words))
+            self._words.extend(words)
+            self._last_mnemonic = w.mnemonic
+        else:
+            self._mnemonic_start.append(self._mnemonic_start[-1])
+            self._mnemonic_len.append(self._mnemonic_len[-1])
+
+        self._profile_col.append(profile_id)
+        self._index_col.append(w.index)
+        self._path_index_col.append(path_index)
+        self._addresses += address
+        self._keys += key
+
+    def extend(self, records: Iterable[WalletRecord]) -> None:
+        for w in records:
+            self.append(w)
+
+    # ------------------------- 读取 ------------------------- #
+    def __len__(self) -> int:
+        return len(self._index_col)
+
+    @overload
+    def __getitem__(self, row: int) -> WalletRecord: ...
+
+    @overload
+    def __getitem__(self, row: slice) -> List[WalletRecord]: ...
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[WalletRecord, List[WalletRecord]]:
+        if isinstance(row, slice):
+            return [self._record(i) for i in range(*row.indices(len(self)))]
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("行号越界")
+        return self._record(row)
+
+    def __iter__(self) -> Iterator[WalletRecord]:
+        for row in range(len(self)):
+            yield self._record(row)
+
+    def field(self, row: int, name: str) -> Union[int, str]:
+        """只解码指定行的单个字段，供表格按单元格取值。"""
+        chain_type, network, prefix, suffix = self._profiles[self._profile_col[row]]
+        if name == "index":
+            return self._index_col[row]
+        if name == "chain_type":
+            return chain_type
+        if name == "network":
+            return network
+        if name == "derivation_path":
+            return join_derivation_path(prefix, self._path_index_col[row], suffix)
+        if name == "mnemonic":
+            start = self._mnemonic_start[row]
+            return decode_mnemonic(self._words[start : start + self._mnemonic_len[row]])
+        offset = row * SLOT_BYTES
+        address = bytes(self._addresses[offset : offset + SLOT_BYTES])
+        if name == "address":
+            return decode_address(chain_type, address)
+        if name == "private_key":
+            return decode_private_key(chain_type, bytes(self._keys[offset : offset + SLOT_BYTES]), address)
+        raise KeyError(name)
+
+    def find_address(self, address: str) -> Optional[int]:
+        """按地址查找所在行号，未找到返回 None（在定宽地址缓冲区上直接做字节搜索）。"""
+        target = parse_address(address)
+        pos = self._addresses.find(target)
+        while pos != -1:
+            if pos % SLOT_BYTES == 0:
+                return pos // SLOT_BYTES
+            pos = self._addresses.find(target, pos + 1)
+        return None
+
+    def find_wallet_index(self, wallet_index: int) -> Optional[int]:
+        """按钱包序号查找所在行号，未找到返回 None。"""
+        try:
+            return self._index_col.index(wallet_index)
+        except (ValueError, OverflowError):
+            return None
+
+    def _record(self, row: int) -> WalletRecord:
+        return WalletRecord(
+            index=self._index_col[row],
+            chain_type=self.field(row, "chain_type"),  # type: ignore[arg-type]
+            network=self.field(row, "network"),  # type: ignore[arg-type]
+            address=self.field(row, "address"),  # type: ignore[arg-type]
+            mnemonic=self.field(row, "mnemonic"),  # type: ignore[arg-type]
+            derivation_path=self.field(row, "derivation_path"),  # type: ignore[arg-type]
+            private_key=self.field(row, "private_key"),  # type: ignore[arg-type]
+        )
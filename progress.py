@@ -0,0 +1,71 @@
+"""进度节流：合并高频进度更新，按固定时间间隔发布，并附带速率与剩余时间估计。"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from config import PROGRESS_INTERVAL_SECONDS
+
+
+@dataclass
+class ProgressSnapshot:
+    """一次对外发布的进度快照。"""
+
+    done: int
+    total: int
+    rate: float  # 每秒完成数量
+    eta: Optional[float]  # 预计剩余秒数，尚无法估计时为 None
+
+
+class ProgressThrottle:
+    """
+    进度节流器：调用方可对每个条目调用 update，仅当距上次发布超过 interval 秒、
+    或全部完成时才真正回调，避免跨线程信号淹没事件循环。
+    """
+
+    def __init__(
+        self,
+        total: int,
+        callback: Callable[[ProgressSnapshot], None],
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.total = total
+        self.callback = callback
+        self.interval = interval
+        self._clock = clock
+        self._started = clock()
+        self._last_emit = float("-inf")
+        self._last_done = -1
+
+    def update(self, done: int) -> None:
+        """记录当前完成数量，满足节流条件时发布。"""
+        now = self._clock()
+        if done >= self.total or now - self._last_emit >= self.interval:
+            self._emit(done, now)
+
+    def finish(self, done: Optional[int] = None) -> None:
+        """强制发布最终进度（如提前结束时）。"""
+        self._emit(self.total if done is None else done, self._clock())
+
+    def _emit(self, done: int, now: float) -> None:
+        if done == self._last_done:
+            return
+        self._last_emit = now
+        self._last_done = done
+        elapsed = now - self._started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - done) / rate if rate > 0 else None
+        self.callback(ProgressSnapshot(done=done, total=self.total, rate=rate, eta=eta))
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """将秒数格式化为 mm:ss 或 h:mm:ss，未知时返回 "--:--"。"""
+    if seconds is None:
+        return "--:--"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
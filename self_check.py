@@ -0,0 +1,278 @@
+"""
+自检：用公开的标准向量（known-answer）与参考库核对本项目自行实现的密钥/地址相关代码。
+
+覆盖 BIP39 熵转词索引与种子、EIP-55 校验地址、Base58 编解码、连续私钥扫描（key_scan）与
+HD 派生结果；参考库（mnemonic / base58 / eth_utils / coincurve / eth-keys）未安装时对应的
+随机比对项跳过，标准向量始终检查。任一项不一致即以非零退出码结束：
+
+    python self_check.py
+    python self_check.py -k scan --rounds 200
+"""
+
+import argparse
+import os
+import secrets
+import sys
+from typing import Callable, Dict, List, Optional
+
+from address_encoding import b58decode, b58encode, encode_evm_addresses, to_checksum_address, to_checksum_addresses
+from key_scan import SECP256K1_G, _encode_point, iter_public_key_batches, scan_public_keys
+from wallet_service import (
+    SECP256K1_BACKENDS,
+    SECP256K1_N,
+    _derive_evm_account,
+    _entropy_to_word_indices,
+    _mnemonic_generator,
+    _mnemonic_to_seed,
+    get_secp256k1_backend,
+    set_secp256k1_backend,
+)
+
+# 默认随机比对轮数
+DEFAULT_ROUNDS = 50
+
+# BIP39 官方向量（英文词表，口令 "TREZOR"）：熵、助记词、种子
+BIP39_VECTORS = [
+    (
+        "00000000000000000000000000000000",
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon about",
+        "c55257c360c07c72029aebc1b53c05ed0362ada38ead3e3e9efa3708e53495531f09a6987599d18264c1e1c92f2cf141630c7a3c4ab7c81b2f001698e7463b04",
+    ),
+    (
+        "7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f7f",
+        "legal winner thank year wave sausage worth useful legal winner thank yellow",
+        "2e8905819b8723fe2c1d161860e5ee1830318dbf49a83bd451cfb8440c28bd6fa457fe1296106559a3c80937a1c1069be3a3a5bd381ee6260e8d9739fce1f607",
+    ),
+    (
+        "80808080808080808080808080808080",
+        "letter advice cage absurd amount doctor acoustic avoid letter advice cage above",
+        "d71de856f81a8acc65e6fc851a38d4d7ec216fd0796d0a6827a3ad6ed5511a30fa280f12eb2e47ed2ac03b5c462a0358d18d69fe4f985ec81778c1b370b652a8",
+    ),
+    (
+        "ffffffffffffffffffffffffffffffff",
+        "zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo zoo wrong",
+        "ac27495480225222079d7be181583751e86f571027b0497b5b5d11218e0a8a13332572917f0f8e5a589620c6f15b11c61dee327651a14c34e18231052e48c069",
+    ),
+    (
+        "0000000000000000000000000000000000000000000000000000000000000000",
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon "
+        "abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon abandon art",
+        "bda85446c68413707090a52022edd26a1c9462295029f2e60cd7c4f2bbd3097170af7a4d73245cafa9c3cca8d561a7c3de6f5d4a10be8ed2a5e608d68f92fcc8",
+    ),
+]
+
+# EIP-55 规范中的示例地址（全大写、全小写与混合大小写）
+EIP55_VECTORS = [
+    "0x52908400098527886E0F7030069857D2E4169EE7",
+    "0x8617E340B3D01FA5F11F306F4090FD50E238070D",
+    "0xde709f2102306220921060314715629080e2fb77",
+    "0x27b1fdb04752bbc536007a920d24acb045561c26",
+    "0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed",
+    "0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359",
+    "0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB",
+    "0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb",
+]
+
+# Bitcoin Core 的 Base58 编码向量（十六进制数据, 编码结果）
+BASE58_VECTORS = [
+    ("", ""),
+    ("61", "2g"),
+    ("626262", "a3gV"),
+    ("636363", "aPEr"),
+    ("73696d706c792061206c6f6e6720737472696e67", "2cFupjhnEsSn59qHXstmK2ffpLv2"),
+    ("00eb15231dfceb60925886b67d065299925915aeb172c06647", "1NS17iag9jJgTHD1VXjvLCEnZuQ3rJDE9L"),
+    ("516b6fcd0f", "ABnLTmg"),
+    ("bf4f89001e670274dd", "3SEo3LWLoPntC"),
+    ("572e4794", "3EFU7m"),
+    ("ecac89cad93923c02321", "EJDM8drfXA6uyA"),
+    ("10c8511e", "Rt5zm"),
+    ("00000000000000000000", "1111111111"),
+]
+
+# 私钥 1、2 的以太坊地址，以及上面第一个助记词在 m/44'/60'/0'/0/0 上的地址与私钥
+SMALL_KEY_ADDRESSES = {
+    1: "0x7E5F4552091A69125d5DfCb7b8C2659029395Bdf",
+    2: "0x2B5AD5c4795c026514f8317c7a215E218DcCD6cF",
+}
+EVM_DERIVATION_VECTOR = (
+    "m/44'/60'/0'/0/0",
+    "0x9858EfFD232B4033E47d90003D41EC34EcaEda94",
+    "1ab42cc412b618bdea3a599e3c9bae199ebf030895b039e9db1e30dafb12b727",
+)
+
+# 自检函数：接受随机比对轮数，不一致时抛出 AssertionError；缺少参考库时抛出 ImportError 表示跳过
+CheckFn = Callable[[int], None]
+SELF_CHECKS: Dict[str, CheckFn] = {}
+
+
+def self_check(name: str) -> Callable[[CheckFn], CheckFn]:
+    """注册一个自检项。"""
+
+    def register(check: CheckFn) -> CheckFn:
+        SELF_CHECKS[name] = check
+        return check
+
+    return register
+
+
+def _expect(actual: object, expected: object, what: str) -> None:
+    if actual != expected:
+        raise AssertionError(f"{what}：期望 {expected!r}，实际 {actual!r}")
+
+
+def _backend_pubkeys(start: int, count: int) -> List[bytes]:
+    keys = [(start + i).to_bytes(32, "big") for i in range(count)]
+    return get_secp256k1_backend().uncompressed_public_keys(keys)
+
+
+@self_check("bip39.vectors")
+def _check_bip39_vectors(rounds: int) -> None:
+    wordlist = _mnemonic_generator().wordlist
+    for entropy, phrase, seed in BIP39_VECTORS:
+        words = " ".join(wordlist[i] for i in _entropy_to_word_indices(bytes.fromhex(entropy)))
+        _expect(words, phrase, f"熵 {entropy} 的助记词")
+        _expect(_mnemonic_to_seed(phrase, "TREZOR").hex(), seed, f"助记词 {phrase[:20]}… 的种子")
+
+
+@self_check("bip39.random")
+def _check_bip39_random(rounds: int) -> None:
+    generator = _mnemonic_generator()
+    wordlist = generator.wordlist
+    for _ in range(rounds):
+        for size in (16, 20, 24, 28, 32):
+            entropy = os.urandom(size)
+            words = " ".join(wordlist[i] for i in _entropy_to_word_indices(entropy))
+            _expect(words, generator.to_mnemonic(entropy), f"熵 {entropy.hex()} 的助记词")
+
+
+@self_check("eip55.vectors")
+def _check_eip55_vectors(rounds: int) -> None:
+    for address in EIP55_VECTORS:
+        _expect(to_checksum_address(address.lower()), address, "EIP-55 校验地址")
+
+
+@self_check("eip55.random")
+def _check_eip55_random(rounds: int) -> None:
+    from eth_utils import to_checksum_address as reference
+
+    raws = [os.urandom(20) for _ in range(rounds * 20)]
+    for raw, address in zip(raws, to_checksum_addresses(raws)):
+        _expect(address, reference(raw), f"地址 {raw.hex()} 的 EIP-55 格式")
+
+
+@self_check("base58.vectors")
+def _check_base58_vectors(rounds: int) -> None:
+    for data, text in BASE58_VECTORS:
+        _expect(b58encode(bytes.fromhex(data)), text, f"{data or '空数据'} 的 Base58 编码")
+        _expect(b58decode(text).hex(), data, f"{text or '空串'} 的 Base58 解码")
+
+
+@self_check("base58.random")
+def _check_base58_random(rounds: int) -> None:
+    import base58
+
+    for _ in range(rounds * 20):
+        data = b"\0" * secrets.randbelow(3) + os.urandom(secrets.randbelow(80))
+        text = b58encode(data)
+        _expect(text, base58.b58encode(data).decode("ascii"), f"{data.hex()} 的 Base58 编码")
+        _expect(b58decode(text), data, f"{text} 的 Base58 解码")
+
+
+@self_check("secp256k1.vectors")
+def _check_secp256k1_vectors(rounds: int) -> None:
+    _expect(scan_public_keys(1, 1)[0], _encode_point(*SECP256K1_G), "私钥 1 的公钥（基点 G）")
+    for key, address in SMALL_KEY_ADDRESSES.items():
+        _expect(encode_evm_addresses(scan_public_keys(key, 1))[0], address, f"私钥 {key} 的地址")
+    path, address, private_key = EVM_DERIVATION_VECTOR
+    _expect(_derive_evm_account(BIP39_VECTORS[0][1], path), (address, private_key), f"{path} 的地址与私钥")
+
+
+@self_check("secp256k1.backends")
+def _check_secp256k1_backends(rounds: int) -> None:
+    """各可用后端之间互相比对（未安装 coincurve 时只有一个后端，跳过）。"""
+    backends = []
+    for factory in SECP256K1_BACKENDS.values():
+        try:
+            backends.append(factory())
+        except ImportError:
+            continue
+    if len(backends) < 2:
+        raise ImportError("只有一个可用的 secp256k1 后端")
+    keys = [(secrets.randbelow(SECP256K1_N - 1) + 1).to_bytes(32, "big") for _ in range(rounds)]
+    expected = backends[0].uncompressed_public_keys(keys)
+    for backend in backends[1:]:
+        _expect(backend.uncompressed_public_keys(keys), expected, f"{backend.name} 与 {backends[0].name} 的公钥")
+
+
+@self_check("key_scan.scan")
+def _check_scan(rounds: int) -> None:
+    # 起点 1 会遇到倍点（Q = 1·G），靠近曲线阶的起点会遇到 Q = -offset，两者都走兜底路径
+    starts = [1, 2, 3, SECP256K1_N - 64, SECP256K1_N - 33]
+    starts += [secrets.randbelow(SECP256K1_N - 64) + 1 for _ in range(rounds)]
+    for start in starts:
+        count = min(64, SECP256K1_N - start)
+        _expect(scan_public_keys(start, count), _backend_pubkeys(start, count), f"起点 {start} 的连续扫描")
+    # 一直扫描到最大合法私钥 n - 1
+    _expect(scan_public_keys(SECP256K1_N - 48, 47), _backend_pubkeys(SECP256K1_N - 48, 47), "扫描至曲线阶前")
+
+
+@self_check("key_scan.batches")
+def _check_scan_batches(rounds: int) -> None:
+    for start in (1, SECP256K1_N - 16 * 5, secrets.randbelow(SECP256K1_N // 2) + 1):
+        batches = iter_public_key_batches(start, 16)
+        for _ in range(max(rounds // 10, 4)):
+            batch = next(batches, None)
+            if batch is None:
+                break
+            first, public_keys = batch
+            _expect(public_keys, _backend_pubkeys(first, 16), f"起点 {start} 的第 {first - start} 号批次")
+    for key in (SECP256K1_N - 1, 0, SECP256K1_N - 10):
+        try:
+            scan_public_keys(key, 16)
+        except ValueError:
+            continue
+        raise AssertionError(f"起点 {key} 超出私钥范围时应抛出 ValueError")
+
+
+def run_checks(
+    rounds: int = DEFAULT_ROUNDS,
+    name_filter: Optional[str] = None,
+    report: Optional[Callable[[str, str], None]] = None,
+) -> List[str]:
+    """运行自检，返回失败项的说明列表；report 接受 (名称, 结果) 用于逐项输出。"""
+    failures = []
+    for name, check in SELF_CHECKS.items():
+        if name_filter and name_filter not in name:
+            continue
+        try:
+            check(rounds)
+        except ImportError as exc:
+            result = f"跳过（{exc}）"
+        except AssertionError as exc:
+            failures.append(f"{name}: {exc}")
+            result = f"失败：{exc}"
+        else:
+            result = "通过"
+        if report:
+            report(name, result)
+    return failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serein 密钥与地址实现自检")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="随机比对轮数")
+    parser.add_argument("-k", "--filter", help="只运行名称包含该子串的检查")
+    parser.add_argument("--backend", choices=sorted(SECP256K1_BACKENDS), help="指定 secp256k1 后端")
+    args = parser.parse_args(argv)
+
+    if args.backend:
+        set_secp256k1_backend(args.backend)
+    failures = run_checks(args.rounds, args.filter, lambda name, result: print(f"{name:<22} {result}"))
+    if failures:
+        print(f"{len(failures)} 项检查未通过")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -55,7 +55,7 @@ QHeaderView::section {
     font-weight: 700;
     font-size: 14px;
 }
-QTableWidget {
+QTableView {
     border-radius: 10px;
 }
 QStatusBar {
@@ -71,7 +71,7 @@ QGroupBox:title { color: #555; }
 QPushButton { background-color: #4b7bec; color: white; }
 QPushButton:hover { background-color: #3a63c7; }
 QLineEdit, QSpinBox, QComboBox { border: 1px solid #d9d9d9; background: #ffffff; }
-QTableWidget { background: #ffffff; border: 1px solid #e5e7eb; gridline-color: #e5e7eb; }
+QTableView { background: #ffffff; border: 1px solid #e5e7eb; gridline-color: #e5e7eb; }
 QHeaderView::section { background: #f0f2f5; border: 1px solid #e5e7eb; }
 QProgressBar { border: 1px solid #d9d9d9; background: #f5f5f5; text-align: center; }
 QProgressBar::chunk { background-color: #52c41a; border-radius: 8px; }
@@ -88,9 +88,9 @@ QGroupBox:title { color: #d7deea; }
 QPushButton { background-color: #3a7bd5; color: #e8ebf0; }
 QPushButton:hover { background-color: #2f68b3; }
 QLineEdit, QSpinBox, QComboBox { border: 1px solid #3b455a; background: #1f2533; color: #e8ebf0; }
-QTableWidget { background: #161b26; border: 1px solid #2f3849; gridline-color: #2f3849; }
+QTableView { background: #161b26; border: 1px solid #2f3849; gridline-color: #2f3849; }
 QHeaderView::section { background: #202836; border: 1px solid #2f3849; color: #d7deea; }
-QTableWidget::item:selected { background: #2f68b3; color: #ffffff; }
+QTableView::item:selected { background: #2f68b3; color: #ffffff; }
 QProgressBar { border: 1px solid #3b455a; background: #1f2533; text-align: center; color: #d7deea; }
 QProgressBar::chunk { background-color: #52c41a; border-radius: 8px; }
 QScrollBar:vertical { background: #1f2533; width: 12px; }
@@ -1,16 +1,20 @@
 """主窗口与界面逻辑，包含生成、复制与主题切换。"""
 
-from typing import List, Optional
+import threading
+from typing import List, Optional, Sequence, Union
 
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QKeySequence
 from PyQt5.QtWidgets import (
+    QAction,
     QApplication,
+    QCheckBox,
     QComboBox,
     QFileDialog,
     QFormLayout,
     QGroupBox,
     QHBoxLayout,
+    QInputDialog,
     QLabel,
     QLineEdit,
     QMainWindow,
@@ -19,39 +23,258 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QSpinBox,
     QStatusBar,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
     QProgressBar,
     QSizePolicy,
 )
 
-from config import MAX_WALLET_COUNT, PRESET_NETWORKS, ChainType, NetworkConfig
-from models import WalletRecord
+from config import (
+    BULK_PREVIEW_ROWS,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_KEYSTORE_KDF_PRESET,
+    DEFAULT_WORKER_COUNT,
+    MAX_BULK_WALLET_COUNT,
+    MAX_WALLET_COUNT,
+    PRESET_NETWORKS,
+    STREAM_CHUNK_SIZE,
+    ChainType,
+    GenerationMode,
+    KEYSTORE_KDF_PRESETS,
+    MAX_VANITY_MATCHES,
+    NetworkConfig,
+)
+from binary_store import BinaryStreamWriter, BinaryWalletReader, estimate_binary_bytes, export_binary, is_binary_path
+from exporters import (
+    CsvStreamWriter,
+    check_disk_space,
+    estimate_csv_bytes,
+    export_csv,
+    export_keystores,
+    iter_chunks,
+)
+from instrumentation import GenerationStats, stage
+from models import WalletRecord, WalletStore
+from progress import ProgressSnapshot, ProgressThrottle, format_duration
 from theme_manager import ThemeName, apply_theme, save_theme
-from wallet_service import generate_wallets, validate_wallet_count, validate_rpc_url
+from vanity import VanityPattern, VanityProgress, expected_seconds, iter_vanity_wallets, make_vanity_pattern
+from wallet_table_model import WalletTableModel
+from wallet_service import (
+    GenerationControl,
+    WorkerPool,
+    iter_wallet_batches,
+    resolve_worker_count,
+    validate_rpc_url,
+    validate_wallet_count,
+    warm_up_backends,
+)
+
+# 保存对话框的文件类型：按扩展名选择 CSV 或二进制（.srw）格式
+EXPORT_FILE_FILTER = "CSV Files (*.csv);;Serein 二进制文件 (*.srw)"
 
 
 class WalletGeneratorWorker(QThread):
     """后台生成钱包的线程，避免阻塞 UI。"""
 
-    progress = pyqtSignal(int, int)
-    finished = pyqtSignal(list)
+    # 已完成数、总数、速率（个/秒）、预计剩余秒数（未知为 -1）
+    progress = pyqtSignal(int, int, float, float)
+    # 靓号搜索进度：已尝试次数、已找到数、速率（次/秒）、以 50% / 90% 把握找到下一个匹配的秒数（未知为 -1）、
+    # 按距上次命中的尝试次数本应已命中的概率
+    vanity_progress = pyqtSignal(int, int, float, float, float, float)
+    # 每生成完一块即推送到界面，便于边生成边展示
+    chunk_ready = pyqtSignal(list)
+    finished = pyqtSignal(int)
     failed = pyqtSignal(str)
 
-    def __init__(self, count: int, network: NetworkConfig, parent=None):
+    def __init__(
+        self,
+        count: int,
+        network: NetworkConfig,
+        workers: int = DEFAULT_WORKER_COUNT,
+        mode: str = GenerationMode.INDEPENDENT,
+        mnemonic: Optional[str] = None,
+        export_path: Optional[str] = None,
+        preview_limit: Optional[int] = None,
+        pool: Optional[WorkerPool] = None,
+        vanity: Optional[VanityPattern] = None,
+        vanity_mnemonic: bool = False,
+        parent=None,
+    ):
         super().__init__(parent)
         self.count = count
         self.network = network
+        self.workers = workers
+        self.mode = mode
+        self.mnemonic = mnemonic
+        self.export_path = export_path
+        # 直写磁盘的批量模式：仅向界面推送前 preview_limit 条作为预览，其余只写入文件
+        self.preview_limit = preview_limit
+        self.pool = pool
+        # 设置了靓号条件时改为搜索模式：count 为需要的匹配数量，每找到一个即作为一块推送
+        self.vanity = vanity
+        self.vanity_mnemonic = vanity_mnemonic
+        self.control = GenerationControl()
+        # 分阶段计时（按块计时，开销可忽略）；界面线程的表格更新也计入其中
+        self.stats = GenerationStats()
+
+    def run(self) -> None:
+        writer: Optional[Union[CsvStreamWriter, BinaryStreamWriter]] = None
+        try:
+            def _publish(snapshot: ProgressSnapshot) -> None:
+                eta = -1.0 if snapshot.eta is None else snapshot.eta
+                self.progress.emit(snapshot.done, snapshot.total, snapshot.rate, eta)
+
+            if self.export_path:
+                # 边生成边写入文件（CSV 或 .srw 二进制），数据无需先进入表格
+                writer_cls = BinaryStreamWriter if is_binary_path(self.export_path) else CsvStreamWriter
+                writer = writer_cls(self.export_path)
+
+            def _publish_vanity(progress: VanityProgress) -> None:
+                etas = [progress.eta(p) for p in (0.5, 0.9)]
+                self.vanity_progress.emit(
+                    progress.attempts,
+                    progress.found,
+                    progress.rate,
+                    *(-1.0 if eta is None else eta for eta in etas),
+                    progress.probability,
+                )
+
+            throttle = ProgressThrottle(self.count, _publish)
+            if self.vanity is not None:
+                matches = iter_vanity_wallets(
+                    self.network,
+                    self.vanity,
+                    self.count,
+                    workers=self.workers,
+                    with_mnemonic=self.vanity_mnemonic,
+                    progress_cb=_publish_vanity,
+                    control=self.control,
+                    pool=self.pool,
+                )
+                batches = ([w] for w in matches)
+            else:
+                batches = iter_wallet_batches(
+                    self.count,
+                    self.network,
+                    progress_cb=throttle.update,
+                    workers=self.workers,
+                    chunk_size=STREAM_CHUNK_SIZE if self.preview_limit is None else DEFAULT_CHUNK_SIZE,
+                    mode=self.mode,
+                    mnemonic=self.mnemonic,
+                    control=self.control,
+                    max_count=MAX_WALLET_COUNT if self.preview_limit is None else MAX_BULK_WALLET_COUNT,
+                    stats=self.stats,
+                    pool=self.pool,
+                )
+            total = 0
+            for batch in batches:
+                if writer is not None:
+                    with self.stats.stage("export", len(batch)):
+                        writer.write_batch(batch)
+                if self.preview_limit is None:
+                    self.chunk_ready.emit(batch)
+                elif total < self.preview_limit:
+                    self.chunk_ready.emit(batch[: self.preview_limit - total])
+                total += len(batch)
+            if writer is not None:
+                writer.commit()
+            self.finished.emit(total)
+        except Exception as exc:  # noqa: BLE001
+            if writer is not None:
+                writer.abort()
+            self.failed.emit(str(exc))
+
+
+class CsvExportWorker(QThread):
+    """
+    后台导出的线程：按批写入临时文件并汇报进度，完成后原子替换目标文件。
+
+    目标扩展名为 .srw 时写二进制格式，否则写 CSV；可只导出 [start, stop) 行。
+    """
+
+    # 已写入行数、总行数、速率（行/秒）、预计剩余秒数（未知为 -1）
+    progress = pyqtSignal(int, int, float, float)
+    finished = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        wallets: Sequence[WalletRecord],
+        path: str,
+        start: int = 0,
+        stop: Optional[int] = None,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.wallets = wallets
+        self.path = path
+        self.start_row = start
+        self.stop_row = len(wallets) if stop is None else min(stop, len(wallets))
+        # 关闭窗口时取消导出，临时文件随之删除
+        self.control = GenerationControl()
 
     def run(self) -> None:
         try:
-            def _cb(done: int) -> None:
-                self.progress.emit(done, self.count)
+            def _publish(snapshot: ProgressSnapshot) -> None:
+                eta = -1.0 if snapshot.eta is None else snapshot.eta
+                self.progress.emit(snapshot.done, snapshot.total, snapshot.rate, eta)
+
+            throttle = ProgressThrottle(max(self.stop_row - self.start_row, 0), _publish)
+            exporter = export_binary if is_binary_path(self.path) else export_csv
+            batches = iter_chunks(self.wallets, start=self.start_row, stop=self.stop_row)
+            rows = exporter(batches, self.path, progress_cb=throttle.update, control=self.control)
+            self.finished.emit(self.path, rows)
+        except Exception as exc:  # noqa: BLE001
+            self.failed.emit(str(exc))
+
+
+class KeystoreExportWorker(QThread):
+    """后台多进程导出 Keystore V3 的线程。"""
 
-            wallets = generate_wallets(self.count, self.network, progress_cb=_cb)
-            self.finished.emit(wallets)
+    # 已加密数量、总数、速率（个/秒）、预计剩余秒数（未知为 -1）
+    progress = pyqtSignal(int, int, float, float)
+    finished = pyqtSignal(str, int)
+    failed = pyqtSignal(str)
+
+    def __init__(
+        self,
+        wallets: Sequence[WalletRecord],
+        out_dir: str,
+        password: str,
+        kdf: str,
+        iterations: int,
+        workers: int,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.wallets = wallets
+        self.out_dir = out_dir
+        self.password = password
+        self.kdf = kdf
+        self.iterations = iterations
+        self.workers = workers
+        # 关闭窗口时在批与批之间停止加密
+        self.control = GenerationControl()
+
+    def run(self) -> None:
+        try:
+            def _publish(snapshot: ProgressSnapshot) -> None:
+                eta = -1.0 if snapshot.eta is None else snapshot.eta
+                self.progress.emit(snapshot.done, snapshot.total, snapshot.rate, eta)
+
+            throttle = ProgressThrottle(len(self.wallets), _publish)
+            count = export_keystores(
+                self.wallets,
+                self.out_dir,
+                self.password,
+                kdf=self.kdf,
+                iterations=self.iterations,
+                workers=self.workers,
+                progress_cb=throttle.update,
+                control=self.control,
+            )
+            self.finished.emit(self.out_dir, count)
         except Exception as exc:  # noqa: BLE001
             self.failed.emit(str(exc))
 
@@ -63,9 +286,14 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.app = app
         self.current_theme: ThemeName = current_theme
-        self.wallets: List[WalletRecord] = []
+        # 当前结果：生成时为内存中的 WalletStore，打开 .srw 文件时为内存映射的只读视图
+        self.wallets: Union[WalletStore, BinaryWalletReader] = WalletStore()
         self.show_private_keys = False
         self.worker: Optional[WalletGeneratorWorker] = None
+        self.export_worker: Optional[CsvExportWorker] = None
+        self.keystore_worker: Optional[KeystoreExportWorker] = None
+        # 启动后预热、各批生成共用的进程池，避免每次点击“开始生成”都冷启动工作进程
+        self.worker_pool = WorkerPool()
 
         self.setWindowTitle("Serein - Web3 钱包批量创建器")
         self.setMinimumSize(1200, 820)
@@ -74,6 +302,8 @@ class MainWindow(QMainWindow):
         self._setup_ui()
         self._init_menu()
         self._set_status("本地离线生成，准备就绪")
+        # 窗口显示后再在后台预热，不拖慢首屏
+        QTimer.singleShot(0, self._warm_up)
 
     # ------------------------- UI 构建 ------------------------- #
     def _setup_ui(self) -> None:
@@ -107,9 +337,41 @@ class MainWindow(QMainWindow):
         self.network_combo = QComboBox()
         for net in PRESET_NETWORKS:
             self.network_combo.addItem(net.name)
-        self.network_combo.currentIndexChanged.connect(self._on_network_change)
         form_layout.addRow("选择网络", self.network_combo)
 
+        self.workers_input = QSpinBox()
+        self.workers_input.setRange(1, resolve_worker_count(0))
+        self.workers_input.setValue(DEFAULT_WORKER_COUNT)
+        self.workers_input.setToolTip("大于 1 时使用多进程并行生成，可充分利用多核 CPU")
+        form_layout.addRow("并行进程数", self.workers_input)
+        # 进程数调整停顿片刻后再按新大小预热进程池，避免连续点击时反复重建
+        self._pool_resize_timer = QTimer(self)
+        self._pool_resize_timer.setSingleShot(True)
+        self._pool_resize_timer.setInterval(500)
+        self._pool_resize_timer.timeout.connect(self._warm_up_pool)
+        self.workers_input.valueChanged.connect(self._pool_resize_timer.start)
+
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("每个钱包独立助记词", GenerationMode.INDEPENDENT)
+        self.mode_combo.addItem("同一助记词派生多个地址", GenerationMode.SHARED_MNEMONIC)
+        self.mode_combo.currentIndexChanged.connect(self._on_mode_change)
+        form_layout.addRow("生成模式", self.mode_combo)
+
+        self.shared_mnemonic_input = QLineEdit()
+        self.shared_mnemonic_input.setPlaceholderText("可选：填写已有助记词，留空则自动生成新的助记词")
+        self.shared_mnemonic_input.setEchoMode(QLineEdit.Password)
+        self.shared_mnemonic_input.setEnabled(False)
+        form_layout.addRow("共享助记词", self.shared_mnemonic_input)
+
+        self.stream_export_check = QCheckBox("生成时同步写入 CSV 文件（开始前选择保存路径）")
+        form_layout.addRow("同步导出", self.stream_export_check)
+
+        self.bulk_check = QCheckBox(
+            f"直写磁盘批量模式：结果只写入 CSV，表格仅保留前 {BULK_PREVIEW_ROWS} 条预览，数量仅受磁盘空间限制"
+        )
+        self.bulk_check.toggled.connect(self._on_bulk_toggled)
+        form_layout.addRow("批量模式", self.bulk_check)
+
         self.custom_group = QGroupBox("自定义网络配置（可选，仅作标记，不会联网）")
         custom_layout = QFormLayout()
         self.custom_group.setLayout(custom_layout)
@@ -124,6 +386,34 @@ class MainWindow(QMainWindow):
         self.custom_group.setVisible(False)
         main_layout.addWidget(self.custom_group)
 
+        self.vanity_group = QGroupBox("靓号搜索（勾选后“批量钱包数量”为需要找到的地址个数）")
+        self.vanity_group.setCheckable(True)
+        self.vanity_group.setChecked(False)
+        self.vanity_group.toggled.connect(self._on_vanity_toggled)
+        vanity_layout = QFormLayout()
+        self.vanity_group.setLayout(vanity_layout)
+        self.vanity_prefix = QLineEdit()
+        self.vanity_prefix.setPlaceholderText("地址开头：EVM 为十六进制（可带 0x），Solana 为 Base58")
+        self.vanity_suffix = QLineEdit()
+        self.vanity_suffix.setPlaceholderText("地址结尾，如 beef")
+        self.vanity_case_check = QCheckBox("区分大小写（EVM 按 EIP-55 校验格式匹配；Solana 不区分时匹配任意大小写组合）")
+        self.vanity_mnemonic_check = QCheckBox("由助记词派生（结果可用助记词恢复，但每次尝试含 PBKDF2，速度慢得多）")
+        self.vanity_difficulty_label = QLabel()
+        for widget in (self.vanity_prefix, self.vanity_suffix):
+            widget.textChanged.connect(self._update_vanity_difficulty)
+        self.vanity_case_check.toggled.connect(self._update_vanity_difficulty)
+        vanity_layout.addRow("前缀", self.vanity_prefix)
+        vanity_layout.addRow("后缀", self.vanity_suffix)
+        vanity_layout.addRow("", self.vanity_case_check)
+        vanity_layout.addRow("", self.vanity_mnemonic_check)
+        vanity_layout.addRow("预计难度", self.vanity_difficulty_label)
+        main_layout.addWidget(self.vanity_group)
+        # 最近一次搜索的速率，用于估算新条件的耗时
+        self._vanity_rate = 0.0
+        self._update_vanity_difficulty()
+        # 靓号区域创建后再连接，网络切换时需要按新链类型重新估算难度
+        self.network_combo.currentIndexChanged.connect(self._on_network_change)
+
         btn_layout = QHBoxLayout()
         btn_layout.setAlignment(Qt.AlignLeft)
         main_layout.addLayout(btn_layout)
@@ -132,10 +422,25 @@ class MainWindow(QMainWindow):
         self.start_btn.clicked.connect(self._start_generation)
         btn_layout.addWidget(self.start_btn)
 
+        self.pause_btn = QPushButton("暂停")
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.clicked.connect(self._toggle_pause)
+        btn_layout.addWidget(self.pause_btn)
+
+        self.stop_btn = QPushButton("停止")
+        self.stop_btn.setEnabled(False)
+        self.stop_btn.clicked.connect(self._stop_generation)
+        btn_layout.addWidget(self.stop_btn)
+
         self.export_btn = QPushButton("导出为 CSV")
         self.export_btn.clicked.connect(self._export_csv)
         btn_layout.addWidget(self.export_btn)
 
+        self.keystore_btn = QPushButton("导出加密 Keystore")
+        self.keystore_btn.setToolTip("使用口令加密，每个 EVM 钱包导出一个 Web3 Secret Storage（V3）JSON 文件")
+        self.keystore_btn.clicked.connect(self._export_keystores)
+        btn_layout.addWidget(self.keystore_btn)
+
         self.clear_btn = QPushButton("清空列表")
         self.clear_btn.clicked.connect(self._clear_wallets)
         btn_layout.addWidget(self.clear_btn)
@@ -158,23 +463,43 @@ class MainWindow(QMainWindow):
         self.progress_bar.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
         main_layout.addWidget(self.progress_bar)
 
-        self.table = QTableWidget(0, 8)
-        self.table.setHorizontalHeaderLabels(
-            ["操作", "序号", "链类型", "网络", "地址", "助记词", "派生路径", "私钥/密钥"]
-        )
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table_model = WalletTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
+        self.table.setSelectionBehavior(QTableView.SelectRows)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setDefaultSectionSize(210)
         self.table.verticalHeader().setVisible(False)
+        self.table.setToolTip("右键行可复制地址/助记词/私钥，也可使用快捷键")
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_table_menu)
+        self._init_copy_actions()
         main_layout.addWidget(self.table)
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        # 上一次生成的分阶段耗时摘要，悬停查看明细
+        self.stats_label = QLabel()
+        self.status_bar.addPermanentWidget(self.stats_label)
 
     def _init_menu(self) -> None:
-        """初始化菜单栏（主题切换）。"""
+        """初始化菜单栏（文件操作与主题切换）。"""
         menu_bar = self.menuBar()
+        file_menu: QMenu = menu_bar.addMenu("文件")
+        open_action = file_menu.addAction("打开二进制文件…")
+        open_action.setShortcut(QKeySequence.Open)
+        open_action.triggered.connect(self._open_binary_file)
+        export_range_action = file_menu.addAction("导出行范围…")
+        export_range_action.triggered.connect(self._export_row_range)
+        file_menu.addSeparator()
+        find_action = file_menu.addAction("查找地址…")
+        find_action.setShortcut(QKeySequence.Find)
+        find_action.triggered.connect(self._find_address)
+        goto_action = file_menu.addAction("按序号定位…")
+        goto_action.setShortcut(QKeySequence("Ctrl+G"))
+        goto_action.triggered.connect(self._goto_wallet_index)
+
         view_menu: QMenu = menu_bar.addMenu("视图")
         theme_menu = view_menu.addMenu("主题")
 
@@ -193,12 +518,63 @@ class MainWindow(QMainWindow):
         """当网络选择变化时，决定是否显示自定义配置。"""
         net = PRESET_NETWORKS[index]
         self.custom_group.setVisible(net.is_custom)
+        self._update_vanity_difficulty()
+
+    def _on_mode_change(self, index: int) -> None:
+        """仅在共享助记词模式下允许填写助记词。"""
+        self.shared_mnemonic_input.setEnabled(self.mode_combo.itemData(index) == GenerationMode.SHARED_MNEMONIC)
+
+    def _on_bulk_toggled(self, checked: bool) -> None:
+        """批量模式下放宽数量上限，并强制同步写入文件。"""
+        self.count_input.setRange(1, MAX_BULK_WALLET_COUNT if checked else MAX_WALLET_COUNT)
+        if checked:
+            self.stream_export_check.setChecked(True)
+        self.stream_export_check.setEnabled(not checked)
+
+    def _on_vanity_toggled(self, checked: bool) -> None:
+        """靓号搜索模式下数量表示匹配个数；生成模式与直写磁盘批量模式不适用。"""
+        if checked:
+            self.bulk_check.setChecked(False)
+        self.count_input.setRange(1, MAX_VANITY_MATCHES if checked else MAX_WALLET_COUNT)
+        self.bulk_check.setEnabled(not checked)
+        self.mode_combo.setEnabled(not checked)
+        self.shared_mnemonic_input.setEnabled(
+            not checked and self.mode_combo.currentData() == GenerationMode.SHARED_MNEMONIC
+        )
+
+    def _vanity_pattern(self) -> VanityPattern:
+        """按所选网络的链类型构造靓号条件。"""
+        return make_vanity_pattern(
+            PRESET_NETWORKS[self.network_combo.currentIndex()].chain_type,
+            self.vanity_prefix.text(),
+            self.vanity_suffix.text(),
+            self.vanity_case_check.isChecked(),
+        )
+
+    def _update_vanity_difficulty(self) -> None:
+        """根据当前条件显示期望尝试次数，并按最近一次搜索速率估算耗时。"""
+        try:
+            difficulty = self._vanity_pattern().difficulty
+        except ValueError as exc:
+            self.vanity_difficulty_label.setText(str(exc))
+            return
+        text = f"约 1/{difficulty:,}，平均需尝试 {difficulty:,} 次"
+        seconds = expected_seconds(difficulty, self._vanity_rate)
+        if seconds is not None:
+            text += f"，按上次速率 {self._vanity_rate:,.0f} 次/秒约需 {format_duration(seconds)}"
+        self.vanity_difficulty_label.setText(text)
 
     def _start_generation(self) -> None:
         """启动生成流程。"""
         count = int(self.count_input.value())
+        bulk = self.bulk_check.isChecked()
+        vanity: Optional[VanityPattern] = None
         try:
-            validate_wallet_count(count, MAX_WALLET_COUNT)
+            if self.vanity_group.isChecked():
+                vanity = self._vanity_pattern()
+                validate_wallet_count(count, MAX_VANITY_MATCHES)
+            else:
+                validate_wallet_count(count, MAX_BULK_WALLET_COUNT if bulk else MAX_WALLET_COUNT)
         except ValueError as exc:
             QMessageBox.warning(self, "输入错误", str(exc))
             return
@@ -222,94 +598,190 @@ class MainWindow(QMainWindow):
                 derivation_path_template=net.derivation_path_template,
             )
 
+        mode = self.mode_combo.currentData()
+        mnemonic = self.shared_mnemonic_input.text().strip() or None
+        if mode != GenerationMode.SHARED_MNEMONIC:
+            mnemonic = None
+
+        export_path: Optional[str] = None
+        if bulk or self.stream_export_check.isChecked():
+            export_path, _ = QFileDialog.getSaveFileName(self, "同步导出", "wallets.csv", EXPORT_FILE_FILTER)
+            if not export_path:
+                return
+            if is_binary_path(export_path):
+                required = estimate_binary_bytes(count)
+            else:
+                required = estimate_csv_bytes(count, network_to_use.chain_type)
+            try:
+                check_disk_space(export_path, required)
+            except OSError as exc:
+                QMessageBox.warning(self, "空间不足", str(exc))
+                return
+
         self.start_btn.setEnabled(False)
-        self._set_status("正在生成，请稍候…（离线本地生成，每个钱包独立助记词）")
+        self.clear_btn.setEnabled(False)
+        self.pause_btn.setEnabled(True)
+        self.pause_btn.setText("暂停")
+        self.stop_btn.setEnabled(True)
+        # 新批次从空表开始，生成过程中逐块追加
+        self.wallets = WalletStore()
+        self._refresh_table()
+        if vanity is not None:
+            self._set_status(f"正在搜索靓号，平均每个需尝试 {vanity.difficulty:,} 次…（离线本地生成）")
+        elif mode == GenerationMode.SHARED_MNEMONIC:
+            self._set_status("正在生成，请稍候…（离线本地生成，同一助记词按序号派生地址）")
+        else:
+            self._set_status("正在生成，请稍候…（离线本地生成，每个钱包独立助记词）")
         self.progress_bar.setRange(0, count)
         self.progress_bar.setValue(0)
 
-        self.worker = WalletGeneratorWorker(count, network_to_use)
+        self.worker = WalletGeneratorWorker(
+            count,
+            network_to_use,
+            workers=int(self.workers_input.value()),
+            mode=mode,
+            mnemonic=mnemonic,
+            export_path=export_path,
+            preview_limit=BULK_PREVIEW_ROWS if bulk else None,
+            pool=self.worker_pool,
+            vanity=vanity,
+            vanity_mnemonic=self.vanity_mnemonic_check.isChecked(),
+        )
         self.worker.progress.connect(self._on_progress)
+        self.worker.vanity_progress.connect(self._on_vanity_progress)
+        self.worker.chunk_ready.connect(self._on_chunk_ready)
         self.worker.finished.connect(self._on_finished)
         self.worker.failed.connect(self._on_failed)
         self.worker.start()
 
-    def _on_progress(self, done: int, total: int) -> None:
-        """更新进度条。"""
+    def _on_progress(self, done: int, total: int, rate: float, eta: float) -> None:
+        """更新进度条与速率/剩余时间。"""
         self.progress_bar.setValue(done)
-        self._set_status(f"正在生成 {done}/{total}（离线）")
+        remaining = format_duration(eta if eta >= 0 else None)
+        self._set_status(f"正在生成 {done}/{total}，{rate:,.0f} 个/秒，剩余约 {remaining}（离线）")
+
+    def _on_vanity_progress(
+        self, attempts: int, found: int, rate: float, eta_half: float, eta_most: float, probability: float
+    ) -> None:
+        """靓号搜索进度：进度条按已找到个数推进，状态栏显示尝试速率与按概率估算的剩余时间。"""
+        self.progress_bar.setValue(found)
+        self._vanity_rate = rate
+        half, most = (format_duration(eta if eta >= 0 else None) for eta in (eta_half, eta_most))
+        self._set_status(
+            f"靓号搜索：已尝试 {attempts:,} 次，{rate:,.0f} 次/秒，已找到 {found}/{self.progress_bar.maximum()}；"
+            f"下一个 50% 把握约 {half}，90% 把握约 {most}（本应已命中的概率 {probability:.0%}，离线）"
+        )
 
-    def _on_finished(self, wallets: List[WalletRecord]) -> None:
-        """生成完成后处理数据。"""
-        self.wallets = wallets
-        self._refresh_table()
-        self._set_status(f"生成完成，共 {len(wallets)} 个。（离线）")
-        self.start_btn.setEnabled(True)
-        self.worker = None
+    def _on_chunk_ready(self, batch: List[WalletRecord]) -> None:
+        """将新生成的一块追加到表格，首块到达时按内容估算列宽。"""
+        first_chunk = not self.wallets
+        with stage(self.worker.stats if self.worker else None, "ui", len(batch)):
+            self.table_model.append_wallets(batch)
+        if first_chunk:
+            self._fit_columns()
+
+    def _toggle_pause(self) -> None:
+        """暂停或继续当前生成任务（在块与块之间生效）。"""
+        if self.worker is None:
+            return
+        control = self.worker.control
+        if control.paused:
+            control.resume()
+            self.pause_btn.setText("暂停")
+            self._set_status("已继续生成")
+        else:
+            control.pause()
+            self.pause_btn.setText("继续")
+            self._set_status("已暂停，当前块完成后停止推进")
+
+    def _stop_generation(self) -> None:
+        """停止当前生成任务，已生成的结果保留在表格中。"""
+        if self.worker is None:
+            return
+        self.worker.control.cancel()
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        self._set_status("正在停止…")
+
+    def _on_finished(self, total: int) -> None:
+        """生成完成（或被停止）后处理数据，并在状态栏展示分阶段耗时摘要。"""
+        self._fit_columns()
+        if self.worker is not None and self.worker.vanity is not None:
+            self._update_vanity_difficulty()
+        elif self.worker is not None:
+            self.stats_label.setText(self.worker.stats.summary(top=3))
+            self.stats_label.setToolTip(self.worker.stats.report())
+        export_note = f"，已写入 {self.worker.export_path}" if self.worker and self.worker.export_path else ""
+        if self.worker is not None and self.worker.control.cancelled:
+            self._set_status(f"已停止，保留已生成的 {total} 个{export_note}。（离线）")
+        else:
+            self._set_status(f"生成完成，共 {total} 个{export_note}。（离线）")
+        self._on_worker_done()
 
     def _on_failed(self, message: str) -> None:
-        """错误处理。"""
+        """错误处理，已生成的部分保留在表格中。"""
         QMessageBox.critical(self, "生成失败", message)
         self._set_status("生成失败")
+        self._on_worker_done()
+
+    def _on_worker_done(self) -> None:
+        """生成线程结束后恢复按钮状态。"""
         self.start_btn.setEnabled(True)
+        self.clear_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
+        self.pause_btn.setText("暂停")
+        self.stop_btn.setEnabled(False)
         self.worker = None
 
     def _refresh_table(self) -> None:
-        """根据当前钱包列表刷新表格。"""
-        self.table.setRowCount(len(self.wallets))
-        for row, w in enumerate(self.wallets):
-            # 操作列：复制按钮置于最左列
-            action_cell = self._build_action_buttons(row)
-            self.table.setCellWidget(row, 0, action_cell)
-
-            items = [
-                (1, QTableWidgetItem(str(w.index))),
-                (2, QTableWidgetItem(self._display_chain_type(w.chain_type))),
-                (3, QTableWidgetItem(w.network)),
-                (4, QTableWidgetItem(w.address)),
-                (5, QTableWidgetItem(w.mnemonic)),
-                (6, QTableWidgetItem(w.derivation_path)),
-                (7, QTableWidgetItem(self._mask_value(w.private_key))),
-            ]
-            for col, item in items:
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                self.table.setItem(row, col, item)
-
-        self.table.resizeColumnsToContents()
-        self.table.horizontalHeader().setStretchLastSection(True)
+        """根据当前钱包列表刷新表格（模型按需生成单元格，列宽按采样估算）。"""
+        self.table_model.set_wallets(self.wallets)
+        self._fit_columns()
+
+    def _fit_columns(self) -> None:
+        """按采样行估算列宽。"""
+        header = self.table.horizontalHeader()
+        for col, width in enumerate(self.table_model.sample_column_widths(self.table.fontMetrics())):
+            header.resizeSection(col, width)
+        header.setStretchLastSection(True)
+
+    def _init_copy_actions(self) -> None:
+        """创建作用于当前选中行的复制动作（右键菜单与快捷键共用），不再为每行创建按钮。"""
+        self.copy_actions: List[QAction] = []
+        specs = [
+            ("复制地址", "address", QKeySequence.Copy),
+            ("复制助记词", "mnemonic", QKeySequence("Ctrl+Shift+M")),
+            ("复制私钥", "private_key", QKeySequence("Ctrl+Shift+K")),
+        ]
+        for text, field, shortcut in specs:
+            action = QAction(text, self.table)
+            action.setShortcut(shortcut)
+            action.setShortcutContext(Qt.WidgetWithChildrenShortcut)
+            action.triggered.connect(lambda _, f=field: self._copy_selected_field(f))
+            self.table.addAction(action)
+            self.copy_actions.append(action)
+
+    def _show_table_menu(self, pos) -> None:
+        """在表格中右键时弹出复制菜单，作用于光标所在行。"""
+        index = self.table.indexAt(pos)
+        if not index.isValid():
+            return
+        self.table.selectRow(index.row())
+        menu = QMenu(self.table)
+        menu.addActions(self.copy_actions)
+        menu.exec_(self.table.viewport().mapToGlobal(pos))
 
-    def _build_action_buttons(self, row: int) -> QWidget:
-        """为指定行创建复制按钮组。"""
-        container = QWidget()
-        layout = QHBoxLayout(container)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(6)
-
-        btn_addr = QPushButton("复制地址")
-        btn_addr.setToolTip("复制钱包地址到剪贴板")
-        btn_addr.setProperty("row", row)
-        btn_addr.clicked.connect(lambda _, r=row: self._copy_field(r, "address"))
-        layout.addWidget(btn_addr)
-
-        btn_mnemonic = QPushButton("复制助记词")
-        btn_mnemonic.setToolTip("复制助记词，请勿泄露")
-        btn_mnemonic.setProperty("row", row)
-        btn_mnemonic.clicked.connect(lambda _, r=row: self._copy_field(r, "mnemonic"))
-        layout.addWidget(btn_mnemonic)
-
-        btn_priv = QPushButton("复制私钥")
-        btn_priv.setToolTip("复制私钥/密钥，注意保密")
-        btn_priv.setProperty("row", row)
-        btn_priv.clicked.connect(lambda _, r=row: self._copy_field(r, "private_key"))
-        layout.addWidget(btn_priv)
-
-        layout.addStretch()
-        return container
+    def _copy_selected_field(self, field: str) -> None:
+        """复制当前选中行的指定字段。"""
+        index = self.table.currentIndex()
+        if index.isValid():
+            self._copy_field(index.row(), field)
 
     def _copy_field(self, row: int, field: str) -> None:
         """将指定行的字段复制到剪贴板。"""
-        if row >= len(self.wallets):
+        wallet = self.table_model.wallet_at(row)
+        if wallet is None:
             return
-        wallet = self.wallets[row]
         value = getattr(wallet, field, "")
         QApplication.clipboard().setText(value)
         if field == "address":
@@ -320,59 +792,213 @@ class MainWindow(QMainWindow):
             msg = "私钥/密钥已复制，请勿泄露"
         self._set_status(msg)
 
-    def _mask_value(self, value: str) -> str:
-        """根据开关返回显示值。"""
-        if self.show_private_keys:
-            return value
-        return "**************"
-
     def _toggle_private_keys(self) -> None:
         """切换私钥显示状态。"""
         self.show_private_keys = not self.show_private_keys
         self.toggle_key_btn.setText("隐藏私钥" if self.show_private_keys else "显示私钥")
         # 刷新私钥列
-        for row, w in enumerate(self.wallets):
-            item = self.table.item(row, 7)
-            if item:
-                item.setText(self._mask_value(w.private_key))
+        self.table_model.set_show_private_keys(self.show_private_keys)
 
     def _export_csv(self) -> None:
-        """导出为 CSV 文件。"""
+        """在后台线程中导出为 CSV 文件（或 .srw 二进制文件）。"""
+        if not self.wallets:
+            QMessageBox.information(self, "提示", "当前没有可导出的钱包记录。")
+            return
+        self._start_export(0, len(self.wallets))
+
+    def _export_row_range(self) -> None:
+        """只导出指定的行范围（默认取当前选中行的首尾），适合从大文件中摘取一段。"""
+        if not self.wallets:
+            QMessageBox.information(self, "提示", "当前没有可导出的钱包记录。")
+            return
+        ranges = self.table.selectionModel().selection()
+        if ranges.isEmpty():
+            first, last = 1, len(self.wallets)
+        else:
+            first = min(r.top() for r in ranges) + 1
+            last = max(r.bottom() for r in ranges) + 1
+        text, ok = QInputDialog.getText(self, "导出行范围", f"行号范围（1-{len(self.wallets)}）：", text=f"{first}-{last}")
+        if not ok:
+            return
+        try:
+            start_text, _, stop_text = text.partition("-")
+            start, stop = int(start_text) - 1, int(stop_text or start_text)
+        except ValueError:
+            QMessageBox.warning(self, "输入错误", "请按“起始行-结束行”的格式填写，例如 1-1000。")
+            return
+        if not 0 <= start < stop <= len(self.wallets):
+            QMessageBox.warning(self, "输入错误", f"行号范围需在 1-{len(self.wallets)} 之间。")
+            return
+        self._start_export(start, stop)
+
+    def _start_export(self, start: int, stop: int) -> None:
+        """选择目标文件并启动后台导出 [start, stop) 行。"""
+        path, _ = QFileDialog.getSaveFileName(self, "导出", "wallets.csv", EXPORT_FILE_FILTER)
+        if not path:
+            return
+        self.export_btn.setEnabled(False)
+        self._set_status("正在后台导出…")
+        # 存储只追加、清空时整体替换，导出按开始时的行数切分，期间继续生成/清空不影响本次导出
+        self.export_worker = CsvExportWorker(self.wallets, path, start, stop)
+        self.export_worker.progress.connect(self._on_export_progress)
+        self.export_worker.finished.connect(self._on_export_finished)
+        self.export_worker.failed.connect(self._on_export_failed)
+        self.export_worker.start()
+
+    def _on_export_progress(self, done: int, total: int, rate: float, eta: float) -> None:
+        """更新导出进度。"""
+        remaining = format_duration(eta if eta >= 0 else None)
+        self._set_status(f"正在导出 {done}/{total}，{rate:,.0f} 行/秒，剩余约 {remaining}")
+
+    def _on_export_finished(self, path: str, rows: int) -> None:
+        """导出完成。"""
+        self.export_btn.setEnabled(True)
+        self.export_worker = None
+        self._set_status(f"已导出 {rows} 行")
+        QMessageBox.information(self, "导出成功", f"已导出到 {path}")
+
+    def _on_export_failed(self, message: str) -> None:
+        """导出失败（临时文件已清理，目标文件保持原样）。"""
+        self.export_btn.setEnabled(True)
+        self.export_worker = None
+        QMessageBox.critical(self, "导出失败", message)
+
+    def _export_keystores(self) -> None:
+        """询问口令与 KDF 强度后，在后台多进程导出 Keystore V3 文件。"""
         if not self.wallets:
             QMessageBox.information(self, "提示", "当前没有可导出的钱包记录。")
             return
-        path, _ = QFileDialog.getSaveFileName(self, "导出 CSV", "wallets.csv", "CSV Files (*.csv)")
+        if self.wallets.field(0, "chain_type") != ChainType.EVM:
+            QMessageBox.warning(self, "不支持", "Keystore V3 仅支持 EVM 钱包。")
+            return
+        password, ok = QInputDialog.getText(self, "Keystore 口令", "请输入加密口令：", QLineEdit.Password)
+        if not ok or not password:
+            return
+        confirm, ok = QInputDialog.getText(self, "Keystore 口令", "请再次输入口令：", QLineEdit.Password)
+        if not ok:
+            return
+        if confirm != password:
+            QMessageBox.warning(self, "输入错误", "两次输入的口令不一致。")
+            return
+        presets = list(KEYSTORE_KDF_PRESETS)
+        preset, ok = QInputDialog.getItem(
+            self, "KDF 强度", "强度越高越安全，导出越慢：", presets, presets.index(DEFAULT_KEYSTORE_KDF_PRESET), False
+        )
+        if not ok:
+            return
+        out_dir = QFileDialog.getExistingDirectory(self, "选择 Keystore 导出目录")
+        if not out_dir:
+            return
+
+        kdf, iterations = KEYSTORE_KDF_PRESETS[preset]
+        self.keystore_btn.setEnabled(False)
+        self._set_status("正在后台加密导出 Keystore…")
+        # KDF 刻意昂贵，使用全部 CPU 核心（scrypt 时由 export_keystores 按内存封顶），与生成的进程数设置无关
+        self.keystore_worker = KeystoreExportWorker(self.wallets, out_dir, password, kdf, iterations, workers=0)
+        self.keystore_worker.progress.connect(self._on_keystore_progress)
+        self.keystore_worker.finished.connect(self._on_keystore_finished)
+        self.keystore_worker.failed.connect(self._on_keystore_failed)
+        self.keystore_worker.start()
+
+    def _on_keystore_progress(self, done: int, total: int, rate: float, eta: float) -> None:
+        """更新 Keystore 导出进度。"""
+        remaining = format_duration(eta if eta >= 0 else None)
+        self._set_status(f"正在加密导出 {done}/{total}，{rate:,.1f} 个/秒，剩余约 {remaining}")
+
+    def _on_keystore_finished(self, out_dir: str, count: int) -> None:
+        """Keystore 导出完成。"""
+        self.keystore_btn.setEnabled(True)
+        self.keystore_worker = None
+        self._set_status(f"已导出 {count} 个 Keystore 文件")
+        QMessageBox.information(self, "导出成功", f"已导出 {count} 个 Keystore 文件到 {out_dir}")
+
+    def _on_keystore_failed(self, message: str) -> None:
+        """Keystore 导出失败。"""
+        self.keystore_btn.setEnabled(True)
+        self.keystore_worker = None
+        QMessageBox.critical(self, "导出失败", message)
+
+    def _open_binary_file(self) -> None:
+        """以内存映射方式打开 .srw 文件并在表格中浏览，不把记录读入内存。"""
+        if self.worker is not None:
+            QMessageBox.information(self, "提示", "请等待当前生成任务结束后再打开文件。")
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "打开二进制文件", "", "Serein 二进制文件 (*.srw)")
         if not path:
             return
         try:
-            import csv
-
-            with open(path, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f)
-                writer.writerow(["序号", "链类型", "网络", "地址", "助记词", "派生路径", "私钥/密钥"])
-                for w in self.wallets:
-                    writer.writerow(
-                        [
-                            w.index,
-                            self._display_chain_type(w.chain_type),
-                            w.network,
-                            w.address,
-                            w.mnemonic,
-                            w.derivation_path,
-                            w.private_key,
-                        ]
-                    )
-            QMessageBox.information(self, "导出成功", f"已导出到 {path}")
-        except Exception as exc:  # noqa: BLE001
-            QMessageBox.critical(self, "导出失败", str(exc))
+            reader = BinaryWalletReader(path)
+        except (OSError, ValueError) as exc:
+            QMessageBox.critical(self, "打开失败", str(exc))
+            return
+        # 旧数据源可能仍被后台导出引用，不主动关闭，由引用释放后自动回收
+        self.wallets = reader
+        self._refresh_table()
+        self.progress_bar.setValue(0)
+        self._set_status(f"已打开 {path}，共 {len(reader)} 条记录")
+
+    def _find_address(self) -> None:
+        """按地址查找并选中对应行（.srw 文件带索引时为二分查找）。"""
+        if not self.wallets:
+            QMessageBox.information(self, "提示", "当前没有钱包记录。")
+            return
+        address, ok = QInputDialog.getText(self, "查找地址", "地址：")
+        if not ok or not address.strip():
+            return
+        try:
+            row = self.wallets.find_address(address)
+        except ValueError as exc:
+            QMessageBox.warning(self, "输入错误", str(exc))
+            return
+        self._select_found_row(row, "未找到该地址。")
+
+    def _goto_wallet_index(self) -> None:
+        """按钱包序号定位到对应行。"""
+        if not self.wallets:
+            QMessageBox.information(self, "提示", "当前没有钱包记录。")
+            return
+        wallet_index, ok = QInputDialog.getInt(self, "按序号定位", "钱包序号：", 1, 0, 2**31 - 1)
+        if ok:
+            self._select_found_row(self.wallets.find_wallet_index(wallet_index), "未找到该序号。")
+
+    def _select_found_row(self, row: Optional[int], not_found: str) -> None:
+        if row is None:
+            QMessageBox.information(self, "未找到", not_found)
+            return
+        self.table.selectRow(row)
+        self.table.scrollTo(self.table_model.index(row, 0), QTableView.PositionAtCenter)
+        self._set_status(f"已定位到第 {row + 1} 行")
 
     def _clear_wallets(self) -> None:
         """清空列表。"""
-        self.wallets = []
-        self.table.setRowCount(0)
+        self.wallets = WalletStore()
+        self.table_model.set_wallets(self.wallets)
         self.progress_bar.setValue(0)
         self._set_status("已清空列表")
 
+    def _warm_up(self) -> None:
+        """在后台线程中预先加载本进程的链后端（单进程生成直接受益），并按当前进程数预热进程池。"""
+        threading.Thread(target=warm_up_backends, name="warm-up", daemon=True).start()
+        self._warm_up_pool()
+
+    def _warm_up_pool(self) -> None:
+        """按当前进程数在后台创建或调整预热进程池；生成进行中时不调整。"""
+        workers = int(self.workers_input.value())
+        if workers <= 1 or self.worker is not None:
+            return
+        threading.Thread(target=self.worker_pool.resize, args=(workers,), name="pool-warm-up", daemon=True).start()
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        """关闭窗口时停止生成与导出（导出的临时文件随之删除），然后关闭进程池。"""
+        for worker in (self.worker, self.export_worker, self.keystore_worker):
+            if worker is not None:
+                # 窗口已关闭，不再处理完成/失败信号
+                worker.blockSignals(True)
+                worker.control.cancel()
+                worker.wait()
+        self.worker_pool.shutdown()
+        super().closeEvent(event)
+
     def _set_status(self, text: str) -> None:
         """更新底部状态文本。"""
         self.status_bar.showMessage(text, 3000)
@@ -394,11 +1020,6 @@ class MainWindow(QMainWindow):
         self.light_action.setChecked(self.current_theme == "light")
         self.dark_action.setChecked(self.current_theme == "dark")
 
-    @staticmethod
-    def _display_chain_type(chain_type: str) -> str:
-        """将内部链类型值转换为中文标签。"""
-        return "Solana 链" if chain_type == ChainType.SOLANA else "EVM 链"
-
     def _update_theme_toggle_text(self) -> None:
         """根据当前主题更新切换按钮文本。"""
         if self.current_theme == "dark":
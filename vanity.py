@@ -0,0 +1,499 @@
+"""
+靓号地址搜索：多进程随机生成密钥，直到地址匹配指定的前缀/后缀（EVM 十六进制，Solana Base58）。
+
+两条链都不为每个候选生成完整地址文本：
+- EVM 随机私钥模式按批连续扫描（见 key_scan.py，点加 + 批量求逆代替逐个标量乘法），
+  在原始地址字节的小写十六进制上比较，只有命中的少数候选才计算 EIP-55 校验格式；
+- Solana 把 Base58 前缀换算为公钥整数的取值区间、后缀换算为对 58^n 的余数，候选只需一次二分与一次取模，
+  命中后才做 Base58 编码并复核。
+结果仍是 WalletRecord，可沿用表格与导出流程。
+"""
+
+import itertools
+import math
+import secrets
+import time
+from bisect import bisect_right
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+
+from address_encoding import B58_ALPHABET, _load_keccak256, b58encode, to_checksum_addresses
+from config import (
+    DEFAULT_WORKER_COUNT,
+    MAX_VANITY_MATCHES,
+    PROGRESS_INTERVAL_SECONDS,
+    VANITY_KEY_BATCH_SIZE,
+    VANITY_MNEMONIC_BATCH_SIZE,
+    ChainType,
+    NetworkConfig,
+)
+from key_scan import scan_public_keys
+from models import WalletRecord
+from wallet_service import (
+    SECP256K1_N,
+    GenerationControl,
+    WorkerPool,
+    _derive_account_node,
+    _derive_leaf_key,
+    _generate_mnemonic,
+    _resolve_path_template,
+    _seed_from_mnemonic,
+    _slip10_derive_ed25519,
+    ed25519_keypairs,
+    get_secp256k1_backend,
+    new_process_pool,
+    resolve_worker_count,
+    validate_wallet_count,
+)
+
+_HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+_EVM_ADDRESS_HEX_LENGTH = 40
+
+_B58_CHARS = frozenset(B58_ALPHABET)
+_B58_VALUES = {c: i for i, c in enumerate(B58_ALPHABET)}
+# 32 字节公钥的 Base58 地址最多 44 位
+_SOLANA_ADDRESS_MAX_LENGTH = 44
+_SOLANA_KEY_BYTES = 32
+# 不区分大小写时展开的大小写组合上限
+MAX_CASE_VARIANTS = 4096
+
+# 单个命中：(私钥文本, 助记词, 派生路径, 地址)；随机密钥模式下助记词与路径为空
+VanityHit = Tuple[str, str, str, str]
+
+
+@dataclass(frozen=True)
+class EvmVanityPattern:
+    """
+    EVM 靓号匹配条件：地址（不含 0x）以 prefix 开头、以 suffix 结尾。
+
+    case_sensitive 为 True 时按 EIP-55 校验格式逐字符比较大小写，否则不区分大小写。
+    """
+
+    chain_type: ClassVar[str] = ChainType.EVM
+
+    prefix: str = ""
+    suffix: str = ""
+    case_sensitive: bool = False
+    _lower_prefix: str = field(init=False, repr=False, compare=False, default="")
+    _lower_suffix: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        prefix = self.prefix.strip()
+        if prefix[:2].lower() == "0x":
+            prefix = prefix[2:]
+        suffix = self.suffix.strip()
+        if not prefix and not suffix:
+            raise ValueError("请至少填写靓号前缀或后缀")
+        if not set(prefix + suffix) <= _HEX_CHARS:
+            raise ValueError("EVM 靓号只能包含十六进制字符 0-9、a-f")
+        if len(prefix) + len(suffix) > _EVM_ADDRESS_HEX_LENGTH:
+            raise ValueError(f"前缀与后缀总长度不能超过 {_EVM_ADDRESS_HEX_LENGTH} 个字符")
+        object.__setattr__(self, "prefix", prefix)
+        object.__setattr__(self, "suffix", suffix)
+        object.__setattr__(self, "_lower_prefix", prefix.lower())
+        object.__setattr__(self, "_lower_suffix", suffix.lower())
+
+    @property
+    def difficulty(self) -> int:
+        """期望尝试次数：每个十六进制字符命中概率 1/16，区分大小写时每个字母再乘 1/2。"""
+        chars = self.prefix + self.suffix
+        letters = sum(c.isalpha() for c in chars) if self.case_sensitive else 0
+        return 16 ** len(chars) * 2**letters
+
+    def match(self, raw: bytes) -> Optional[str]:
+        """判断 20 字节地址是否匹配，匹配时返回 EIP-55 校验地址，否则返回 None。"""
+        hex_addr = raw.hex()
+        if not (hex_addr.startswith(self._lower_prefix) and hex_addr.endswith(self._lower_suffix)):
+            return None
+        address = to_checksum_addresses([raw])[0]
+        if self.case_sensitive:
+            body = address[2:]
+            if not (body.startswith(self.prefix) and body.endswith(self.suffix)):
+                return None
+        return address
+
+
+def _b58_value(digits: str) -> int:
+    value = 0
+    for c in digits:
+        value = value * 58 + _B58_VALUES[c]
+    return value
+
+
+def _case_variants(text: str, case_sensitive: bool) -> List[str]:
+    """列出 text 在 Base58 字母表中可能的大小写写法（区分大小写时只有其本身）。"""
+    if case_sensitive:
+        if not set(text) <= _B58_CHARS:
+            raise ValueError("Solana 地址为 Base58 编码，不包含字符 0、O、I、l")
+        return [text]
+    options = [[v for v in dict.fromkeys((c.lower(), c.upper())) if v in _B58_CHARS] for c in text]
+    if not all(options):
+        raise ValueError("Solana 地址为 Base58 编码，不包含字符 0、O、I、l")
+    if math.prod(len(o) for o in options) > MAX_CASE_VARIANTS:
+        raise ValueError("不区分大小写时字母过多，请缩短或改为区分大小写")
+    return ["".join(chars) for chars in itertools.product(*options)]
+
+
+def _prefix_intervals(prefix: str) -> List[Tuple[int, int]]:
+    """
+    Base58 前缀对应的 32 字节公钥整数取值区间 [lo, hi)。
+
+    地址 = "1" × 前导零字节数 + Base58(整数)；前缀除去开头的 "1" 后剩 m 位、数值为 v，
+    则地址为 L 位数字时整数落在 [v·58^(L-m), (v+1)·58^(L-m)) 内，对每个可能的 L 各得一个区间，
+    再与“恰好 k 个前导零字节”的范围取交集。
+    """
+    ones = len(prefix) - len(prefix.lstrip("1"))
+    rest = prefix[ones:]
+    if ones > _SOLANA_KEY_BYTES:
+        return []
+    upper = 256 ** (_SOLANA_KEY_BYTES - ones)
+    if not rest:
+        # 至少 k 个前导零字节
+        return [(0, upper)]
+    lower = 256 ** (_SOLANA_KEY_BYTES - ones - 1) if ones < _SOLANA_KEY_BYTES else upper
+    value = _b58_value(rest)
+    intervals = []
+    for length in range(len(rest), _SOLANA_ADDRESS_MAX_LENGTH + 1):
+        scale = 58 ** (length - len(rest))
+        lo, hi = max(value * scale, lower), min((value + 1) * scale, upper)
+        if lo < hi:
+            intervals.append((lo, hi))
+    return intervals
+
+
+def _merge_intervals(intervals: List[Tuple[int, int]]) -> Tuple[int, ...]:
+    """合并重叠区间，展开为有序边界 (lo0, hi0, lo1, hi1, …)，便于二分判断。"""
+    bounds: List[int] = []
+    for lo, hi in sorted(intervals):
+        if bounds and lo <= bounds[-1]:
+            bounds[-1] = max(bounds[-1], hi)
+        else:
+            bounds += [lo, hi]
+    return tuple(bounds)
+
+
+@dataclass(frozen=True)
+class SolanaVanityPattern:
+    """
+    Solana 靓号匹配条件：Base58 地址以 prefix 开头、以 suffix 结尾。
+
+    前缀预先换算为公钥整数的有序区间边界，后缀换算为对 58^len(suffix) 的余数集合，
+    候选公钥只需一次二分与一次取模即可筛除；不区分大小写时展开全部大小写组合。
+    """
+
+    chain_type: ClassVar[str] = ChainType.SOLANA
+
+    prefix: str = ""
+    suffix: str = ""
+    case_sensitive: bool = False
+    _bounds: Tuple[int, ...] = field(init=False, repr=False, compare=False, default=())
+    _suffix_modulus: int = field(init=False, repr=False, compare=False, default=1)
+    _suffix_values: FrozenSet[int] = field(init=False, repr=False, compare=False, default=frozenset())
+    _check_prefix: str = field(init=False, repr=False, compare=False, default="")
+    _check_suffix: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self) -> None:
+        prefix, suffix = self.prefix.strip(), self.suffix.strip()
+        if not prefix and not suffix:
+            raise ValueError("请至少填写靓号前缀或后缀")
+        if len(prefix) + len(suffix) > _SOLANA_ADDRESS_MAX_LENGTH:
+            raise ValueError(f"前缀与后缀总长度不能超过 {_SOLANA_ADDRESS_MAX_LENGTH} 个字符")
+        intervals = [
+            interval
+            for variant in _case_variants(prefix, self.case_sensitive)
+            for interval in _prefix_intervals(variant)
+        ]
+        bounds = _merge_intervals(intervals) if prefix else (0, 256**_SOLANA_KEY_BYTES)
+        if not bounds:
+            raise ValueError(f"前缀 {prefix} 不可能出现在 Solana 地址中（32 字节公钥的 Base58 编码）")
+        object.__setattr__(self, "prefix", prefix)
+        object.__setattr__(self, "suffix", suffix)
+        object.__setattr__(self, "_bounds", bounds)
+        object.__setattr__(self, "_suffix_modulus", 58 ** len(suffix))
+        values = frozenset(_b58_value(v) for v in _case_variants(suffix, self.case_sensitive))
+        object.__setattr__(self, "_suffix_values", values)
+        object.__setattr__(self, "_check_prefix", prefix if self.case_sensitive else prefix.lower())
+        object.__setattr__(self, "_check_suffix", suffix if self.case_sensitive else suffix.lower())
+
+    @property
+    def difficulty(self) -> int:
+        """期望尝试次数：由前缀区间的总宽度与后缀余数的个数精确计算（首位字符越大的前缀越难）。"""
+        width = sum(hi - lo for lo, hi in zip(self._bounds[::2], self._bounds[1::2]))
+        return max(round(256**_SOLANA_KEY_BYTES * self._suffix_modulus / (width * len(self._suffix_values))), 1)
+
+    def match(self, public_key: bytes) -> Optional[str]:
+        """判断 32 字节公钥是否匹配，匹配时返回 Base58 地址，否则返回 None。"""
+        value = int.from_bytes(public_key, "big")
+        if not bisect_right(self._bounds, value) & 1:
+            return None
+        if value % self._suffix_modulus not in self._suffix_values:
+            return None
+        # 整数筛选通过后编码复核（也排除公钥过小、后缀与前导 "1" 重叠等极端情况）
+        address = b58encode(public_key)
+        text = address if self.case_sensitive else address.lower()
+        return address if text.startswith(self._check_prefix) and text.endswith(self._check_suffix) else None
+
+
+VanityPattern = Union[EvmVanityPattern, SolanaVanityPattern]
+
+
+def make_vanity_pattern(chain_type: str, prefix: str = "", suffix: str = "", case_sensitive: bool = False) -> VanityPattern:
+    """按链类型构造靓号匹配条件。"""
+    if chain_type == ChainType.SOLANA:
+        return SolanaVanityPattern(prefix, suffix, case_sensitive)
+    if chain_type == ChainType.EVM:
+        return EvmVanityPattern(prefix, suffix, case_sensitive)
+    raise ValueError(f"未支持的链类型: {chain_type}")
+
+
+def expected_seconds(difficulty: int, rate: float, matches: int = 1) -> Optional[float]:
+    """按当前速率找到 matches 个匹配的期望耗时（秒），速率未知时返回 None。"""
+    return matches * difficulty / rate if rate > 0 else None
+
+
+def match_probability(attempts: int, difficulty: int) -> float:
+    """尝试 attempts 次后至少命中一次的概率。"""
+    return -math.expm1(attempts * math.log1p(-1 / difficulty)) if difficulty > 1 else 1.0
+
+
+def attempts_for_probability(probability: float, difficulty: int) -> float:
+    """以 probability 的把握至少命中一次所需的尝试次数（如 0.5 对应中位数，约 0.69 × 难度）。"""
+    if difficulty <= 1:
+        return 1.0
+    return math.log1p(-probability) / math.log1p(-1 / difficulty)
+
+
+@dataclass
+class VanityProgress:
+    """一次对外发布的搜索进度。"""
+
+    attempts: int
+    found: int
+    target: int
+    rate: float  # 每秒尝试次数
+    difficulty: int
+    since_last: int  # 距上一次命中（或开始）以来的尝试次数
+
+    @property
+    def probability(self) -> float:
+        """按距上次命中的尝试次数，下一个匹配本应已出现的概率（越接近 1 说明运气越差）。"""
+        return match_probability(self.since_last, self.difficulty)
+
+    def eta(self, probability: float = 0.5) -> Optional[float]:
+        """从现在起以 probability 的把握找到下一个匹配所需的秒数；已找齐时为 0，速率未知时为 None。"""
+        if self.found >= self.target:
+            return 0.0
+        if self.rate <= 0:
+            return None
+        return attempts_for_probability(probability, self.difficulty) / self.rate
+
+
+def _random_ed25519_seeds(count: int) -> List[bytes]:
+    """随机 ed25519 种子：一次取出整批随机字节再切分，减少系统调用。"""
+    pool = secrets.token_bytes(_SOLANA_KEY_BYTES * count)
+    return [pool[i : i + _SOLANA_KEY_BYTES] for i in range(0, len(pool), _SOLANA_KEY_BYTES)]
+
+
+def _search_evm_batch(
+    pattern: EvmVanityPattern,
+    path_template: str,
+    attempts: int,
+    with_mnemonic: bool,
+) -> Tuple[int, List[VanityHit]]:
+    """
+    EVM：BIP32 派生的候选，或从随机起点连续扫描的私钥，返回 (实际检查数, 命中列表)，私钥为十六进制。
+
+    同一批扫描出的私钥彼此相邻，泄露其中一个即可推出其余，因此扫描模式每批最多取一个命中，
+    命中后即停止，只计入已检查的私钥。
+    """
+    keccak = _load_keccak256()
+    hits: List[VanityHit] = []
+    if with_mnemonic:
+        mnemonics = [_generate_mnemonic(12) for _ in range(attempts)]
+        derived = [
+            _derive_leaf_key(_derive_account_node(_seed_from_mnemonic(m), ChainType.EVM, path_template), 0)
+            for m in mnemonics
+        ]
+        public_keys = get_secp256k1_backend().uncompressed_public_keys([key for key, _ in derived])
+        for i, public_key in enumerate(public_keys):
+            address = pattern.match(keccak(public_key)[-20:])
+            if address is not None:
+                hits.append((derived[i][0].hex(), mnemonics[i].phrase, derived[i][1], address))
+        return attempts, hits
+    start = secrets.randbelow(SECP256K1_N - attempts) + 1
+    for i, public_key in enumerate(scan_public_keys(start, attempts)):
+        address = pattern.match(keccak(public_key)[-20:])
+        if address is not None:
+            return i + 1, [((start + i).to_bytes(32, "big").hex(), "", "", address)]
+    return attempts, hits
+
+
+def _search_solana_batch(
+    pattern: SolanaVanityPattern,
+    path_template: str,
+    attempts: int,
+    with_mnemonic: bool,
+) -> List[VanityHit]:
+    """Solana：随机 ed25519 种子或 SLIP-10 派生的候选，命中结果的私钥为 Base58（种子 + 公钥）。"""
+    if with_mnemonic:
+        mnemonics = [_generate_mnemonic(12) for _ in range(attempts)]
+        path = path_template.format(index=0)
+        seeds = [_slip10_derive_ed25519(_seed_from_mnemonic(m), path) for m in mnemonics]
+    else:
+        seeds = _random_ed25519_seeds(attempts)
+    hits: List[VanityHit] = []
+    for i, (public_key, secret_key) in enumerate(ed25519_keypairs(seeds)):
+        address = pattern.match(public_key)
+        if address is None:
+            continue
+        if with_mnemonic:
+            hits.append((b58encode(secret_key), mnemonics[i].phrase, path, address))
+        else:
+            hits.append((b58encode(secret_key), "", "", address))
+    return hits
+
+
+def _search_batch(
+    pattern: VanityPattern,
+    path_template: str,
+    attempts: int,
+    with_mnemonic: bool,
+) -> Tuple[int, List[VanityHit]]:
+    """
+    尝试一批候选密钥，返回 (尝试次数, 命中列表)，供工作进程调用（需为模块级函数以便序列化）。
+
+    with_mnemonic 为 True 时每个候选都是新的 BIP39 助记词在 path_template 第 0 个地址上派生的密钥，
+    命中结果可用助记词恢复；代价是每次尝试多一次 PBKDF2，速度远低于随机密钥。
+    """
+    if isinstance(pattern, SolanaVanityPattern):
+        return attempts, _search_solana_batch(pattern, path_template, attempts, with_mnemonic)
+    return _search_evm_batch(pattern, path_template, attempts, with_mnemonic)
+
+
+def _iter_results_inline(
+    task: Tuple[VanityPattern, str, int, bool],
+    control: Optional[GenerationControl],
+) -> Iterator[Tuple[int, List[VanityHit]]]:
+    """单进程逐批搜索。"""
+    while control is None or control.checkpoint():
+        yield _search_batch(*task)
+
+
+def _iter_results_pooled(
+    task: Tuple[VanityPattern, str, int, bool],
+    workers: int,
+    control: Optional[GenerationControl],
+    pool: Optional[WorkerPool],
+) -> Iterator[Tuple[int, List[VanityHit]]]:
+    """多进程搜索：保持每个进程约两个在途批次，按完成先后产出（搜索结果与顺序无关）。"""
+    executor = pool.resize(workers) if pool is not None else new_process_pool(workers)
+    pending: Set[Future] = {executor.submit(_search_batch, *task) for _ in range(workers * 2)}
+    try:
+        while pending:
+            if control is not None and not control.checkpoint():
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.add(executor.submit(_search_batch, *task))
+                yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if pool is None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_vanity_wallets(
+    network: NetworkConfig,
+    pattern: VanityPattern,
+    count: int = 1,
+    workers: int = DEFAULT_WORKER_COUNT,
+    with_mnemonic: bool = False,
+    progress_cb: Optional[Callable[[VanityProgress], None]] = None,
+    control: Optional[GenerationControl] = None,
+    pool: Optional[WorkerPool] = None,
+    progress_interval: float = PROGRESS_INTERVAL_SECONDS,
+) -> Iterator[WalletRecord]:
+    """
+    搜索地址匹配 pattern 的钱包，每找到一个即产出一条记录，找齐 count 个或被取消时结束。
+
+    :param network: 选中的网络配置，链类型须与 pattern 一致（见 make_vanity_pattern）
+    :param pattern: 匹配条件
+    :param count: 需要的匹配数量
+    :param workers: 工作进程数，1 为单进程搜索，0 表示使用全部 CPU 核心
+    :param with_mnemonic: 是否由 BIP39 助记词派生候选（结果附带助记词与派生路径，速度较慢）
+    :param progress_cb: 进度回调，按 progress_interval 节流，结束时再发布一次
+    :param control: 可选的取消/暂停控制
+    :param pool: 可选的预热进程池（见 WorkerPool）
+    :param progress_interval: 进度回调的最小间隔（秒）
+    """
+    validate_wallet_count(count, MAX_VANITY_MATCHES)
+    if network.chain_type != pattern.chain_type:
+        raise ValueError("靓号条件的链类型与所选网络不一致")
+    path_template = _resolve_path_template(network)
+    if with_mnemonic:
+        batch_size = VANITY_MNEMONIC_BATCH_SIZE
+    elif isinstance(pattern, EvmVanityPattern):
+        # 连续扫描每批最多取一个命中，批量不超过期望尝试次数，简单条件才不会浪费整批
+        batch_size = min(VANITY_KEY_BATCH_SIZE, pattern.difficulty)
+    else:
+        batch_size = VANITY_KEY_BATCH_SIZE
+    task = (pattern, path_template, batch_size, with_mnemonic)
+    workers = resolve_worker_count(workers)
+    if workers <= 1:
+        results = _iter_results_inline(task, control)
+    else:
+        results = _iter_results_pooled(task, workers, control, pool)
+
+    difficulty = pattern.difficulty
+    started = time.monotonic()
+    last_emit = float("-inf")
+    last_reported = (-1, -1)
+    attempts = 0
+    last_hit = 0
+    found = 0
+
+    def _report(force: bool = False) -> None:
+        nonlocal last_emit, last_reported
+        now = time.monotonic()
+        if progress_cb is None or (attempts, found) == last_reported:
+            return
+        if not force and now - last_emit < progress_interval:
+            return
+        last_emit, last_reported = now, (attempts, found)
+        elapsed = now - started
+        progress_cb(
+            VanityProgress(
+                attempts=attempts,
+                found=found,
+                target=count,
+                rate=attempts / elapsed if elapsed > 0 else 0.0,
+                difficulty=difficulty,
+                since_last=attempts - last_hit,
+            )
+        )
+
+    try:
+        for batch_attempts, hits in results:
+            hits = hits[: count - found]
+            attempts += batch_attempts
+            if hits:
+                found += len(hits)
+                last_hit = attempts
+            _report(force=bool(hits))
+            for offset, (private_key, mnemonic, path, address) in enumerate(hits, start=found - len(hits) + 1):
+                yield WalletRecord(
+                    index=offset,
+                    chain_type=network.chain_type,
+                    network=network.name,
+                    address=address,
+                    mnemonic=mnemonic,
+                    derivation_path=path,
+                    private_key=private_key,
+                )
+            if found >= count:
+                break
+    finally:
+        results.close()
+        _report(force=True)
@@ -1,33 +1,101 @@
-"""钱包生成与校验服务，支持 EVM 与 Solana 双链。"""
+"""
+钱包生成与校验服务，支持 EVM 与 Solana 双链。
+
+各链的密码学后端（eth-keys / coincurve、PyNaCl、mnemonic）均在首次使用时才导入，
+导入本模块本身只依赖标准库，界面启动与单链任务不必为另一条链的依赖付出加载时间。
+"""
 
 import hashlib
 import hmac
-from typing import Callable, List, Optional, Tuple
-
-from base58 import b58encode
-from eth_account import Account
-from eth_keys import constants as eth_constants
-from eth_keys import keys as eth_keys
-from mnemonic import Mnemonic
-from nacl.signing import SigningKey
+import os
+import secrets
+import threading
+import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
+from address_encoding import b58encode_batch, encode_evm_addresses, keccak256
 from config import (
     ChainType,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_WORKER_COUNT,
     DERIVATION_PATH_TEMPLATE_EVM,
     DERIVATION_PATH_TEMPLATE_SOL,
     MAX_WALLET_COUNT,
+    GenerationMode,
     NetworkConfig,
 )
+from instrumentation import GenerationStats, stage
 from models import WalletRecord
 
-# 启用 HD 钱包支持（eth-account 默认关闭，需要显式允许）
-Account.enable_unaudited_hdwallet_features()
+# secp256k1 曲线阶
+SECP256K1_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
+# BIP39 助记词长度与熵位数的对应关系
+MNEMONIC_STRENGTHS = {12: 128, 15: 160, 18: 192, 21: 224, 24: 256}
+
+# BIP39 种子派生参数（PBKDF2-HMAC-SHA512）
+BIP39_PBKDF2_ROUNDS = 2048
+
+
+@dataclass(frozen=True)
+class GeneratedMnemonic:
+    """进程内新生成的助记词，携带原始熵，可跳过校验直接派生种子。"""
+
+    phrase: str
+    entropy: bytes
+
+    def __str__(self) -> str:
+        return self.phrase
+
+
+@dataclass(frozen=True)
+class AccountNode:
+    """账户级扩展密钥节点（如 m/44'/60'/0'/0），缓存后每个地址只需再派生叶子一步。"""
+
+    chain_type: str
+    parent_path: str
+    leaf_hardened: bool
+    key: bytes
+    chain_code: bytes
+    # EVM 非硬化叶子派生需要父节点压缩公钥，预先算好避免每个地址重复标量乘法
+    public_key: Optional[bytes] = None
+
+
+class GenerationControl:
+    """生成任务的协作式控制（取消、暂停/继续），可跨线程调用；检查点位于块与块之间。"""
 
-# 使用标准 BIP39 英文词表的生成器
-MNEMONIC_GEN = Mnemonic("english")
+    def __init__(self) -> None:
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
 
-# 曲线阶常量
-SECP256K1_N = eth_constants.SECPK1_N
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self) -> None:
+        """请求取消；同时解除暂停，使等待中的生成循环尽快退出。"""
+        self._cancelled.set()
+        self._running.set()
+
+    def pause(self) -> None:
+        self._running.clear()
+
+    def resume(self) -> None:
+        self._running.set()
+
+    def checkpoint(self) -> bool:
+        """暂停时阻塞等待继续；返回 False 表示已取消，应停止生成。"""
+        self._running.wait()
+        return not self._cancelled.is_set()
 
 
 def validate_wallet_count(count: int, max_count: int) -> None:
@@ -45,28 +113,163 @@ def validate_rpc_url(url: str) -> bool:
     return url.startswith("http://") or url.startswith("https://")
 
 
-def _generate_mnemonic(num_words: int = 12) -> str:
-    """使用标准 BIP39 词表生成助记词。"""
-    mapping = {12: 128, 15: 160, 18: 192, 21: 224, 24: 256}
-    if num_words not in mapping:
+@lru_cache(maxsize=1)
+def _mnemonic_generator():
+    """标准 BIP39 英文词表的生成器（首次使用时加载）。"""
+    from mnemonic import Mnemonic
+
+    return Mnemonic("english")
+
+
+def __getattr__(name: str):
+    """兼容旧代码直接访问 MNEMONIC_GEN 的写法，按需加载。"""
+    if name == "MNEMONIC_GEN":
+        return _mnemonic_generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _entropy_to_word_indices(entropy: bytes) -> List[int]:
+    """按 BIP39 规则将熵与 SHA-256 校验位拼接，切分为 11 位词索引。"""
+    checksum_bits = len(entropy) * 8 // 32
+    checksum = hashlib.sha256(entropy).digest()[0] >> (8 - checksum_bits)
+    value = (int.from_bytes(entropy, "big") << checksum_bits) | checksum
+    word_count = (len(entropy) * 8 + checksum_bits) // 11
+    return [(value >> (11 * (word_count - 1 - i))) & 0x7FF for i in range(word_count)]
+
+
+def _generate_mnemonic(num_words: int = 12) -> GeneratedMnemonic:
+    """使用标准 BIP39 词表生成助记词，同时保留其熵。"""
+    if num_words not in MNEMONIC_STRENGTHS:
         raise ValueError("助记词长度仅支持 12/15/18/21/24")
-    strength = mapping[num_words]
-    return MNEMONIC_GEN.generate(strength=strength)
+    entropy = secrets.token_bytes(MNEMONIC_STRENGTHS[num_words] // 8)
+    wordlist = _mnemonic_generator().wordlist
+    phrase = " ".join(wordlist[i] for i in _entropy_to_word_indices(entropy))
+    return GeneratedMnemonic(phrase=phrase, entropy=entropy)
 
 
 def _mnemonic_to_seed(mnemonic: str, passphrase: str = "") -> bytes:
-    """通过 BIP39 标准将助记词转换为种子。"""
-    if not MNEMONIC_GEN.check(mnemonic):
+    """通过 BIP39 标准将用户提供的助记词转换为种子（完整校验）。"""
+    generator = _mnemonic_generator()
+    if not generator.check(mnemonic):
         raise ValueError("助记词校验未通过，请重试生成")
-    return MNEMONIC_GEN.to_seed(mnemonic, passphrase)
+    return generator.to_seed(mnemonic, passphrase)
+
+
+def _generated_mnemonic_to_seed(mnemonic: GeneratedMnemonic, passphrase: str = "") -> bytes:
+    """进程内生成的助记词已由熵直接构造，跳过分词、查表与校验和，直接执行 PBKDF2。"""
+    salt = ("mnemonic" + unicodedata.normalize("NFKD", passphrase)).encode("utf-8")
+    return hashlib.pbkdf2_hmac("sha512", mnemonic.phrase.encode("utf-8"), salt, BIP39_PBKDF2_ROUNDS)
+
+
+def _seed_from_mnemonic(mnemonic: Union[str, GeneratedMnemonic], passphrase: str = "") -> bytes:
+    """根据助记词来源选择种子派生路径：内部生成走快速路径，外部输入完整校验。"""
+    if isinstance(mnemonic, GeneratedMnemonic):
+        return _generated_mnemonic_to_seed(mnemonic, passphrase)
+    return _mnemonic_to_seed(mnemonic, passphrase)
+
+
+class Secp256k1Backend:
+    """secp256k1 运算后端抽象：提供单个压缩公钥与批量非压缩公钥计算。"""
+
+    name = "eth-keys"
+
+    def __init__(self) -> None:
+        from eth_keys import keys
+
+        self._private_key = keys.PrivateKey
+
+    def compressed_public_key(self, private_key: bytes) -> bytes:
+        """返回 33 字节压缩公钥。"""
+        return self._private_key(private_key).public_key.to_compressed_bytes()
+
+    def uncompressed_public_keys(self, private_keys: Sequence[bytes]) -> List[bytes]:
+        """批量返回 64 字节非压缩公钥（不含 0x04 前缀），每个私钥只做一次标量乘法。"""
+        return [self._private_key(key).public_key.to_bytes() for key in private_keys]
+
+
+class CoincurveBackend(Secp256k1Backend):
+    """基于 libsecp256k1（coincurve）的原生后端，速度远高于纯 Python 实现。"""
+
+    name = "coincurve"
+
+    def __init__(self) -> None:
+        from coincurve import PublicKey
+
+        self._public_key = PublicKey
+
+    def compressed_public_key(self, private_key: bytes) -> bytes:
+        return self._public_key.from_valid_secret(private_key).format(compressed=True)
+
+    def uncompressed_public_keys(self, private_keys: Sequence[bytes]) -> List[bytes]:
+        from_secret = self._public_key.from_valid_secret
+        return [from_secret(key).format(compressed=False)[1:] for key in private_keys]
+
+
+# 可选后端注册表，按优先级排列；检测失败（未安装依赖）时自动跳过
+SECP256K1_BACKENDS: Dict[str, Callable[[], Secp256k1Backend]] = {
+    CoincurveBackend.name: CoincurveBackend,
+    Secp256k1Backend.name: Secp256k1Backend,
+}
+
+_secp256k1_backend: Optional[Secp256k1Backend] = None
+
+
+def set_secp256k1_backend(backend: Union[str, Secp256k1Backend, None]) -> Secp256k1Backend:
+    """
+    指定 secp256k1 后端。
+
+    :param backend: 后端名称（见 SECP256K1_BACKENDS）、后端实例，或 None 表示重新自动检测
+    """
+    global _secp256k1_backend
+    if isinstance(backend, Secp256k1Backend):
+        _secp256k1_backend = backend
+    elif backend is None:
+        _secp256k1_backend = None
+        return get_secp256k1_backend()
+    elif backend in SECP256K1_BACKENDS:
+        _secp256k1_backend = SECP256K1_BACKENDS[backend]()
+    else:
+        raise ValueError(f"未知的 secp256k1 后端: {backend}")
+    return _secp256k1_backend
+
+
+def get_secp256k1_backend() -> Secp256k1Backend:
+    """返回当前 secp256k1 后端，首次调用时按优先级检测可用的原生实现。"""
+    global _secp256k1_backend
+    if _secp256k1_backend is None:
+        for factory in SECP256K1_BACKENDS.values():
+            try:
+                _secp256k1_backend = factory()
+                break
+            except ImportError:
+                continue
+    return _secp256k1_backend  # type: ignore[return-value]
+
+
+def _selected_backend_name() -> Optional[str]:
+    """当前显式选定（或已检测到）的后端名称，供工作进程沿用；尚未确定或为自定义实例时返回 None。"""
+    if _secp256k1_backend is None or _secp256k1_backend.name not in SECP256K1_BACKENDS:
+        return None
+    return _secp256k1_backend.name
+
 
+def private_keys_to_addresses(private_keys: Sequence[bytes]) -> List[str]:
+    """批量将 secp256k1 私钥转换为 EIP-55 校验格式的 EVM 地址。"""
+    return encode_evm_addresses(get_secp256k1_backend().uncompressed_public_keys(private_keys))
 
-def _derive_child(private_key: bytes, chain_code: bytes, index: int, hardened: bool) -> Tuple[bytes, bytes]:
-    """执行单步 BIP32 子密钥派生（secp256k1）。"""
+
+def _derive_child(
+    private_key: bytes,
+    chain_code: bytes,
+    index: int,
+    hardened: bool,
+    public_key: Optional[bytes] = None,
+) -> Tuple[bytes, bytes]:
+    """执行单步 BIP32 子密钥派生（secp256k1），可传入已知的父节点压缩公钥。"""
     if hardened:
         data = b"\x00" + private_key + index.to_bytes(4, "big")
     else:
-        pub_compressed = eth_keys.PrivateKey(private_key).public_key.to_compressed_bytes()
+        pub_compressed = public_key or get_secp256k1_backend().compressed_public_key(private_key)
         data = pub_compressed + index.to_bytes(4, "big")
     I = hmac.new(chain_code, data, hashlib.sha512).digest()
     Il, Ir = I[:32], I[32:]
@@ -75,95 +278,267 @@ def _derive_child(private_key: bytes, chain_code: bytes, index: int, hardened: b
     return child_key, Ir
 
 
+@lru_cache(maxsize=1024)
+def _parse_path(path: str) -> Tuple[Tuple[int, bool], ...]:
+    """解析派生路径为 (索引, 是否硬化) 序列，索引已包含硬化位；结果缓存避免重复切分。"""
+    segments = []
+    for seg in path.split("/")[1:]:  # 跳过 m
+        if not seg:
+            continue
+        hardened = seg.endswith("'")
+        index = int(seg.rstrip("'"))
+        if hardened:
+            index |= 0x80000000
+        segments.append((index, hardened))
+    return tuple(segments)
+
+
+@lru_cache(maxsize=64)
+def _split_path_template(path_template: str) -> Tuple[str, bool]:
+    """将路径模板拆分为固定父路径与 {index} 叶子段，返回 (父路径, 叶子是否硬化)。"""
+    parent, _, leaf = path_template.rpartition("/")
+    if leaf not in ("{index}", "{index}'") or "{" in parent:
+        raise ValueError(f"派生路径模板的最后一段必须为 {{index}}：{path_template}")
+    return parent, leaf.endswith("'")
+
+
 def _derive_private_key_from_path(seed: bytes, path: str) -> bytes:
     """从种子和路径计算最终 secp256k1 私钥。"""
     I = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
     priv, chain = I[:32], I[32:]
-    segments = path.split("/")[1:]  # 跳过 m
-    for seg in segments:
-        hardened = seg.endswith("'")
-        index = int(seg.rstrip("'"))
-        if hardened:
-            index += 0x80000000
+    for index, hardened in _parse_path(path):
         priv, chain = _derive_child(priv, chain, index, hardened)
     return priv
 
 
-def _derive_evm_account(mnemonic: str, path: str) -> Tuple[str, str]:
+def _derive_account_node(seed: bytes, chain_type: str, path_template: str) -> AccountNode:
+    """由种子派生到路径模板的父节点（不含 {index} 叶子段）。"""
+    parent_path, leaf_hardened = _split_path_template(path_template)
+    if chain_type == ChainType.EVM:
+        I = hmac.new(b"Bitcoin seed", seed, hashlib.sha512).digest()
+        key, chain_code = I[:32], I[32:]
+        for index, hardened in _parse_path(parent_path):
+            key, chain_code = _derive_child(key, chain_code, index, hardened)
+        public_key = None
+        if not leaf_hardened:
+            public_key = get_secp256k1_backend().compressed_public_key(key)
+        return AccountNode(chain_type, parent_path, leaf_hardened, key, chain_code, public_key)
+    if chain_type == ChainType.SOLANA:
+        key, chain_code = _slip10_master_key(seed)
+        for index, _ in _parse_path(parent_path):
+            key, chain_code = _slip10_child(key, chain_code, index)
+        return AccountNode(chain_type, parent_path, True, key, chain_code)
+    raise ValueError(f"未支持的链类型: {chain_type}")
+
+
+def _derive_leaf_key(node: AccountNode, index: int) -> Tuple[bytes, str]:
+    """从账户节点派生第 index 个叶子私钥，返回 (私钥/ed25519 种子, 完整路径)。"""
+    if node.leaf_hardened:
+        path = f"{node.parent_path}/{index}'"
+        child_index = index | 0x80000000
+    else:
+        path = f"{node.parent_path}/{index}"
+        child_index = index
+    if node.chain_type == ChainType.SOLANA:
+        key, _ = _slip10_child(node.key, node.chain_code, child_index)
+    else:
+        key, _ = _derive_child(node.key, node.chain_code, child_index, node.leaf_hardened, node.public_key)
+    return key, path
+
+
+def _evm_account_from_private_key(priv_key_bytes: bytes) -> Tuple[str, str]:
+    """由 secp256k1 私钥生成 EVM 地址与十六进制私钥。"""
+    return private_keys_to_addresses([priv_key_bytes])[0], priv_key_bytes.hex()
+
+
+def _derive_evm_account(mnemonic: Union[str, GeneratedMnemonic], path: str) -> Tuple[str, str]:
     """从助记词和派生路径生成 EVM 地址与私钥。"""
-    seed = _mnemonic_to_seed(mnemonic, "")
+    seed = _seed_from_mnemonic(mnemonic, "")
     priv_key_bytes = _derive_private_key_from_path(seed, path)
-    acct = Account.from_key(priv_key_bytes)
-    address = acct.address
-    private_key = acct.key.hex()
-    return address, private_key
+    return _evm_account_from_private_key(priv_key_bytes)
+
+
+def _slip10_master_key(seed: bytes) -> Tuple[bytes, bytes]:
+    """SLIP-0010 ed25519 主密钥与链码。"""
+    I = hmac.new(b"ed25519 seed", seed, hashlib.sha512).digest()
+    return I[:32], I[32:]
+
+
+def _slip10_child(key: bytes, chain_code: bytes, index: int) -> Tuple[bytes, bytes]:
+    """SLIP-0010 ed25519 单步硬化派生（ed25519 仅支持硬化）。"""
+    data = b"\x00" + key + (index | 0x80000000).to_bytes(4, "big")
+    I = hmac.new(chain_code, data, hashlib.sha512).digest()
+    return I[:32], I[32:]
 
 
 def _slip10_derive_ed25519(seed: bytes, path: str) -> bytes:
     """依据 SLIP-0010 派生 ed25519 私钥种子，默认将未加 ' 的段也按硬化处理。"""
-    # 主密钥
-    I = hmac.new(b"ed25519 seed", seed, hashlib.sha512).digest()
-    key, chain_code = I[:32], I[32:]
-    segments = path.split("/")[1:]  # 跳过 m
-    for seg in segments:
-        if not seg:
-            continue
-        hardened = seg.endswith("'")
-        index = int(seg.rstrip("'"))
-        # ed25519 仅支持硬化，为兼容未加 ' 的模板也按硬化处理
-        if not hardened:
-            hardened = True
-        if hardened:
-            index |= 0x80000000
-        data = b"\x00" + key + index.to_bytes(4, "big")
-        I = hmac.new(chain_code, data, hashlib.sha512).digest()
-        key, chain_code = I[:32], I[32:]
+    key, chain_code = _slip10_master_key(seed)
+    # ed25519 仅支持硬化，为兼容未加 ' 的模板也按硬化处理
+    for index, _ in _parse_path(path):
+        key, chain_code = _slip10_child(key, chain_code, index)
     return key
 
 
-def _derive_solana_account(mnemonic: str, index: int, path_template: str) -> Tuple[str, str, str]:
+def solana_accounts_from_seeds(private_seeds: Sequence[bytes]) -> List[Tuple[str, str]]:
+    """
+    批量由 ed25519 私钥种子生成 Solana 地址与 Base58 私钥（64 字节，种子 + 公钥）。
+
+    直接调用 libsodium 求密钥对，不构造 SigningKey 对象；Base58 编码整批完成。
+    """
+    return solana_accounts_from_keypairs(ed25519_keypairs(private_seeds))
+
+
+def ed25519_keypairs(private_seeds: Sequence[bytes]) -> List[Tuple[bytes, bytes]]:
+    """批量由 ed25519 种子求 (32 字节公钥, 64 字节私钥)；libsodium 绑定在首次用到 Solana 时才加载。"""
+    from nacl.bindings import crypto_sign_seed_keypair
+
+    return [crypto_sign_seed_keypair(seed) for seed in private_seeds]
+
+
+def solana_accounts_from_keypairs(keypairs: Sequence[Tuple[bytes, bytes]]) -> List[Tuple[str, str]]:
+    """将 (公钥, 64 字节私钥) 密钥对整批编码为 Solana 地址与 Base58 私钥。"""
+    addresses = b58encode_batch(public_key for public_key, _ in keypairs)
+    secret_keys = b58encode_batch(secret_key for _, secret_key in keypairs)
+    return list(zip(addresses, secret_keys))
+
+
+def _solana_account_from_seed(private_seed: bytes) -> Tuple[str, str]:
+    """由 ed25519 私钥种子生成 Solana 地址与 Base58 私钥（64 字节）。"""
+    return solana_accounts_from_seeds([private_seed])[0]
+
+
+def _derive_solana_account(
+    mnemonic: Union[str, GeneratedMnemonic], index: int, path_template: str
+) -> Tuple[str, str, str]:
     """从助记词生成 Solana 地址与 Base58 私钥（64 字节）。"""
-    seed = _mnemonic_to_seed(mnemonic, "")
+    seed = _seed_from_mnemonic(mnemonic, "")
     path = path_template.format(index=index)
     private_seed = _slip10_derive_ed25519(seed, path)
-    signing_key = SigningKey(private_seed)
-    verify_key = signing_key.verify_key
-    secret_key_bytes = signing_key.encode() + verify_key.encode()
-    address = b58encode(bytes(verify_key)).decode("utf-8")
-    secret_key = b58encode(secret_key_bytes).decode("utf-8")
+    address, secret_key = _solana_account_from_seed(private_seed)
     return address, secret_key, path
 
 
-def generate_wallets(
-    count: int,
-    network: NetworkConfig,
-    progress_cb: Optional[Callable[[int], None]] = None,
-) -> List[WalletRecord]:
+def warm_up_backends() -> None:
+    """预先导入并初始化各链的密码学后端，消除首次生成时的加载延迟（也用作进程池的初始化函数）。"""
+    warmers: List[Callable[[], object]] = [
+        _mnemonic_generator,
+        get_secp256k1_backend,
+        lambda: keccak256(b""),
+        lambda: ed25519_keypairs([bytes(32)]),
+    ]
+    for warm in warmers:
+        try:
+            warm()
+        except ImportError:
+            # 缺少某条链的可选依赖时跳过，留到实际用到该链时再报错
+            pass
+
+
+def _init_worker(backend: Optional[str]) -> None:
     """
-    批量生成钱包记录（每个钱包独立助记词）。
+    进程池初始化函数：沿用父进程选定的 secp256k1 后端，再预热各链后端。
 
-    :param count: 生成数量
-    :param network: 选中的网络配置
-    :param progress_cb: 进度回调，接受当前完成数量
+    spawn 启动（Windows / macOS，含打包后的程序）的工作进程不继承父进程的全局状态，需显式传入。
+    """
+    if backend is not None:
+        set_secp256k1_backend(backend)
+    warm_up_backends()
+
+
+def new_process_pool(workers: int) -> ProcessPoolExecutor:
+    """创建工作进程沿用当前 secp256k1 后端并已预热的进程池。"""
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(_selected_backend_name(),))
+
+
+def _pool_ready() -> None:
+    """空任务：提交给新进程池以立即拉起工作进程并完成预热。"""
+
+
+class WorkerPool:
+    """
+    可复用的预热进程池：应用启动时创建一次，各批生成共用，工作进程已导入好各链后端。
+
+    进程数或选定的 secp256k1 后端变化时按需重建；线程安全，可在界面线程创建、在生成线程中使用。
     """
-    validate_wallet_count(count, max_count=MAX_WALLET_COUNT)
-    wallets: List[WalletRecord] = []
-
-    for i in range(count):
-        mnemonic = _generate_mnemonic(12)
-        if network.chain_type == ChainType.EVM:
-            path_template = network.derivation_path_template or DERIVATION_PATH_TEMPLATE_EVM
-            path = path_template.format(index=i)
-            address, private_key = _derive_evm_account(mnemonic, path)
-        elif network.chain_type == ChainType.SOLANA:
-            path_template = network.derivation_path_template or DERIVATION_PATH_TEMPLATE_SOL
-            address, private_key, path = _derive_solana_account(mnemonic, i, path_template)
-        else:  # pragma: no cover - 理论不会触发
-            raise ValueError(f"未支持的链类型: {network.chain_type}")
-
-        wallets.append(
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._backend: Optional[str] = None
+        self.size = 0
+
+    def resize(self, workers: int) -> ProcessPoolExecutor:
+        """确保进程池大小为 workers（0 表示全部 CPU 核心），返回可用的执行器。"""
+        workers = resolve_worker_count(workers)
+        backend = _selected_backend_name()
+        with self._lock:
+            old = self._executor
+            # 工作进程异常退出后执行器不可再用（_broken 置位），需要重建
+            reusable = old is not None and not getattr(old, "_broken", False)
+            if reusable and self.size == workers and self._backend == backend:
+                return old
+            self._executor = new_process_pool(workers)
+            self.size = workers
+            self._backend = backend
+            for _ in range(workers):
+                self._executor.submit(_pool_ready)
+        if old is not None:
+            old.shutdown(wait=False, cancel_futures=True)
+        return self._executor
+
+    def shutdown(self) -> None:
+        """关闭进程池，丢弃排队任务。"""
+        with self._lock:
+            executor, self._executor, self.size = self._executor, None, 0
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def resolve_worker_count(workers: Optional[int]) -> int:
+    """解析工作进程数：None 或 0 表示使用全部 CPU 核心。"""
+    if not workers:
+        return os.cpu_count() or 1
+    if workers < 0:
+        raise ValueError("工作进程数不能为负数")
+    return workers
+
+
+def _resolve_path_template(network: NetworkConfig) -> str:
+    """返回网络使用的派生路径模板，未配置时按链类型取默认值。"""
+    if network.chain_type == ChainType.SOLANA:
+        return network.derivation_path_template or DERIVATION_PATH_TEMPLATE_SOL
+    return network.derivation_path_template or DERIVATION_PATH_TEMPLATE_EVM
+
+
+def _build_wallets(
+    start: int,
+    network: NetworkConfig,
+    mnemonics: Sequence[str],
+    nodes: Sequence[AccountNode],
+    stats: Optional[GenerationStats] = None,
+) -> List[WalletRecord]:
+    """由账户节点批量派生序号从 start（从 0 开始）起的叶子，并组装钱包记录。"""
+    size = len(nodes)
+    with stage(stats, "derive", size):
+        derived = [_derive_leaf_key(node, start + offset) for offset, node in enumerate(nodes)]
+    keys = [key for key, _ in derived]
+    if network.chain_type == ChainType.SOLANA:
+        with stage(stats, "pubkey", size):
+            keypairs = ed25519_keypairs(keys)
+        with stage(stats, "encode", size):
+            accounts = solana_accounts_from_keypairs(keypairs)
+    else:
+        # EVM 私钥批量走 secp256k1 后端，每个私钥只做一次标量乘法
+        with stage(stats, "pubkey", size):
+            public_keys = get_secp256k1_backend().uncompressed_public_keys(keys)
+        with stage(stats, "encode", size):
+            accounts = list(zip(encode_evm_addresses(public_keys), (key.hex() for key in keys)))
+
+    with stage(stats, "assemble", size):
+        return [
             WalletRecord(
-                index=i + 1,
+                index=start + offset + 1,
                 chain_type=network.chain_type,
                 network=network.name,
                 address=address,
@@ -171,8 +546,271 @@ def generate_wallets(
                 derivation_path=path,
                 private_key=private_key,
             )
+            for offset, (mnemonic, (_, path), (address, private_key)) in enumerate(zip(mnemonics, derived, accounts))
+        ]
+
+
+def _generate_chunk(
+    network: NetworkConfig,
+    start: int,
+    size: int,
+    shared: Optional[Tuple[str, AccountNode]] = None,
+    stats: Optional[GenerationStats] = None,
+) -> List[WalletRecord]:
+    """
+    生成 [start, start + size) 区间的钱包，供工作进程调用（需为模块级函数以便序列化）。
+
+    shared 为空时每个钱包使用新的独立助记词，否则复用共享助记词的账户节点。
+    """
+    if shared is not None:
+        return _build_wallets(start, network, [shared[0]] * size, [shared[1]] * size, stats)
+    path_template = _resolve_path_template(network)
+    with stage(stats, "mnemonic", size):
+        generated = [_generate_mnemonic(12) for _ in range(size)]
+    with stage(stats, "seed", size):
+        seeds = [_seed_from_mnemonic(mnemonic, "") for mnemonic in generated]
+    # 账户节点与叶子合并计入“派生”阶段，数量只在叶子处计一次
+    with stage(stats, "derive"):
+        nodes = [_derive_account_node(seed, network.chain_type, path_template) for seed in seeds]
+    return _build_wallets(start, network, [mnemonic.phrase for mnemonic in generated], nodes, stats)
+
+
+def _generate_chunk_timed(
+    network: NetworkConfig,
+    start: int,
+    size: int,
+    shared: Optional[Tuple[str, AccountNode]] = None,
+) -> Tuple[List[WalletRecord], GenerationStats]:
+    """工作进程中带分阶段计时地生成一块，连同本块统计一起返回。"""
+    stats = GenerationStats()
+    return _generate_chunk(network, start, size, shared, stats), stats
+
+
+def prepare_shared_account(network: NetworkConfig, mnemonic: Optional[str] = None) -> Tuple[str, AccountNode]:
+    """
+    共享助记词模式的准备步骤：生成或校验助记词，并一次性派生账户级节点。
+
+    :param network: 选中的网络配置
+    :param mnemonic: 用户提供的助记词；为空时自动生成新的助记词
+    :return: (助记词, 账户节点)
+    """
+    if mnemonic:
+        phrase = " ".join(mnemonic.split())
+        seed = _seed_from_mnemonic(phrase, "")
+    else:
+        generated = _generate_mnemonic(12)
+        phrase = generated.phrase
+        seed = _seed_from_mnemonic(generated, "")
+    return phrase, _derive_account_node(seed, network.chain_type, _resolve_path_template(network))
+
+
+def iter_wallet_batches(
+    count: int,
+    network: NetworkConfig,
+    progress_cb: Optional[Callable[[int], None]] = None,
+    workers: int = DEFAULT_WORKER_COUNT,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = GenerationMode.INDEPENDENT,
+    mnemonic: Optional[str] = None,
+    control: Optional[GenerationControl] = None,
+    max_count: int = MAX_WALLET_COUNT,
+    stats: Optional[GenerationStats] = None,
+    pool: Optional[WorkerPool] = None,
+) -> Iterator[List[WalletRecord]]:
+    """
+    流式批量生成钱包，按顺序逐块产出，每块最多 chunk_size 条记录。
+
+    调用方可边生成边消费，内存占用只与在途块数相关，与总数量无关。
+    传入 control 时，每块之前检查暂停/取消；取消后停止产出，已产出的块不受影响。
+
+    :param count: 生成数量
+    :param network: 选中的网络配置
+    :param progress_cb: 进度回调，接受当前完成数量
+    :param workers: 工作进程数，1 为单进程顺序生成，0 表示使用全部 CPU 核心
+    :param chunk_size: 每块的钱包数量，同时也是批量派生与并行任务的粒度，进度按块回报
+    :param mode: 生成模式，见 GenerationMode
+    :param mnemonic: 共享助记词模式下用户提供的助记词（完整校验），为空时自动生成
+    :param control: 可选的取消/暂停控制
+    :param max_count: 数量上限；调用方边生成边落盘、不保留全部结果时可放宽（见 MAX_BULK_WALLET_COUNT）
+    :param stats: 可选的分阶段计时统计，就地填充，生成结束（含取消）时记录总耗时与峰值内存
+    :param pool: 可选的预热进程池；多进程模式下复用它（按 workers 调整大小）而不是临时创建进程池
+    """
+    validate_wallet_count(count, max_count=max_count)
+    if chunk_size <= 0:
+        raise ValueError("任务块大小必须为正整数")
+    if mode == GenerationMode.SHARED_MNEMONIC:
+        shared: Optional[Tuple[str, AccountNode]] = prepare_shared_account(network, mnemonic)
+    elif mode == GenerationMode.INDEPENDENT:
+        shared = None
+    else:
+        raise ValueError(f"未支持的生成模式: {mode}")
+    workers = resolve_worker_count(workers)
+
+    # 只有一块时无需并行；共享进程池保持 workers 大小，不因本次任务小而缩小重建
+    if min(workers, -(-count // chunk_size)) <= 1:
+        batches = _iter_batches_inline(count, network, progress_cb, chunk_size, shared, control, stats)
+    else:
+        batches = _iter_batches_pooled(
+            count, network, progress_cb, workers, chunk_size, shared, control, stats, pool
         )
+    try:
+        for batch in batches:
+            if stats is not None:
+                stats.wallets += len(batch)
+            yield batch
+    finally:
+        # 调用方提前停止时立即关闭内层生成器，使进程池及时回收
+        batches.close()
+        if stats is not None:
+            stats.finish()
+
+
+def _iter_batches_inline(
+    count: int,
+    network: NetworkConfig,
+    progress_cb: Optional[Callable[[int], None]],
+    chunk_size: int,
+    shared: Optional[Tuple[str, AccountNode]],
+    control: Optional[GenerationControl],
+    stats: Optional[GenerationStats],
+) -> Iterator[List[WalletRecord]]:
+    """单进程顺序生成。"""
+    done = 0
+    for start in range(0, count, chunk_size):
+        if control is not None and not control.checkpoint():
+            return
+        batch = _generate_chunk(network, start, min(chunk_size, count - start), shared, stats)
+        done += len(batch)
         if progress_cb:
-            progress_cb(i + 1)
+            progress_cb(done)
+        yield batch
+
 
-    return wallets
+def _iter_batches_pooled(
+    count: int,
+    network: NetworkConfig,
+    progress_cb: Optional[Callable[[int], None]],
+    workers: int,
+    chunk_size: int,
+    shared: Optional[Tuple[str, AccountNode]],
+    control: Optional[GenerationControl],
+    stats: Optional[GenerationStats],
+    pool: Optional[WorkerPool] = None,
+) -> Iterator[List[WalletRecord]]:
+    """多进程生成：仅保持有限数量的在途任务块，按提交顺序产出，保证输出顺序与序号不变。"""
+    done = 0
+    starts = iter(range(0, count, chunk_size))
+    if pool is not None:
+        executor = pool.resize(workers)
+    else:
+        executor = new_process_pool(min(workers, -(-count // chunk_size)))
+    pending: Deque = deque()
+
+    def _submit_next() -> None:
+        start = next(starts, None)
+        if start is not None:
+            size = min(chunk_size, count - start)
+            if stats is None:
+                pending.append(executor.submit(_generate_chunk, network, start, size, shared))
+            else:
+                pending.append(executor.submit(_generate_chunk_timed, network, start, size, shared))
+
+    try:
+        for _ in range(workers * 2):
+            _submit_next()
+        while pending:
+            if control is not None and not control.checkpoint():
+                break
+            with stage(stats, "wait"):
+                result = pending.popleft().result()
+            if stats is None:
+                batch = result
+            else:
+                batch, chunk_stats = result
+                stats.merge(chunk_stats)
+            _submit_next()
+            done += len(batch)
+            if progress_cb:
+                progress_cb(done)
+            yield batch
+    finally:
+        if pool is not None:
+            # 共享进程池继续保留；只撤销本次尚未开始的任务，在途块完成后直接丢弃
+            for future in pending:
+                future.cancel()
+        else:
+            # 正常结束时等待进程退出；取消、调用方提前停止或出错时丢弃排队任务且不等待在途块
+            executor.shutdown(wait=not pending, cancel_futures=True)
+
+
+def iter_wallets(
+    count: int,
+    network: NetworkConfig,
+    progress_cb: Optional[Callable[[int], None]] = None,
+    workers: int = DEFAULT_WORKER_COUNT,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = GenerationMode.INDEPENDENT,
+    mnemonic: Optional[str] = None,
+    control: Optional[GenerationControl] = None,
+    max_count: int = MAX_WALLET_COUNT,
+    stats: Optional[GenerationStats] = None,
+    pool: Optional[WorkerPool] = None,
+) -> Iterator[WalletRecord]:
+    """逐条产出钱包记录，参数同 iter_wallet_batches。"""
+    batches = iter_wallet_batches(
+        count,
+        network,
+        progress_cb,
+        workers=workers,
+        chunk_size=chunk_size,
+        mode=mode,
+        mnemonic=mnemonic,
+        control=control,
+        max_count=max_count,
+        stats=stats,
+        pool=pool,
+    )
+    for batch in batches:
+        yield from batch
+
+
+def generate_wallets(
+    count: int,
+    network: NetworkConfig,
+    progress_cb: Optional[Callable[[int], None]] = None,
+    workers: int = DEFAULT_WORKER_COUNT,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    mode: str = GenerationMode.INDEPENDENT,
+    mnemonic: Optional[str] = None,
+    control: Optional[GenerationControl] = None,
+    stats: Optional[GenerationStats] = None,
+    pool: Optional[WorkerPool] = None,
+) -> List[WalletRecord]:
+    """
+    批量生成钱包记录（默认每个钱包独立助记词），一次性返回完整列表。
+
+    :param count: 生成数量
+    :param network: 选中的网络配置
+    :param progress_cb: 进度回调，接受当前完成数量
+    :param workers: 工作进程数，1 为单进程顺序生成，0 表示使用全部 CPU 核心
+    :param chunk_size: 每块的钱包数量，同时也是批量派生与并行任务的粒度，进度按块回报
+    :param mode: 生成模式，见 GenerationMode
+    :param mnemonic: 共享助记词模式下用户提供的助记词（完整校验），为空时自动生成
+    :param control: 可选的取消/暂停控制，取消时返回已生成的部分结果
+    :param stats: 可选的分阶段计时统计（见 GenerationStats），随结果一并就地填充
+    :param pool: 可选的预热进程池（见 WorkerPool）
+    """
+    return list(
+        iter_wallets(
+            count,
+            network,
+            progress_cb,
+            workers=workers,
+            chunk_size=chunk_size,
+            mode=mode,
+            mnemonic=mnemonic,
+            control=control,
+            stats=stats,
+            pool=pool,
+        )
+    )
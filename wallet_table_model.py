@@ -0,0 +1,104 @@
+"""钱包表格数据模型：基于 Model/View 按需生成单元格，行数再多也不预先创建条目对象。"""
+
+from typing import Any, List, Optional, Union
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QFontMetrics
+
+from binary_store import BinaryWalletReader
+from models import WalletRecord, WalletStore, display_chain_type
+
+# 私钥隐藏时的占位文本
+MASKED_VALUE = "**************"
+
+# 估算列宽时采样的行数（取首尾各一半），避免对全部行做 resizeColumnsToContents
+COLUMN_WIDTH_SAMPLE_ROWS = 64
+
+
+class WalletTableModel(QAbstractTableModel):
+    """钱包列表的表格模型，数据源为列式 WalletStore 或 .srw 文件的只读视图，单元格文本在 data() 中按需解码。"""
+
+    HEADERS = ["序号", "链类型", "网络", "地址", "助记词", "派生路径", "私钥/密钥"]
+    FIELDS = ["index", "chain_type", "network", "address", "mnemonic", "derivation_path", "private_key"]
+    PRIVATE_KEY_COLUMN = 6
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._wallets: Union[WalletStore, BinaryWalletReader] = WalletStore()
+        self.show_private_keys = False
+
+    # ------------------------- Qt 接口 ------------------------- #
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._wallets)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.cell_text(index.row(), index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:  # noqa: N802
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    # ------------------------- 数据操作 ------------------------- #
+    def cell_text(self, row: int, column: int) -> Optional[str]:
+        """返回指定单元格的显示文本（只解码该字段）。"""
+        if column == self.PRIVATE_KEY_COLUMN and not self.show_private_keys:
+            return MASKED_VALUE
+        value = self._wallets.field(row, self.FIELDS[column])
+        if column == 1:
+            return display_chain_type(value)  # type: ignore[arg-type]
+        return str(value)
+
+    def set_wallets(self, wallets: Union[WalletStore, BinaryWalletReader]) -> None:
+        """整体替换数据源（不复制）。"""
+        self.beginResetModel()
+        self._wallets = wallets
+        self.endResetModel()
+
+    def append_wallets(self, wallets: List[WalletRecord]) -> None:
+        """在末尾追加一批记录（就地写入数据源），只通知新增行。"""
+        if not wallets:
+            return
+        first = len(self._wallets)
+        self.beginInsertRows(QModelIndex(), first, first + len(wallets) - 1)
+        self._wallets.extend(wallets)
+        self.endInsertRows()
+
+    def clear(self) -> None:
+        """清空数据。"""
+        self.set_wallets(WalletStore())
+
+    def wallet_at(self, row: int) -> Optional[WalletRecord]:
+        """返回指定行的钱包记录，越界时返回 None。"""
+        if 0 <= row < len(self._wallets):
+            return self._wallets[row]
+        return None
+
+    def set_show_private_keys(self, show: bool) -> None:
+        """切换私钥列显示状态，仅通知该列刷新。"""
+        self.show_private_keys = show
+        if self._wallets:
+            top = self.index(0, self.PRIVATE_KEY_COLUMN)
+            bottom = self.index(len(self._wallets) - 1, self.PRIVATE_KEY_COLUMN)
+            self.dataChanged.emit(top, bottom, [Qt.DisplayRole])
+
+    def sample_column_widths(self, metrics: QFontMetrics, padding: int = 24) -> List[int]:
+        """按首尾采样行估算各列宽度，代替全量扫描的 resizeColumnsToContents。"""
+        total = len(self._wallets)
+        half = COLUMN_WIDTH_SAMPLE_ROWS // 2
+        rows = list(range(min(total, half))) + list(range(max(half, total - half), total))
+        widths = []
+        for column, header in enumerate(self.HEADERS):
+            texts = [header] + [self.cell_text(row, column) or "" for row in rows]
+            widths.append(max(metrics.horizontalAdvance(text) for text in texts) + padding)
+        return widths